@@ -0,0 +1,57 @@
+"""Time applying a ten-section config over a slow link.
+
+Every read takes ``READ_LATENCY`` seconds, like a cellular uplink. Before
+the prefetch phase, sections were read one after another; now up to
+``max_concurrency`` reads are in flight at once.
+"""
+
+import json
+import re
+import time
+
+import responses
+
+from ponika import PonikaClient
+from ponika.config import ConfigApplier
+from tests.mocks import BASE_URL, LOGIN_RESPONSE
+
+READ_LATENCY = 0.1
+
+CONFIG = {
+    'auto_reboot': {'scheduler': [], 'ping_wget': []},
+    'dhcp': {'static_leases_ipv4': [], 'static_leases_ipv6': []},
+    'ip_routes': {'routes_ipv4': [], 'routes_ipv6': []},
+    'recipients': {'phone_groups': [], 'email_users': []},
+    'sms_utilities': {'rules': []},
+    'wireless': {'interfaces': []},
+}
+
+
+def read(request):
+    time.sleep(READ_LATENCY)
+    return 200, {}, json.dumps({'success': True, 'data': []})
+
+
+def run(max_concurrency: int) -> float:
+    with responses.RequestsMock() as mock:
+        mock.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+        mock.add_callback(
+            responses.GET, re.compile(f'{re.escape(BASE_URL)}/.*'), read
+        )
+        client = PonikaClient('test-device', 'admin', 'admin')
+        client._get_auth_token()
+        applier = ConfigApplier(client, max_concurrency=max_concurrency)
+
+        started = time.perf_counter()
+        applier.apply(CONFIG)
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f'{"max_concurrency":>16} {"seconds":>8}')
+    for max_concurrency in (1, 4, 10):
+        print(f'{max_concurrency:>16} {run(max_concurrency):>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""Count TCP connections, each a TLS handshake on a real device.
+
+A local HTTP/1.1 server stands in for the devices and counts the connections
+it accepts. Callers fire their requests in rounds, all at once, like a poller
+on a schedule. In the first table they share one client: without keep-alive
+every request connects anew, and with a pool smaller than the number of
+callers the surplus connections are discarded after every round. The second
+table spreads the requests over many clients, with and without a shared pool
+capping the sockets open at once.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ponika import PonikaClient
+from ponika.pool import SharedPool
+from tests.mocks import LOGIN_RESPONSE
+
+CALLERS = 32
+ROUNDS = 20
+DEVICES = 50
+LATENCY = 0.002
+
+RESPONSE = json.dumps(
+    {'success': True, 'data': [{'id': 'wg0', 'enabled': '1'}]}
+).encode()
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.open = 0
+        self.peak = 0
+
+    def connect(self) -> None:
+        with self.lock:
+            self.opened += 1
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+
+    def disconnect(self) -> None:
+        with self.lock:
+            self.open -= 1
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    counter: Counter
+
+    def setup(self) -> None:
+        super().setup()
+        self.counter.connect()
+
+    def finish(self) -> None:
+        super().finish()
+        self.counter.disconnect()
+
+    def do_GET(self) -> None:
+        time.sleep(LATENCY)
+        self._reply(RESPONSE)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply(json.dumps(LOGIN_RESPONSE).encode())
+
+    def _reply(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops bursts of new connections.
+    request_queue_size = 256
+
+
+def measure(
+    make_clients: Callable[[int], list[PonikaClient]],
+) -> tuple[int, int, float]:
+    counter = Counter()
+    handler = type('CountingHandler', (Handler,), {'counter': counter})
+    server = Server(('0.0.0.0', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    clients = make_clients(server.server_address[1])
+    for client in clients:
+        client._get_auth_token()
+
+    rounds = threading.Barrier(CALLERS)
+
+    def call(index: int) -> None:
+        for offset in range(ROUNDS):
+            rounds.wait()
+            client = clients[(index + offset) % len(clients)]
+            client.wireguard.config.get_config()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(CALLERS) as executor:
+        list(executor.map(call, range(CALLERS)))
+    elapsed = time.perf_counter() - started
+
+    for client in clients:
+        client.close()
+    server.shutdown()
+    server.server_close()
+    return counter.opened, counter.peak, elapsed
+
+
+def client(port: int, device: int = 1, **options: Any) -> PonikaClient:
+    # Every loopback address is a separate device to the connection pools.
+    host = f'127.0.0.{device}'
+    # Coalescing would merge the identical GETs of a round into one request.
+    return PonikaClient(
+        host, 'admin', 'admin', port, False, coalesce_gets=False, **options
+    )
+
+
+def main() -> None:
+    # Discarded connections are logged by urllib3 as warnings.
+    logging.getLogger('urllib3').setLevel(logging.ERROR)
+    requests = CALLERS * ROUNDS
+
+    print(f'{CALLERS} callers sharing one client, {requests} requests')
+    print(f'{"setup":>24} {"handshakes":>11} {"peak":>5} {"seconds":>8}')
+    for name, options in (
+        ('no keep-alive', {'keep_alive': False}),
+        ('default pool (10)', {}),
+        (f'pool_maxsize={CALLERS}', {'pool_maxsize': CALLERS}),
+    ):
+        opened, peak, elapsed = measure(lambda port: [client(port, **options)])
+        print(f'{name:>24} {opened:>11} {peak:>5} {elapsed:>8.3f}')
+
+    print(f'\n{CALLERS} callers spread over {DEVICES} clients')
+    print(f'{"setup":>24} {"handshakes":>11} {"peak":>5} {"seconds":>8}')
+    for name, make_pool in (
+        ('client pools', lambda: None),
+        ('SharedPool(16)', lambda: SharedPool(max_connections=16)),
+        (f'SharedPool({DEVICES})', lambda: SharedPool(DEVICES)),
+    ):
+        pool = make_pool()
+        opened, peak, elapsed = measure(
+            lambda port: [
+                client(port, device, pool=pool)
+                for device in range(1, DEVICES + 1)
+            ]
+        )
+        print(f'{name:>24} {opened:>11} {peak:>5} {elapsed:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Time status calls parsing all fields against a few requested ones.
+
+Calls go through the endpoints with the network replaced by a canned body,
+as in ``parse_modes``. With ``fields`` only the requested keys are turned
+into Python objects; nested lists such as cell info are skipped while the
+JSON is parsed.
+"""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.parse_modes import client_returning
+from tests.test_interfaces import INTERFACE_STATUS_RESPONSE
+from tests.test_modems import REAL_ONLINE_STATUS
+
+MODEM_FIELDS = ('rssi', 'rsrp', 'sinr', 'operator', 'state')
+INTERFACE_FIELDS = ('id', 'is_up', 'rx_bytes', 'tx_bytes')
+
+
+def measure(call: Callable[[], Any], number: int) -> float:
+    seconds = min(timeit.repeat(call, number=number, repeat=5))
+    return seconds / number * 1e6
+
+
+def main() -> None:
+    modems = client_returning([REAL_ONLINE_STATUS] * 4).modems.status
+    interfaces = client_returning(
+        INTERFACE_STATUS_RESPONSE['data'] * 50
+    ).interfaces
+
+    print(f'{"case":>14} {"fields":>8} {"us/call":>9}')
+    for name, get_status, fields in (
+        ('4 modems', modems.get_status, MODEM_FIELDS),
+        ('50 interfaces', interfaces.get_status, INTERFACE_FIELDS),
+    ):
+        for label, kwargs in (('all', {}), ('some', {'fields': fields})):
+            micros = measure(lambda: get_status(**kwargs), 500)
+            print(f'{name:>14} {label:>8} {micros:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
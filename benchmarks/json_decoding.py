@@ -0,0 +1,67 @@
+"""Time decoding plus validation of response bodies.
+
+``json`` is how responses were handled before: ``response.json()`` built a
+Python dict that was then validated. ``orjson`` decodes the dict faster, and
+``validate_json`` hands the raw bytes to pydantic, as the client does now.
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from ponika.endpoints.ip_routes.ipv4 import Ipv4RouteStatusResponse
+from ponika.models import response_adapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ROUTE = {
+    'dev': 'br-lan',
+    'type': 'unicast',
+    'family': 'inet',
+    'table': 'main',
+    'src': '192.168.1.1',
+    'proto': 'kernel',
+    'scope': 'link',
+    'dest': '192.168.1.0/24',
+    'gateway': '0.0.0.0',
+}
+
+ADAPTER = response_adapter(list[Ipv4RouteStatusResponse])
+
+
+def stdlib(body: bytes) -> None:
+    ADAPTER.validate_python(json.loads(body))
+
+
+def with_orjson(body: bytes) -> None:
+    ADAPTER.validate_python(orjson.loads(body))
+
+
+def validate_json(body: bytes) -> None:
+    ADAPTER.validate_json(body)
+
+
+def measure(parse: Callable[[bytes], Any], body: bytes, number: int) -> float:
+    seconds = min(timeit.repeat(lambda: parse(body), number=number, repeat=5))
+    return seconds / number * 1e6
+
+
+def main() -> None:
+    modes = [('json', stdlib), ('validate_json', validate_json)]
+    if orjson is not None:
+        modes.insert(1, ('orjson', with_orjson))
+
+    print(f'{"case":>12} {"mode":>14} {"us/call":>9}')
+    for rows in (1, 100, 1000):
+        body = json.dumps({'success': True, 'data': [ROUTE] * rows}).encode()
+        for name, parse in modes:
+            micros = measure(parse, body, max(10, 10000 // rows))
+            print(f'{f"{rows} routes":>12} {name:>14} {micros:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
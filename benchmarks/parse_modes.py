@@ -0,0 +1,67 @@
+"""Time turning response bodies into results in each parse mode.
+
+Calls go through the endpoints with the network replaced by a canned body,
+so the rows cover decoding and parsing only. ``validate`` checks every
+field and ``raw`` returns the decoded JSON.
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from requests import Response
+
+from ponika import PonikaClient
+from ponika.parsing import ParseMode
+from tests.test_modems import REAL_ONLINE_STATUS
+
+LEASE = {
+    'expires': 3600,
+    'macaddr': '00:11:22:33:44:55',
+    'ipaddr': '192.168.1.10',
+    'hostname': 'laptop',
+    'interface': 'lan',
+}
+
+
+def client_returning(data: Any) -> PonikaClient:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps({'success': True, 'data': data}).encode()
+    client = PonikaClient('192.168.1.1', 'admin', 'admin')
+    client._send = lambda *args, **kwargs: response
+    return client
+
+
+def measure(call: Callable[[], Any], number: int) -> float:
+    seconds = min(timeit.repeat(call, number=number, repeat=5))
+    return seconds / number * 1e6
+
+
+def main() -> None:
+    cases = []
+    for rows in (1, 100, 1000):
+        client = client_returning([LEASE] * rows)
+        cases.append(
+            (
+                f'{rows} leases',
+                client.dhcp.server_ipv4.get_dynamic_leases,
+                max(10, 10000 // rows),
+            )
+        )
+    for rows in (1, 4):
+        client = client_returning([REAL_ONLINE_STATUS] * rows)
+        cases.append(
+            (f'{rows} modems', client.modems.status.get_status, 2000 // rows)
+        )
+
+    print(f'{"case":>12} {"mode":>10} {"us/call":>9}')
+    for name, get, number in cases:
+        for mode in ParseMode:
+            micros = measure(lambda: get(parse_mode=mode), number)
+            print(f'{name:>12} {mode.value:>10} {micros:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
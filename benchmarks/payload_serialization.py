@@ -0,0 +1,102 @@
+"""Time serializing bulk payloads to the RutOS wire format.
+
+``two-pass`` is how ``BasePayload.asdict`` used to work: ``model_dump`` in
+Python mode followed by a recursive walk mapping booleans to ``'1'``/``'0'``
+and enums to their values. ``asdict`` and ``model_dump_json`` now get the
+wire format from pydantic's serializer directly.
+"""
+
+import timeit
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from ponika.endpoints.dhcp.static_leases_ipv4 import (
+    StaticLeaseIpv4CreatePayload,
+)
+from ponika.endpoints.wireguard.peers import WireguardPeerUpdateItemPayload
+from ponika.models import BasePayload
+
+
+def two_pass(payload: BasePayload) -> dict[str, Any]:
+    def convert(value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, list):
+            return [convert(v) for v in value]
+        if isinstance(value, bool):
+            return '1' if value is True else '0'
+        if isinstance(value, dict):
+            return {k: convert(v) for k, v in value.items()}
+
+        return value
+
+    return convert(payload.model_dump(exclude_none=True, by_alias=True))
+
+
+def asdict(payload: BasePayload) -> dict[str, Any]:
+    return payload.asdict()
+
+
+def dump_json(payload: BasePayload) -> str:
+    return payload.model_dump_json(exclude_none=True, by_alias=True)
+
+
+def peers(count: int) -> list[BasePayload]:
+    return [
+        WireguardPeerUpdateItemPayload(
+            id=f'peer{i}',
+            public_key='x' * 44,
+            allowed_ips=[f'10.0.{i // 256}.{i % 256}/32', '10.1.0.0/16'],
+            description=f'Peer {i}',
+            route_allowed_ips=True,
+            endpoint_host='vpn.example.com',
+            endpoint_port='51820',
+            persistent_keepalive='25',
+            force_tunlink=False,
+        )
+        for i in range(count)
+    ]
+
+
+def leases(count: int) -> list[BasePayload]:
+    return [
+        StaticLeaseIpv4CreatePayload(
+            name=f'host{i}',
+            mac=f'00:11:22:33:{i // 256:02x}:{i % 256:02x}',
+            ip=f'192.168.{i // 256}.{i % 256}',
+        )
+        for i in range(count)
+    ]
+
+
+def measure(
+    serialize: Callable[[BasePayload], Any], payloads: list[BasePayload]
+) -> float:
+    seconds = min(
+        timeit.repeat(
+            lambda: [serialize(payload) for payload in payloads],
+            number=5,
+            repeat=5,
+        )
+    )
+    return seconds / 5 * 1e3
+
+
+def main() -> None:
+    print(f'{"case":>14} {"mode":>15} {"ms":>8}')
+    for name, payloads in (
+        ('1000 peers', peers(1000)),
+        ('1000 leases', leases(1000)),
+    ):
+        for mode, serialize in (
+            ('two-pass', two_pass),
+            ('asdict', asdict),
+            ('model_dump_json', dump_json),
+        ):
+            millis = measure(serialize, payloads)
+            print(f'{name:>14} {mode:>15} {millis:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
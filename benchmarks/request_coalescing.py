@@ -0,0 +1,77 @@
+"""Count modem status requests of concurrent callers sharing one client.
+
+Callers ask for ``/modems/status`` at the same moment, like the widgets of a
+dashboard. With ``coalesce_gets`` they share one request and its parsed
+result; without it every caller sends its own to a device serving them one
+after another.
+"""
+
+import json
+import threading
+import time
+
+import responses
+
+from ponika import PonikaClient
+from tests.mocks import BASE_URL, LOGIN_RESPONSE
+from tests.test_modems import REAL_ONLINE_STATUS
+
+STATUS_LATENCY = 0.02
+ROUNDS = 5
+
+
+def run(coalesce_gets: bool, callers: int) -> tuple[int, float]:
+    requests = 0
+    # A router handles one status request at a time.
+    device = threading.Lock()
+
+    def status(request):
+        nonlocal requests
+        with device:
+            requests += 1
+            time.sleep(STATUS_LATENCY)
+        body = {'success': True, 'data': [REAL_ONLINE_STATUS]}
+        return (200, {}, json.dumps(body))
+
+    with responses.RequestsMock() as mock:
+        mock.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+        mock.add_callback(
+            responses.GET, f'{BASE_URL}/modems/status', callback=status
+        )
+
+        client = PonikaClient(
+            host='test-device',
+            username='admin',
+            password='admin',
+            coalesce_gets=coalesce_gets,
+        )
+        client._get_auth_token()
+        barrier = threading.Barrier(callers)
+
+        def call():
+            for _ in range(ROUNDS):
+                barrier.wait()
+                client.modems.status.get_status()
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    return requests, elapsed
+
+
+def main() -> None:
+    print(f'{ROUNDS} rounds')
+    print(f'{"callers":>8} {"mode":>10} {"requests":>9} {"seconds":>8}')
+    for callers in (1, 8, 32):
+        for name, coalesce_gets in (('separate', False), ('coalesced', True)):
+            requests, elapsed = run(coalesce_gets, callers)
+            print(f'{callers:>8} {name:>10} {requests:>9} {elapsed:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Time response validation with and without the cached adapters.
+
+``ApiResponse[Model].model_validate`` parametrizes the generic on every call,
+which is how endpoints validated responses before ``response_adapter``. The
+modem status rows compare building a ``TypeAdapter`` per call, as
+``parse_modem_status`` used to, with the shared ``type_adapter``.
+"""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from ponika.endpoints.ip_routes.ipv4 import Ipv4RouteStatusResponse
+from ponika.endpoints.modems.status import ModemStatus
+from ponika.models import ApiResponse, response_adapter, type_adapter
+
+ROUTE = {
+    'dev': 'br-lan',
+    'type': 'unicast',
+    'family': 'inet',
+    'table': 'main',
+    'src': '192.168.1.1',
+    'proto': 'kernel',
+    'scope': 'link',
+    'dest': '192.168.1.0/24',
+    'gateway': '0.0.0.0',
+}
+
+
+def payload(rows: int) -> dict[str, Any]:
+    return {'success': True, 'data': [ROUTE] * rows}
+
+
+def per_call(data: dict[str, Any]) -> None:
+    ApiResponse[list[Ipv4RouteStatusResponse]].model_validate(data)
+
+
+def cached(data: dict[str, Any]) -> None:
+    response_adapter(list[Ipv4RouteStatusResponse]).validate_python(data)
+
+
+def modem_per_call(data: Any) -> None:
+    TypeAdapter(ModemStatus).validate_python(data)
+
+
+def modem_cached(data: Any) -> None:
+    type_adapter(ModemStatus).validate_python(data)
+
+
+def measure(validate: Callable[[Any], None], data: Any, number: int) -> float:
+    seconds = min(
+        timeit.repeat(lambda: validate(data), number=number, repeat=5)
+    )
+    return seconds / number * 1e6
+
+
+def main() -> None:
+    print(f'{"case":>12} {"mode":>9} {"us/call":>9}')
+    for rows in (1, 10, 100):
+        data = payload(rows)
+        for name, validate in (('per-call', per_call), ('cached', cached)):
+            micros = measure(validate, data, 2000)
+            print(f'{f"{rows} routes":>12} {name:>9} {micros:>9.1f}')
+
+    modem = {'id': '1-1', 'name': 'Internal modem', 'offline': '1'}
+    for name, validate in (
+        ('per-call', modem_per_call),
+        ('cached', modem_cached),
+    ):
+        micros = measure(validate, modem, 200)
+        print(f'{"modem":>12} {name:>9} {micros:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
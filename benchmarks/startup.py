@@ -0,0 +1,100 @@
+"""Measure import time and per-client memory of lazily built endpoints.
+
+The eager rows reproduce the previous behaviour, where importing ponika
+imported every endpoint module and each client built all endpoint objects.
+"""
+
+import subprocess
+import sys
+import tracemalloc
+
+from ponika import PonikaClient
+
+CLIENTS = 1000
+
+ENDPOINTS = (
+    'unauthorized',
+    'session',
+    'sms_utilities',
+    'messages',
+    'gps',
+    'backup',
+    'auto_reboot',
+    'diagnostics',
+    'dhcp',
+    'tailscale',
+    'wireguard',
+    'wireless',
+    'zerotier',
+    'internet_connection',
+    'interfaces',
+    'ip_routes',
+    'ip_neighbors',
+    'modems',
+    'firmware',
+    'users',
+    'data_usage',
+    'recipients',
+    'openvpn',
+    'system',
+    'config',
+)
+
+
+def touch_all(client: PonikaClient) -> PonikaClient:
+    """Build every endpoint, including nested ones, like the old client."""
+    for name in ENDPOINTS:
+        endpoint = getattr(client, name)
+        for attribute in dir(type(endpoint)):
+            if not attribute.startswith('_'):
+                getattr(endpoint, attribute)
+    return client
+
+
+def import_seconds(statement: str) -> float:
+    code = (
+        'import time\n'
+        'started = time.perf_counter()\n'
+        f'{statement}\n'
+        'print(time.perf_counter() - started)\n'
+    )
+    timings = [
+        float(subprocess.check_output([sys.executable, '-c', code], text=True))
+        for _ in range(5)
+    ]
+    return min(timings)
+
+
+def bytes_per_client(eager: bool) -> float:
+    tracemalloc.start()
+    clients = [
+        PonikaClient(host='test-device', username='admin', password='admin')
+        for _ in range(CLIENTS)
+    ]
+    if eager:
+        for client in clients:
+            touch_all(client)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(clients)
+
+
+def main() -> None:
+    lazy = import_seconds('import ponika')
+    eager = import_seconds(
+        'import ponika, benchmarks.startup as b\n'
+        "b.touch_all(ponika.PonikaClient('h', 'u', 'p'))"
+    )
+    print(f'{"mode":>6} {"import ms":>10} {"bytes/client":>13}')
+    # Warm the imports so memory rows only count per-client objects.
+    touch_all(PonikaClient(host='test-device', username='a', password='a'))
+    for name, seconds, eager_build in (
+        ('lazy', lazy, False),
+        ('eager', eager, True),
+    ):
+        memory = bytes_per_client(eager_build)
+        print(f'{name:>6} {seconds * 1000:>10.1f} {memory:>13.0f}')
+
+
+if __name__ == '__main__':
+    main()
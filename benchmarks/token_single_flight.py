@@ -0,0 +1,70 @@
+"""Count logins caused by concurrent callers sharing one client.
+
+Compares the single-flight token refresh with an unsynchronised refresh, which
+is how the client behaved before the refresh was guarded by a lock.
+"""
+
+import json
+import threading
+import time
+from contextlib import nullcontext
+
+import responses
+
+from ponika import PonikaClient
+from tests.mocks import BASE_URL, LOGIN_RESPONSE
+
+LOGIN_LATENCY = 0.05
+
+
+class UnsynchronisedClient(PonikaClient):
+    def _create_lock(self):
+        return nullcontext()
+
+
+def run(client_class: type[PonikaClient], callers: int) -> tuple[int, float]:
+    logins = 0
+
+    def login(request):
+        nonlocal logins
+        logins += 1
+        time.sleep(LOGIN_LATENCY)
+        return (200, {}, json.dumps(LOGIN_RESPONSE))
+
+    with responses.RequestsMock() as mock:
+        mock.add_callback(responses.POST, f'{BASE_URL}/login', callback=login)
+        mock.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+        client = client_class(
+            host='test-device', username='admin', password='admin'
+        )
+        barrier = threading.Barrier(callers)
+
+        def call():
+            barrier.wait()
+            client._get('/test')
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    return logins, elapsed
+
+
+def main() -> None:
+    print(f'{"callers":>8} {"mode":>15} {"logins":>7} {"seconds":>8}')
+    for callers in (1, 8, 32, 128):
+        for name, client_class in (
+            ('unsynchronised', UnsynchronisedClient),
+            ('single-flight', PonikaClient),
+        ):
+            logins, elapsed = run(client_class, callers)
+            print(f'{callers:>8} {name:>15} {logins:>7} {elapsed:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Time diffing two polls of DHCP leases by keyed index against list scans.
+
+Hand-rolled polling loops typically look up every item of the new poll in
+the old list, which is quadratic in the number of leases. ``ponika.watch``
+indexes both polls by key and compares them in linear time.
+"""
+
+import timeit
+from typing import Any
+
+from ponika.endpoints.dhcp.servers_ipv4 import DynamicLease
+from ponika.watch import diff, index
+
+
+def leases(count: int, renamed: int) -> list[DynamicLease]:
+    return [
+        DynamicLease(
+            expires=3600,
+            macaddr=f'02:00:00:00:{i // 256:02x}:{i % 256:02x}',
+            ipaddr=f'10.0.{i // 256}.{i % 256}',
+            hostname='renamed' if i == renamed else f'host-{i}',
+            interface='lan',
+        )
+        for i in range(count)
+    ]
+
+
+def scan(before: list[Any], after: list[Any]) -> tuple[list, list, list]:
+    added = [n for n in after if all(o.macaddr != n.macaddr for o in before)]
+    removed = [o for o in before if all(n.macaddr != o.macaddr for n in after)]
+    changed = [
+        n for n in after for o in before if o.macaddr == n.macaddr and o != n
+    ]
+    return added, removed, changed
+
+
+def main() -> None:
+    print(f'{"leases":>7} {"scan ms":>9} {"indexed ms":>11}')
+    for count in (50, 500, 2000):
+        before, after = leases(count, -1), leases(count, count // 2)
+        number = max(1, 2000 // count)
+        scanned = min(
+            timeit.repeat(lambda: scan(before, after), number=number, repeat=3)
+        )
+        indexed = min(
+            timeit.repeat(
+                lambda: diff(index(before), index(after)),
+                number=number,
+                repeat=3,
+            )
+        )
+        print(
+            f'{count:>7} {scanned / number * 1e3:>9.2f} '
+            f'{indexed / number * 1e3:>11.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,43 +1,130 @@
-from contextlib import ExitStack
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, nullcontext
+from copy import copy
+import contextvars
+from functools import cached_property, reduce
+import inspect
+from hashlib import blake2b
+import json
 import os
+import sys
+import threading
+import requests
 import urllib3
 
-from typing import Type, Optional, Dict, Any
+from typing import TYPE_CHECKING, Type, Optional, Dict, Any, TypeVar
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from logging import Logger, getLogger
-from ponika.endpoints.auto_reboot import AutoRebootEndpoint
-from ponika.endpoints.backup import BackupEndpoint
-from ponika.endpoints.data_usage import DataUsageEndpoint
-from ponika.endpoints.diagnostics import DiagnosticsEndpoint
-from ponika.endpoints.firmware import FirmwareEndpoint
-from ponika.endpoints.users import UsersEndpoint
-from ponika.exceptions import TeltonikaApiException, TeltonikaLoginException
+from ponika import timeouts
+from ponika.exceptions import (
+    TeltonikaApiException,
+    TeltonikaDeadlineExceeded,
+    TeltonikaLoginException,
+)
+from ponika.lazy import lazy_imports
+from ponika.middleware import (
+    ApiRequest,
+    AuthMiddleware,
+    Handler,
+    Middleware,
+    RetryMiddleware,
+    StatsMiddleware,
+    TimingMiddleware,
+)
+from ponika.coalescing import SingleFlight
+from ponika.parsing import ParseMode
+from ponika.stats import StatsCollector
 from pydantic import ValidationError, validate_call
-from time import time
-
-from ponika.endpoints.dhcp import DHCPEndpoint
-from ponika.endpoints.gps import GpsEndpoint
-from ponika.endpoints.internet_connection import InternetConnectionEndpoint
-from ponika.endpoints.interfaces import InterfacesEndpoint
-from ponika.endpoints.ip_neighbors import IpNeighborsEndpoint
-from ponika.endpoints.ip_routes import IPRouteEndpoint
-from ponika.endpoints.messages import MessagesEndpoint
-from ponika.endpoints.modems import ModemsEndpoint
-from ponika.endpoints.openvpn import OpenvpnEndpoint
-from ponika.endpoints.recipients import RecipientsEndpoint
-from ponika.endpoints.session import SessionEndpoint
-from ponika.endpoints.sms_utilities import SmsUtilitiesEndpoint
-from ponika.endpoints.system import SystemEndpoint
-from ponika.endpoints.tailscale import TailscaleEndpoint
-from ponika.endpoints.unauthorized import UnauthorizedEndpoint
-from ponika.endpoints.wireguard import WireguardEndpoint
-from ponika.endpoints.wireless import WirelessEndpoint
-from ponika.endpoints.zerotier import ZerotierEndpoint
-from ponika.config import ConfigApplier
-from ponika.models import T, ApiResponse, BasePayload, Token, BaseModel
+from time import sleep, time
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    from json import loads as json_loads
+
+from ponika.token_store import TokenKey, TokenStore
+from ponika.models import (
+    T,
+    ApiResponse,
+    BasePayload,
+    Token,
+    BaseModel,
+    build_models,
+    response_adapter,
+)
+
+if TYPE_CHECKING:
+    from ponika.config import ConfigApplier
+    from ponika.endpoints.auto_reboot import AutoRebootEndpoint
+    from ponika.endpoints.backup import BackupEndpoint
+    from ponika.endpoints.data_usage import DataUsageEndpoint
+    from ponika.endpoints.dhcp import DHCPEndpoint
+    from ponika.endpoints.diagnostics import DiagnosticsEndpoint
+    from ponika.endpoints.firmware import FirmwareEndpoint
+    from ponika.endpoints.gps import GpsEndpoint
+    from ponika.endpoints.interfaces import InterfacesEndpoint
+    from ponika.endpoints.internet_connection import InternetConnectionEndpoint
+    from ponika.endpoints.ip_neighbors import IpNeighborsEndpoint
+    from ponika.endpoints.ip_routes import IPRouteEndpoint
+    from ponika.endpoints.messages import MessagesEndpoint
+    from ponika.endpoints.modems import ModemsEndpoint
+    from ponika.endpoints.openvpn import OpenvpnEndpoint
+    from ponika.endpoints.recipients import RecipientsEndpoint
+    from ponika.endpoints.session import SessionEndpoint
+    from ponika.endpoints.sms_utilities import SmsUtilitiesEndpoint
+    from ponika.endpoints.system import SystemEndpoint
+    from ponika.endpoints.tailscale import TailscaleEndpoint
+    from ponika.endpoints.unauthorized import UnauthorizedEndpoint
+    from ponika.endpoints.users import UsersEndpoint
+    from ponika.endpoints.wireguard import WireguardEndpoint
+    from ponika.endpoints.wireless import WirelessEndpoint
+    from ponika.endpoints.zerotier import ZerotierEndpoint
+    from ponika.cache import ResponseCache
+    from ponika.pool import SharedPool
+
+# Endpoint modules are imported when a client first uses them.
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ConfigApplier': 'ponika.config',
+        'AutoRebootEndpoint': 'ponika.endpoints.auto_reboot',
+        'BackupEndpoint': 'ponika.endpoints.backup',
+        'DataUsageEndpoint': 'ponika.endpoints.data_usage',
+        'DHCPEndpoint': 'ponika.endpoints.dhcp',
+        'DiagnosticsEndpoint': 'ponika.endpoints.diagnostics',
+        'FirmwareEndpoint': 'ponika.endpoints.firmware',
+        'GpsEndpoint': 'ponika.endpoints.gps',
+        'InterfacesEndpoint': 'ponika.endpoints.interfaces',
+        'InternetConnectionEndpoint': 'ponika.endpoints.internet_connection',
+        'IpNeighborsEndpoint': 'ponika.endpoints.ip_neighbors',
+        'IPRouteEndpoint': 'ponika.endpoints.ip_routes',
+        'MessagesEndpoint': 'ponika.endpoints.messages',
+        'ModemsEndpoint': 'ponika.endpoints.modems',
+        'OpenvpnEndpoint': 'ponika.endpoints.openvpn',
+        'RecipientsEndpoint': 'ponika.endpoints.recipients',
+        'SessionEndpoint': 'ponika.endpoints.session',
+        'SmsUtilitiesEndpoint': 'ponika.endpoints.sms_utilities',
+        'SystemEndpoint': 'ponika.endpoints.system',
+        'TailscaleEndpoint': 'ponika.endpoints.tailscale',
+        'UnauthorizedEndpoint': 'ponika.endpoints.unauthorized',
+        'UsersEndpoint': 'ponika.endpoints.users',
+        'WireguardEndpoint': 'ponika.endpoints.wireguard',
+        'WirelessEndpoint': 'ponika.endpoints.wireless',
+        'ZerotierEndpoint': 'ponika.endpoints.zerotier',
+    },
+)
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Calls remembered for reuse_unchanged, per client.
+_MAX_UNCHANGED = 1024
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
 
 class ClientConfig(BaseModel):
     """Configuration for PonikaClient."""
@@ -48,6 +135,36 @@ class ClientConfig(BaseModel):
     port: Optional[int] = None
     tls: bool = True
     verify_tls: bool = True
+    # Seconds before expiry at which the bearer token is refreshed.
+    token_refresh_skew: int = 30
+    # Check tokens loaded from a token store with GET /session/status.
+    validate_stored_token: bool = True
+    # Seconds to wait for a connection and for the response, None waits
+    # forever. Override per call with ponika.timeouts.request_timeout().
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 60.0
+    # Attempts per request, and the base in seconds of the exponential
+    # backoff between them. See ponika.middleware.RetryMiddleware.
+    max_attempts: int = 3
+    retry_backoff: float = 0.5
+    # Connection pool of the HTTP session: devices kept (only matters for
+    # redirects between hosts), connections kept per device and whether to
+    # wait for a free connection instead of opening an extra one.
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    # Reuse connections between requests, saving a TLS handshake each.
+    keep_alive: bool = True
+    # Connection attempts retried by urllib3, before RetryMiddleware.
+    max_retries: int = 0
+    # Default for calls taking parse_mode, see ponika.parsing.
+    parse_mode: ParseMode = ParseMode.VALIDATE
+    # Identical GETs in flight at the same time share one request and its
+    # parsed result, see ponika.coalescing.
+    coalesce_gets: bool = True
+    # GETs answered with the same body as the previous identical GET return
+    # the previous result without parsing the body again.
+    reuse_unchanged: bool = False
 
     @property
     def resolved_port(self) -> int:
@@ -67,6 +184,24 @@ class PonikaClient:
         port: int | None = None,
         tls: bool = True,
         verify_tls: bool = True,
+        token_refresh_skew: int = 30,
+        validate_stored_token: bool = True,
+        connect_timeout: float | None = 10.0,
+        read_timeout: float | None = 60.0,
+        max_attempts: int = 3,
+        retry_backoff: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        max_retries: int = 0,
+        parse_mode: ParseMode | str = ParseMode.VALIDATE,
+        coalesce_gets: bool = True,
+        reuse_unchanged: bool = False,
+        token_store: TokenStore | None = None,
+        stats: StatsCollector | None = None,
+        pool: 'SharedPool | None' = None,
+        cache: 'ResponseCache | None' = None,
     ) -> None:
         self._config = ClientConfig(
             host=host,
@@ -75,61 +210,525 @@ class PonikaClient:
             port=port,
             tls=tls,
             verify_tls=verify_tls,
+            token_refresh_skew=token_refresh_skew,
+            validate_stored_token=validate_stored_token,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_attempts=max_attempts,
+            retry_backoff=retry_backoff,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            max_retries=max_retries,
+            parse_mode=parse_mode,
+            coalesce_gets=coalesce_gets,
+            reuse_unchanged=reuse_unchanged,
         )
 
-        self._request: Session = Session()
+        self._request: Session = self._create_session(pool)
         self._logger: Logger = getLogger(__name__)
 
         self.auth: None | Token = None
+        self._auth_lock = self._create_lock()
+        self._flights = SingleFlight(self._create_lock)
+        # Body digest and result of the last successful GET per call, for
+        # reuse_unchanged. The oldest are dropped beyond _MAX_UNCHANGED.
+        self._unchanged: OrderedDict[
+            Hashable, tuple[bytes, ApiResponse[Any]]
+        ] = OrderedDict()
+        self._unchanged_lock = threading.Lock()
+        self._token_store = token_store
+        self._token_key = TokenKey.from_config(self._config)
+        self.stats = stats
+
+        # Request pipeline, outermost middleware first.
+        self.middleware: list[Middleware] = [
+            TimingMiddleware(),
+            # Outside retries, so that a call is counted once.
+            StatsMiddleware(),
+            RetryMiddleware(
+                max_attempts=self._config.max_attempts,
+                backoff=self._config.retry_backoff,
+            ),
+            AuthMiddleware(),
+        ]
+        # Outermost, so that cached responses skip the rest of the pipeline.
+        self.cache = cache
+        if cache is not None:
+            self.middleware.insert(0, cache)
+
+    # Endpoints are created, and their modules imported, on first access.
+
+    @cached_property
+    def unauthorized(self) -> 'UnauthorizedEndpoint':
+        from ponika.endpoints.unauthorized import UnauthorizedEndpoint
+
+        return UnauthorizedEndpoint(self)
+
+    @cached_property
+    def session(self) -> 'SessionEndpoint':
+        from ponika.endpoints.session import SessionEndpoint
+
+        return SessionEndpoint(self)
+
+    @cached_property
+    def sms_utilities(self) -> 'SmsUtilitiesEndpoint':
+        from ponika.endpoints.sms_utilities import SmsUtilitiesEndpoint
+
+        return SmsUtilitiesEndpoint(self)
+
+    @cached_property
+    def messages(self) -> 'MessagesEndpoint':
+        from ponika.endpoints.messages import MessagesEndpoint
+
+        return MessagesEndpoint(self)
+
+    @cached_property
+    def gps(self) -> 'GpsEndpoint':
+        from ponika.endpoints.gps import GpsEndpoint
+
+        return GpsEndpoint(self)
+
+    @cached_property
+    def backup(self) -> 'BackupEndpoint':
+        from ponika.endpoints.backup import BackupEndpoint
+
+        return BackupEndpoint(self)
+
+    @cached_property
+    def auto_reboot(self) -> 'AutoRebootEndpoint':
+        from ponika.endpoints.auto_reboot import AutoRebootEndpoint
+
+        return AutoRebootEndpoint(self)
+
+    @cached_property
+    def diagnostics(self) -> 'DiagnosticsEndpoint':
+        from ponika.endpoints.diagnostics import DiagnosticsEndpoint
+
+        return DiagnosticsEndpoint(self)
+
+    @cached_property
+    def dhcp(self) -> 'DHCPEndpoint':
+        from ponika.endpoints.dhcp import DHCPEndpoint
+
+        return DHCPEndpoint(self)
+
+    @cached_property
+    def tailscale(self) -> 'TailscaleEndpoint':
+        from ponika.endpoints.tailscale import TailscaleEndpoint
+
+        return TailscaleEndpoint(self)
+
+    @cached_property
+    def wireguard(self) -> 'WireguardEndpoint':
+        from ponika.endpoints.wireguard import WireguardEndpoint
+
+        return WireguardEndpoint(self)
+
+    @cached_property
+    def wireless(self) -> 'WirelessEndpoint':
+        from ponika.endpoints.wireless import WirelessEndpoint
+
+        return WirelessEndpoint(self)
+
+    @cached_property
+    def zerotier(self) -> 'ZerotierEndpoint':
+        from ponika.endpoints.zerotier import ZerotierEndpoint
+
+        return ZerotierEndpoint(self)
+
+    @cached_property
+    def internet_connection(self) -> 'InternetConnectionEndpoint':
+        from ponika.endpoints.internet_connection import (
+            InternetConnectionEndpoint,
+        )
+
+        return InternetConnectionEndpoint(self)
+
+    @cached_property
+    def interfaces(self) -> 'InterfacesEndpoint':
+        from ponika.endpoints.interfaces import InterfacesEndpoint
+
+        return InterfacesEndpoint(self)
+
+    @cached_property
+    def ip_routes(self) -> 'IPRouteEndpoint':
+        from ponika.endpoints.ip_routes import IPRouteEndpoint
+
+        return IPRouteEndpoint(self)
+
+    @cached_property
+    def ip_neighbors(self) -> 'IpNeighborsEndpoint':
+        from ponika.endpoints.ip_neighbors import IpNeighborsEndpoint
+
+        return IpNeighborsEndpoint(self)
+
+    @cached_property
+    def modems(self) -> 'ModemsEndpoint':
+        from ponika.endpoints.modems import ModemsEndpoint
+
+        return ModemsEndpoint(self)
+
+    @cached_property
+    def firmware(self) -> 'FirmwareEndpoint':
+        from ponika.endpoints.firmware import FirmwareEndpoint
+
+        return FirmwareEndpoint(self)
+
+    @cached_property
+    def users(self) -> 'UsersEndpoint':
+        from ponika.endpoints.users import UsersEndpoint
+
+        return UsersEndpoint(self)
+
+    @cached_property
+    def data_usage(self) -> 'DataUsageEndpoint':
+        from ponika.endpoints.data_usage import DataUsageEndpoint
+
+        return DataUsageEndpoint(self)
+
+    @cached_property
+    def recipients(self) -> 'RecipientsEndpoint':
+        from ponika.endpoints.recipients import RecipientsEndpoint
+
+        return RecipientsEndpoint(self)
+
+    @cached_property
+    def openvpn(self) -> 'OpenvpnEndpoint':
+        from ponika.endpoints.openvpn import OpenvpnEndpoint
+
+        return OpenvpnEndpoint(self)
 
-        self.unauthorized = UnauthorizedEndpoint(self)
-        self.session = SessionEndpoint(self)
-        self.sms_utilities = SmsUtilitiesEndpoint(self)
-        self.messages = MessagesEndpoint(self)
-        self.gps = GpsEndpoint(self)
-        self.backup = BackupEndpoint(self)
-        self.auto_reboot = AutoRebootEndpoint(self)
-        self.diagnostics = DiagnosticsEndpoint(self)
-        self.dhcp = DHCPEndpoint(self)
-        self.tailscale = TailscaleEndpoint(self)
-        self.wireguard = WireguardEndpoint(self)
-        self.wireless = WirelessEndpoint(self)
-        self.zerotier = ZerotierEndpoint(self)
-        self.internet_connection = InternetConnectionEndpoint(self)
-        self.interfaces = InterfacesEndpoint(self)
-        self.ip_routes = IPRouteEndpoint(self)
-        self.ip_neighbors = IpNeighborsEndpoint(self)
-        self.modems = ModemsEndpoint(self)
-        self.firmware = FirmwareEndpoint(self)
-        self.users = UsersEndpoint(self)
-        self.data_usage = DataUsageEndpoint(self)
-        self.recipients = RecipientsEndpoint(self)
-        self.openvpn = OpenvpnEndpoint(self)
-        self.system = SystemEndpoint(self)
-        self.config = ConfigApplier(self)
+    @cached_property
+    def system(self) -> 'SystemEndpoint':
+        from ponika.endpoints.system import SystemEndpoint
+
+        return SystemEndpoint(self)
+
+    @cached_property
+    def config(self) -> 'ConfigApplier':
+        from ponika.config import ConfigApplier
+
+        return ConfigApplier(self)
+
+    @classmethod
+    def from_config(
+        cls, config: ClientConfig, **kwargs: Any
+    ) -> 'PonikaClient':
+        """Create a client from a :class:`ClientConfig`.
+
+        Keyword arguments such as ``token_store`` are passed to the
+        constructor and take precedence over fields of ``config``.
+        """
+        return cls(**{**config.model_dump(), **kwargs})
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._request.close()
+
+    def warm_up(self, *endpoints: str) -> None:
+        """Build the models of ``endpoints`` ahead of their first request.
+
+        Models build their schemas on first use, which keeps short scripts
+        fast. Long-running pollers can pay that cost once at startup instead.
+        ``endpoints`` are attribute paths such as ``'modems'`` or
+        ``'wireguard.peers'``; without arguments all endpoints are built.
+        """
+        targets = [
+            reduce(getattr, path.split('.'), self) for path in endpoints
+        ] or [self]
+
+        modules = {'ponika.models': sys.modules['ponika.models']}
+        for target in targets:
+            for endpoint in _endpoint_tree(target):
+                module = sys.modules[type(endpoint).__module__]
+                modules[module.__name__] = module
+
+        for module in modules.values():
+            build_models(module)
+            for value in vars(module).values():
+                for model in _response_models(value):
+                    response_adapter(model)
+                    response_adapter(list[model])
+
+    def _create_session(self, pool: 'SharedPool | None') -> Session:
+        """Create the HTTP session with the configured connection pool."""
+        config = self._config
+        session = Session()
+        adapter = (
+            pool.adapter
+            if pool is not None
+            else HTTPAdapter(
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+                pool_block=config.pool_block,
+                max_retries=config.max_retries,
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not config.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def _create_lock(self) -> AbstractContextManager:
+        """Create a reentrant lock guarding shared client state."""
+        return threading.RLock()
+
+    def _create_event(self) -> threading.Event:
+        """Create an event that calls made through :meth:`_map` can await."""
+        return threading.Event()
+
+    def _sleep(self, seconds: float) -> None:
+        """Pause the calling thread, e.g. between retries."""
+        sleep(seconds)
+
+    def _map(
+        self,
+        fn: Callable[[_T], _R],
+        items: Sequence[_T],
+        max_workers: int,
+    ) -> list[_R]:
+        """Call ``fn`` for all ``items`` concurrently, results in order.
+
+        At most ``max_workers`` calls run at a time, each in a copy of the
+        caller's context so that deadlines apply. The first error is raised
+        once all calls have finished.
+        """
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items)),
+            thread_name_prefix='ponika',
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, fn, item)
+                for item in items
+            ]
+        return [future.result() for future in futures]
+
+    def _current_token(self) -> Optional[str]:
+        """Return the bearer token unless it is due for a refresh."""
+        auth = self.auth
+        if auth and auth.is_usable():
+            return auth.token
+        return None
 
     def _get_auth_token(self) -> Optional[str]:
-        """Get the current authentication token."""
-        if self.auth and self.auth.expires_at > int(time()):
+        """Get the current authentication token.
+
+        Refreshing is single-flight: when many threads find the token expired,
+        one of them logs in while the others wait and reuse its token. A token
+        found in the token store is reused instead of logging in.
+        """
+        token = self._current_token()
+        if token:
+            return token
+
+        with self._auth_lock:
+            token = self._current_token() or self._load_stored_token()
+            if token:
+                return token
+
+            auth_response = self.login(
+                username=self._config.username,
+                password=self._config.password,
+            )
+
+            self.auth = (
+                self._token_from_login(auth_response.data)
+                if auth_response.success and auth_response.data
+                else None
+            )
+
+            if self.auth is None:
+                raise TeltonikaLoginException()
+
+            if self._token_store is not None:
+                self._token_store.save(self._token_key, self.auth)
+
             return self.auth.token
 
-        auth_response = self.login(
-            username=self._config.username, password=self._config.password
+    def _load_stored_token(self) -> Optional[str]:
+        """Adopt a usable token from the token store, if there is one."""
+        if self._token_store is None:
+            return None
+
+        stored = self._token_store.load(self._token_key)
+        if stored is None:
+            return None
+
+        # Adopted only once checked, as other threads read self.auth.
+        if self._config.validate_stored_token and not self._is_session_active(
+            stored.token
+        ):
+            self._token_store.delete(self._token_key)
+            return None
+
+        self.auth = stored
+        return stored.token
+
+    def _is_session_active(self, token: str) -> bool:
+        # The candidate token is sent explicitly, bypassing AuthMiddleware,
+        # so a rejected token does not trigger a login from within the check.
+        endpoint = '/session/status'
+        try:
+            response = self._validate_response(
+                'GET',
+                endpoint,
+                self.session.SessionResponseData,
+                self._send(
+                    'GET',
+                    endpoint,
+                    auth_required=False,
+                    headers={'Authorization': f'Bearer {token}'},
+                ),
+            )
+        except TeltonikaDeadlineExceeded:
+            # Running out of time says nothing about the token.
+            raise
+        except (ValueError, TeltonikaApiException):
+            return False
+        return bool(
+            response.success and response.data and response.data.active
         )
 
-        self.auth = (
-            Token(
-                token=auth_response.data.token,
-                expires_at=int(time()) + auth_response.data.expires,
-            )
-            if auth_response.success and auth_response.data
-            else None
+    def _renew_auth_token(self, rejected: str) -> Optional[str]:
+        """Log in again after the device rejected the token ``rejected``.
+
+        Requests failing with the same token at once share a single login:
+        only the first drops the token, the others pick up its replacement.
+        """
+        with self._auth_lock:
+            if self.auth is not None and self.auth.token == rejected:
+                self._forget_token()
+            return self._get_auth_token()
+
+    def _forget_token(self) -> None:
+        """Drop the current token locally and from the token store."""
+        self.auth = None
+        if self._token_store is not None:
+            self._token_store.delete(self._token_key)
+
+    def _token_from_login(
+        self, data: 'PonikaClient.LoginResponseData'
+    ) -> Token:
+        now = int(time())
+        # Refresh ahead of expiry, but never sooner than halfway through the
+        # lifetime so short-lived tokens are not refreshed on every request.
+        lifetime = max(
+            data.expires - self._config.token_refresh_skew,
+            data.expires // 2,
+        )
+        return Token(
+            token=data.token,
+            expires_at=now + data.expires,
+            refresh_at=now + lifetime,
         )
 
-        if self.auth is None:
-            raise TeltonikaLoginException()
+    def add_middleware(self, middleware: Middleware) -> None:
+        """Register ``middleware`` for every request of this client.
+
+        Middlewares run in registration order, after the built-in ones and
+        before the bearer token is added. See :mod:`ponika.middleware`.
+        """
+        index = next(
+            (
+                i
+                for i, registered in enumerate(self.middleware)
+                if isinstance(registered, AuthMiddleware)
+            ),
+            len(self.middleware),
+        )
+        self.middleware.insert(index, middleware)
 
-        return self.auth.token if self.auth else None
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        auth_required: bool = True,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request through the middleware chain."""
+        self._logger.info('Making %s request to: %s', method, endpoint)
+
+        request = ApiRequest(
+            client=self,
+            method=method,
+            endpoint=endpoint,
+            auth_required=auth_required,
+            **kwargs,
+        )
+
+        handler: Handler = self._transport
+        for middleware in reversed(self.middleware):
+            handler = _chain(middleware, handler)
+        return handler(request)
+
+    def _transport(self, request: ApiRequest) -> Response:
+        """Innermost handler of the chain, sending the request over HTTP.
+
+        Raises :class:`TeltonikaDeadlineExceeded` instead of sending when the
+        deadline of the current context has passed, or when the request timed
+        out because of it.
+        """
+        timeout = timeouts.resolve(
+            self._config.connect_timeout, self._config.read_timeout
+        )
+        # Network time of every attempt; StatsMiddleware counts the errors.
+        timed = (
+            nullcontext()
+            if self.stats is None
+            else self.stats.timed(
+                request.endpoint, 'network_seconds', count_errors=False
+            )
+        )
+        try:
+            with timed:
+                return self._request.request(
+                    request.method,
+                    request.url,
+                    verify=self._config.verify_tls,
+                    params=request.params,
+                    json=request.json,
+                    data=request.data,
+                    files=request.files,
+                    headers=request.headers or None,
+                    timeout=timeout,
+                )
+        except requests.Timeout as e:
+            if timeouts.expired():
+                raise TeltonikaDeadlineExceeded(
+                    f'{request.method} {request.endpoint} ran out of time.'
+                ) from e
+            raise
+
+    def _timed(
+        self, endpoint: str, metric: str, response: Optional[Response] = None
+    ) -> AbstractContextManager:
+        if self.stats is None:
+            return nullcontext()
+        # StatsMiddleware already counted HTTP error statuses as errors.
+        count_errors = response is None or response.status_code < 400
+        return self.stats.timed(endpoint, metric, count_errors)
+
+    def _parse_mode(self, parse_mode: ParseMode | str | None) -> ParseMode:
+        """Resolve the ``parse_mode`` of a call, ``None`` being the default."""
+        return ParseMode(parse_mode or self._config.parse_mode)
+
+    def _decode(self, endpoint: str, response: Response) -> object:
+        with self._timed(endpoint, 'decode_seconds', response):
+            return json_loads(response.content)
+
+    @staticmethod
+    def _as_params(
+        params: Optional[Dict[str, Any] | BasePayload],
+    ) -> Optional[Dict[str, Any]]:
+        if isinstance(params, (BasePayload, BaseModel)):
+            return params.asdict()
+        return params
 
     def _get(
         self,
@@ -137,22 +736,139 @@ class PonikaClient:
         params: Optional[Dict[str, Any]] = None,
         auth_required: bool = True,
     ) -> object:
-        self._logger.info('Making GET request to: %s', endpoint)
+        response = self._send(
+            'GET', endpoint, params=params, auth_required=auth_required
+        )
+        return self._decode(endpoint, response)
 
-        auth_token = self._get_auth_token() if auth_required else None
+    def _get_response(
+        self,
+        endpoint: str,
+        data_model: Any,
+        params: Optional[Dict[str, Any]] = None,
+        auth_required: bool = True,
+        parse_mode: ParseMode | str | None = ParseMode.VALIDATE,
+    ) -> ApiResponse[Any]:
+        """GET ``endpoint`` and validate it as ``ApiResponse[data_model]``.
+
+        Endpoints offering a ``parse_mode`` pass it on; ``None`` selects the
+        mode of the client. Unless ``coalesce_gets`` is off, concurrent calls
+        with the same arguments share one request and its models, each in a
+        list of its own. Raw results are mutable, so in that mode callers only
+        share the response and decode their own copy. With
+        ``reuse_unchanged``, a body identical to the previous one of the same
+        call returns the previous result.
+        """
+        mode = self._parse_mode(parse_mode)
+        key = (
+            str(endpoint),
+            json.dumps(params, sort_keys=True, default=str),
+            data_model,
+            mode,
+            auth_required,
+        )
 
-        response = self._request.get(
-            f'{self._config.base_url}{endpoint}',
-            verify=self._config.verify_tls,
-            params=params,
-            headers=(
-                {'Authorization': f'Bearer {auth_token}'}
-                if auth_token
-                else None
-            ),
+        def send() -> Response:
+            return self._send(
+                'GET', endpoint, params=params, auth_required=auth_required
+            )
+
+        def parse(response: Response) -> ApiResponse[Any]:
+            if self._config.reuse_unchanged:
+                return self._reuse_unchanged(
+                    key, endpoint, data_model, response, mode
+                )
+            return self._validate_response(
+                'GET', endpoint, data_model, response, mode
+            )
+
+        if not self._config.coalesce_gets:
+            return parse(send())
+
+        if mode is ParseMode.RAW:
+            response, shared = self._flights.do(key, send)
+            result = parse(response)
+        else:
+            result, shared = self._flights.do(key, lambda: parse(send()))
+            # Models are frozen, but the lists holding them are not.
+            if shared and isinstance(result.data, (list, dict)):
+                result = result.model_copy(update={'data': copy(result.data)})
+        if shared and self.stats is not None:
+            self.stats.increment(endpoint, 'coalesced')
+        return result
+
+    def _reuse_unchanged(
+        self,
+        key: Hashable,
+        endpoint: str,
+        data_model: Any,
+        response: Response,
+        parse_mode: ParseMode,
+    ) -> ApiResponse[Any]:
+        """Validate ``response`` unless its body is that of the last call."""
+        digest = blake2b(response.content, digest_size=16).digest()
+        with self._unchanged_lock:
+            previous = self._unchanged.get(key)
+        if previous is not None and previous[0] == digest:
+            if self.stats is not None:
+                self.stats.increment(endpoint, 'unchanged')
+            return previous[1]
+
+        result = self._validate_response(
+            'GET', endpoint, data_model, response, parse_mode
         )
+        if result.success:
+            with self._unchanged_lock:
+                self._unchanged[key] = (digest, result)
+                self._unchanged.move_to_end(key)
+                if len(self._unchanged) > _MAX_UNCHANGED:
+                    self._unchanged.popitem(last=False)
+        return result
+
+    def _validate_response(
+        self,
+        method: str,
+        endpoint: str,
+        data_model: Any,
+        response: Response,
+        parse_mode: ParseMode | str | None = ParseMode.VALIDATE,
+    ) -> ApiResponse[Any]:
+        """Validate the body of ``response`` as ``ApiResponse[data_model]``.
+
+        The raw bytes go straight to pydantic's JSON parser through the cached
+        response adapter, without decoding them into Python objects first.
+        Parsing is therefore recorded as part of ``validation_seconds``.
+        Successful responses skip validation in the ``raw`` parse mode.
+        """
+        mode = self._parse_mode(parse_mode)
+        if mode is ParseMode.RAW:
+            payload = self._decode(endpoint, response)
+            # Errors are validated as usual, for the exception they raise.
+            if isinstance(payload, dict) and payload.get('success') is True:
+                return ApiResponse.model_construct(
+                    success=True, data=payload.get('data')
+                )
+
+        try:
+            with self._timed(endpoint, 'validation_seconds', response):
+                result = response_adapter(data_model).validate_json(
+                    response.content
+                )
+        except ValidationError as e:
+            print(f'Error during request: {method} {endpoint}')
+            print(
+                f'Error during response validation to class ApiResponse[{data_model}]'
+            )
+            print(f'Response we got: {response.text}')
+            raise e
 
-        return response.json()
+        if (
+            self.stats is not None
+            and not result.success
+            and response.status_code < 400
+        ):
+            self.stats.increment(endpoint, 'errors')
+        return result
 
     def _post_data(
         self,
@@ -161,13 +877,10 @@ class PonikaClient:
         params: Optional[Dict[str, Any] | BasePayload] = None,
         auth_required: bool = True,
     ) -> ApiResponse[T]:
-        if isinstance(params, (BasePayload, BaseModel)):
-            params = params.asdict()
-
         return self._post(
             endpoint=endpoint,
             data_model=data_model,
-            params={'data': params},
+            params={'data': self._as_params(params)},
             auth_required=auth_required,
         )
 
@@ -178,37 +891,8 @@ class PonikaClient:
         params: Optional[Dict[str, Any] | BasePayload] = None,
         auth_required: bool = True,
     ) -> ApiResponse[T]:
-        self._logger.info('Making POST request to: %s', endpoint)
-
-        if isinstance(params, (BasePayload, BaseModel)):
-            params = params.asdict()
-
-        auth_token = self._get_auth_token() if auth_required else None
-
-        response = self._request.post(
-            f'{self._config.base_url}{endpoint}',
-            verify=self._config.verify_tls,
-            json=params,
-            headers=(
-                {'Authorization': f'Bearer {auth_token}'}
-                if auth_token
-                else None
-            ),
-        )
-
-        try:
-            response_obj = ApiResponse[data_model].model_validate(
-                response.json()
-            )
-        except ValidationError as e:
-            print(f'Error during request: POST {endpoint}')
-            print(
-                f'Error during response validation to class ApiResponse[{data_model}]'
-            )
-            print(f'Response we got: {response.text}')
-            raise e
-
-        return response_obj
+        response = self._post_raw(endpoint, params, auth_required)
+        return self._validate_response('POST', endpoint, data_model, response)
 
     def _post_raw(
         self,
@@ -216,26 +900,13 @@ class PonikaClient:
         params: Optional[Dict[str, Any] | BasePayload] = None,
         auth_required: bool = True,
     ) -> Response:
-        self._logger.info('Making POST request to: %s', endpoint)
-
-        if isinstance(params, (BasePayload, BaseModel)):
-            params = params.asdict()
-
-        auth_token = self._get_auth_token() if auth_required else None
-
-        response = self._request.post(
-            f'{self._config.base_url}{endpoint}',
-            verify=self._config.verify_tls,
-            json=params,
-            headers=(
-                {'Authorization': f'Bearer {auth_token}'}
-                if auth_token
-                else None
-            ),
+        return self._send(
+            'POST',
+            endpoint,
+            json=self._as_params(params),
+            auth_required=auth_required,
         )
 
-        return response
-
     def _post_files(
         self,
         endpoint: str,
@@ -244,45 +915,23 @@ class PonikaClient:
         params: Optional[Dict[str, Any] | BasePayload] = None,
         auth_required: bool = True,
     ) -> ApiResponse[T]:
-        self._logger.info('Making POST request to: %s', endpoint)
-
-        if isinstance(params, (BasePayload, BaseModel)):
-            params = params.asdict()
-
-        auth_token = self._get_auth_token() if auth_required else None
-
-        files_params = {}
-
-        try:
-            with ExitStack() as stack:
-                for key, filepath in files.items():
-                    filename = os.path.basename(filepath)
-                    file_handle = stack.enter_context(open(filepath, 'rb'))
-
-                    files_params[key] = (filename, file_handle)
-
-                files_params = {
-                    key: open(filepath, 'rb')
-                    for key, filepath in files.items()
-                }
-
-                response = self._request.post(
-                    f'{self._config.base_url}{endpoint}',
-                    verify=self._config.verify_tls,
-                    files=files_params,
-                    data=params,
-                    headers=(
-                        {'Authorization': f'Bearer {auth_token}'}
-                        if auth_token
-                        else None
-                    ),
+        with ExitStack() as stack:
+            files_params = {
+                key: (
+                    os.path.basename(filepath),
+                    stack.enter_context(open(filepath, 'rb')),
                 )
-        finally:
-            # Dateien immer schließen
-            for file_handle in files_params.values():
-                file_handle.close()
+                for key, filepath in (files or {}).items()
+            }
+            response = self._send(
+                'POST',
+                endpoint,
+                data=self._as_params(params),
+                files=files_params,
+                auth_required=auth_required,
+            )
 
-        return ApiResponse[data_model].model_validate(response.json())
+        return self._validate_response('POST', endpoint, data_model, response)
 
     def _put_data(
         self,
@@ -291,13 +940,10 @@ class PonikaClient:
         params: Optional[Dict[str, Any] | BasePayload] = None,
         auth_required: bool = True,
     ) -> ApiResponse[T]:
-        if isinstance(params, (BasePayload, BaseModel)):
-            params = params.asdict()
-
         return self._put(
             endpoint=endpoint,
             data_model=data_model,
-            params={'data': params},
+            params={'data': self._as_params(params)},
             auth_required=auth_required,
         )
 
@@ -308,32 +954,13 @@ class PonikaClient:
         params: Optional[Dict[str, Any] | BasePayload] = None,
         auth_required: bool = True,
     ) -> ApiResponse[T]:
-        self._logger.info('Making POST request to: %s', endpoint)
-
-        if isinstance(params, (BasePayload, BaseModel)):
-            params = params.asdict()
-
-        auth_token = self._get_auth_token() if auth_required else None
-
-        response = self._request.put(
-            f'{self._config.base_url}{endpoint}',
-            verify=self._config.verify_tls,
-            json=params,
-            headers=(
-                {'Authorization': f'Bearer {auth_token}'}
-                if auth_token
-                else None
-            ),
+        response = self._send(
+            'PUT',
+            endpoint,
+            json=self._as_params(params),
+            auth_required=auth_required,
         )
-
-        try:
-            response_json = response.json()
-        except TypeError:
-            raise TeltonikaApiException(
-                f'Cannot JSON decode response: {response.text}'
-            )
-
-        return ApiResponse[data_model].model_validate(response_json)
+        return self._validate_response('PUT', endpoint, data_model, response)
 
     def _delete(
         self,
@@ -342,34 +969,12 @@ class PonikaClient:
         params: Optional[Dict[str, Any]] = None,
         auth_required: bool = True,
     ) -> ApiResponse[T]:
-        self._logger.info('Making POST request to: %s', endpoint)
-
-        auth_token = self._get_auth_token() if auth_required else None
-
-        response = self._request.delete(
-            f'{self._config.base_url}{endpoint}',
-            verify=self._config.verify_tls,
-            json=params,
-            headers=(
-                {'Authorization': f'Bearer {auth_token}'}
-                if auth_token
-                else None
-            ),
+        response = self._send(
+            'DELETE', endpoint, json=params, auth_required=auth_required
+        )
+        return self._validate_response(
+            'DELETE', endpoint, data_model, response
         )
-
-        try:
-            response_obj = ApiResponse[data_model].model_validate(
-                response.json()
-            )
-        except ValidationError as e:
-            print(f'Error during request: DELETE {endpoint}')
-            print(
-                f'Error during response validation to class ApiResponse[{data_model}]'
-            )
-            print(f'Response we got: {response.text}')
-            raise e
-
-        return response_obj
 
     class LoginResponseData(BaseModel):
         """Data model for login response."""
@@ -401,4 +1006,29 @@ class PonikaClient:
     def logout(self) -> ApiResponse[LogoutResponseData]:
         """Logout from the Ponika API."""
         self._logger.info('Logging out...')
-        return self._post('/logout', self.LogoutResponseData)
+        response = self._post('/logout', self.LogoutResponseData)
+        self._forget_token()
+        return response
+
+
+def _chain(middleware: Middleware, call_next: Handler) -> Handler:
+    return lambda request: middleware(request, call_next)
+
+
+def _endpoint_tree(endpoint: object) -> Iterator[object]:
+    """Yield ``endpoint`` and all endpoints created lazily below it."""
+    yield endpoint
+    for name, _ in inspect.getmembers_static(
+        type(endpoint), lambda value: isinstance(value, cached_property)
+    ):
+        yield from _endpoint_tree(getattr(endpoint, name))
+
+
+def _response_models(value: object) -> Iterator[type[BaseModel]]:
+    """Yield the response models declared by an endpoint class."""
+    if not isinstance(value, type):
+        return
+    for attribute in ('status_response_model', 'config_response_model'):
+        model = getattr(value, attribute, None)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            yield model
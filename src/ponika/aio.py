@@ -0,0 +1,359 @@
+"""Asyncio support for Ponika.
+
+:class:`AsyncPonikaClient` exposes the same endpoint tree as
+:class:`ponika.PonikaClient`. Endpoint methods are not duplicated: each call
+runs the regular synchronous implementation inside a greenlet. Whenever that
+code reaches the HTTP transport, the greenlet hands the pending ``httpx``
+coroutine back to the event loop and is resumed with its result. A single event
+loop can therefore drive thousands of concurrent device conversations, each
+costing one small greenlet instead of one thread.
+
+The async client requires the optional ``async`` extra::
+
+    pip install ponika[async]
+"""
+
+import asyncio
+import contextvars
+import inspect
+import sys
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Optional, TypeVar
+
+import requests
+
+try:
+    import httpx
+    from greenlet import getcurrent, greenlet
+except ImportError as e:  # pragma: no cover - depends on installed extras
+    raise ImportError(
+        'AsyncPonikaClient requires the optional "async" extra: '
+        'pip install ponika[async]'
+    ) from e
+
+from ponika import ClientConfig, PonikaClient
+from ponika.pool import SharedPool
+
+T = TypeVar('T')
+
+
+class _BridgeGreenlet(greenlet):
+    """Greenlet running synchronous client code on behalf of a coroutine."""
+
+
+def await_only(awaitable: Awaitable[T]) -> T:
+    """Wait for ``awaitable`` from synchronous code run by the async client."""
+    current = getcurrent()
+    if not isinstance(current, _BridgeGreenlet):
+        raise RuntimeError(
+            'await_only() can only be used inside AsyncPonikaClient calls.'
+        )
+    return current.parent.switch(awaitable)
+
+
+def _start(fn: Callable[..., T], *args: Any, **kwargs: Any):
+    """Run ``fn`` until it finishes or waits for the first awaitable."""
+    glet = _BridgeGreenlet(fn, getcurrent())
+    glet.gr_context = contextvars.copy_context()
+    return glet, glet.switch(*args, **kwargs)
+
+
+async def _drive(glet: _BridgeGreenlet, awaitable: Awaitable[Any]) -> Any:
+    result = awaitable
+    while not glet.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = glet.throw(*sys.exc_info())
+        else:
+            result = glet.switch(value)
+    return result
+
+
+async def greenlet_spawn(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Await a synchronous function that may call :func:`await_only`."""
+    glet, result = _start(fn, *args, **kwargs)
+    if glet.dead:
+        return result
+    return await _drive(glet, result)
+
+
+class _AsyncSession:
+    """``requests.Session`` look-alike sending through ``httpx.AsyncClient``.
+
+    The returned ``httpx.Response`` offers the ``json()``, ``text``,
+    ``content``, ``status_code`` and ``raise_for_status()`` members used by the
+    synchronous client. Transport errors are raised as their ``requests``
+    counterparts so middlewares handle both clients alike.
+    """
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        verify: Optional[bool] = None,
+        timeout: Optional[tuple[Optional[float], Optional[float]]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        # TLS verification is a property of the httpx client, not a request.
+        if timeout is not None:
+            connect, read = timeout
+            kwargs['timeout'] = httpx.Timeout(read, connect=connect)
+        try:
+            return await_only(self._client.request(method, url, **kwargs))
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+
+class _GreenletLock:
+    """Reentrant lock for code running in bridge greenlets.
+
+    A ``threading.RLock`` cannot be used there: all greenlets share the event
+    loop thread, so a second greenlet would re-enter the lock of the first.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._owner: greenlet | None = None
+        self._depth = 0
+
+    def __enter__(self) -> '_GreenletLock':
+        current = getcurrent()
+        if self._owner is not current:
+            await_only(self._lock.acquire())
+            self._owner = current
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._depth -= 1
+        if not self._depth:
+            self._owner = None
+            self._lock.release()
+
+
+class _GreenletEvent:
+    """``threading.Event`` look-alike for code running in bridge greenlets."""
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def set(self) -> None:
+        self._event.set()
+
+    def wait(self) -> bool:
+        if not self._event.is_set():
+            await_only(self._event.wait())
+        return True
+
+
+class _BridgedPonikaClient(PonikaClient):
+    """PonikaClient whose transport suspends the running greenlet."""
+
+    def _create_lock(self) -> _GreenletLock:
+        return _GreenletLock()
+
+    def _create_event(self) -> _GreenletEvent:
+        return _GreenletEvent()
+
+    def _sleep(self, seconds: float) -> None:
+        await_only(asyncio.sleep(seconds))
+
+    def _map(
+        self,
+        fn: Callable[[Any], T],
+        items: Sequence[Any],
+        max_workers: int,
+    ) -> list[T]:
+        # Every call gets a greenlet of its own, gathered on the event loop.
+        # Tasks run in copies of this greenlet's context, not the loop's.
+        context = contextvars.copy_context()
+
+        async def gather() -> list[Any]:
+            semaphore = asyncio.Semaphore(max_workers)
+
+            async def call(item: Any) -> T:
+                async with semaphore:
+                    return await greenlet_spawn(fn, item)
+
+            loop = asyncio.get_running_loop()
+            tasks = [
+                loop.create_task(call(item), context=context.copy())
+                for item in items
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = await_only(gather())
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+
+def _is_endpoint(value: Any) -> bool:
+    return (
+        not inspect.isclass(value)
+        and not inspect.isroutine(value)
+        and isinstance(getattr(value, '_client', None), PonikaClient)
+    )
+
+
+def _wrap(value: Any) -> Any:
+    return AsyncEndpoint(value) if _is_endpoint(value) else value
+
+
+class AsyncEndpoint:
+    """Async view of an endpoint object of the synchronous client.
+
+    Methods return awaitables, even when served without a request. Helpers
+    that only build other endpoint objects, such as
+    ``wireguard.peers.config(...)``, return immediately.
+    """
+
+    __slots__ = ('_target',)
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        if name == '_target':
+            raise AttributeError(name)
+        value = getattr(self._target, name)
+        if inspect.isroutine(value):
+            return _AsyncMethod(value)
+        return _wrap(value)
+
+    def __repr__(self) -> str:
+        return f'AsyncEndpoint({self._target!r})'
+
+
+class _AsyncMethod:
+    __slots__ = ('_method',)
+
+    def __init__(self, method: Callable[..., Any]) -> None:
+        self._method = method
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            glet, result = _start(self._method, *args, **kwargs)
+        except BaseException as e:
+            return self._raise(e)
+        if not glet.dead:
+            return self._finish(glet, result)
+        # Calls served without I/O, e.g. from the response cache, are still
+        # awaited. Only helpers building endpoint objects return directly.
+        if _is_endpoint(result):
+            return _wrap(result)
+        return self._return(result)
+
+    async def _finish(
+        self, glet: _BridgeGreenlet, awaitable: Awaitable[Any]
+    ) -> Any:
+        return _wrap(await _drive(glet, awaitable))
+
+    async def _return(self, result: Any) -> Any:
+        return _wrap(result)
+
+    async def _raise(self, error: BaseException) -> Any:
+        raise error
+
+
+def _pool_http_client(pool: SharedPool, verify: bool) -> httpx.AsyncClient:
+    """Return the ``httpx.AsyncClient`` standing in for ``pool``."""
+    if verify not in pool.async_clients:
+        pool.async_clients[verify] = httpx.AsyncClient(
+            verify=verify,
+            timeout=None,
+            limits=httpx.Limits(
+                max_connections=pool.max_connections,
+                max_keepalive_connections=pool.max_connections,
+            ),
+        )
+    return pool.async_clients[verify]
+
+
+class AsyncPonikaClient(AsyncEndpoint):
+    """Asyncio client for the Teltonika API.
+
+    Every endpoint of :class:`ponika.PonikaClient` is available under the same
+    name; methods performing requests must be awaited::
+
+        async with AsyncPonikaClient('192.168.1.1', 'admin', 'secret') as c:
+            status = await c.modems.status.get_status()
+
+    Pass ``http_client`` to share one ``httpx.AsyncClient`` and its connection
+    limits between many device clients. A :class:`ponika.pool.SharedPool`
+    passed as ``pool`` does the same, capped at its ``max_connections``.
+    """
+
+    __slots__ = ('_http_client', '_owns_http_client')
+
+    def __init__(
+        self,
+        *args: Any,
+        http_client: httpx.AsyncClient | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Accept the arguments of :class:`ponika.PonikaClient`."""
+        client = _BridgedPonikaClient(*args, **kwargs)
+        config = client._config
+        pool = kwargs.get('pool')
+        if http_client is None and pool is not None:
+            http_client = _pool_http_client(pool, config.verify_tls)
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or httpx.AsyncClient(
+            verify=config.verify_tls,
+            timeout=None,
+            limits=httpx.Limits(
+                max_connections=config.pool_maxsize
+                if config.pool_block
+                else None,
+                max_keepalive_connections=config.pool_maxsize
+                if config.keep_alive
+                else 0,
+            ),
+        )
+        client._request.close()
+        client._request = _AsyncSession(self._http_client)
+        super().__init__(client)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ClientConfig,
+        **kwargs: Any,
+    ) -> 'AsyncPonikaClient':
+        """Create a client from a :class:`ponika.ClientConfig`.
+
+        Keyword arguments take precedence over fields of ``config``.
+        """
+        return cls(**{**config.model_dump(), **kwargs})
+
+    @property
+    def sync_client(self) -> PonikaClient:
+        """The bridged synchronous client driving this async client."""
+        return self._target
+
+    async def aclose(self) -> None:
+        """Close the underlying ``httpx.AsyncClient`` if this client owns it."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> 'AsyncPonikaClient':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f'AsyncPonikaClient(host={self._target._config.host!r})'
@@ -0,0 +1,174 @@
+"""Cache of GET responses that change rarely, such as device metadata.
+
+Pass a cache to the client, or share one between the clients of a fleet::
+
+    cache = ResponseCache()
+    client = PonikaClient(..., cache=cache)
+    client.system.device.get_status()  # fetched
+    client.system.device.get_status()  # served from the cache
+
+Only endpoints with a time to live are cached, by default the ones listed in
+:data:`METADATA_TTLS` whose data changes with firmware upgrades. TTLs are
+keyed by path template, see :class:`ponika.stats.StatsCollector`. The least
+recently used responses are dropped beyond ``maxsize``.
+
+Responses are cached per device and username, as accounts may see different
+data. A write (``POST``, ``PUT`` or ``DELETE``) to a device drops the cached
+responses of the same device below the first segment of its path, for all
+usernames, so updating ``/system/...`` clears ``/system/device/status``.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from time import monotonic
+from typing import TYPE_CHECKING, Optional
+
+import requests
+
+from ponika.stats import path_template
+
+if TYPE_CHECKING:
+    from ponika import PonikaClient
+    from ponika.middleware import ApiRequest, Handler
+
+
+# Seconds to keep responses that only change with firmware upgrades.
+METADATA_TTLS: Mapping[str, float] = {
+    '/system/device/status': 3600.0,
+    '/system/device/packages/status': 3600.0,
+    '/system/device/parameters/status': 3600.0,
+    '/system/languages/options': 3600.0,
+    '/modems/countries/status': 3600.0,
+    '/sms_utilities/rules/options': 3600.0,
+}
+
+# Base URL of the device, username, path and encoded query parameters.
+_Key = tuple[str, str, str, str]
+
+
+class ResponseCache:
+    """Thread-safe TTL and LRU bounded cache of successful GET responses.
+
+    ``ttls`` maps path templates to seconds; other endpoints are cached for
+    ``default_ttl`` seconds, i.e. not at all unless it is raised.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = METADATA_TTLS,
+        default_ttl: float = 0.0,
+        maxsize: int = 256,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[_Key, tuple[float, requests.Response]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        # Bumped by invalidations, so that responses fetched while a write
+        # was under way are not stored. Writes only bump the counter of the
+        # device and first path segment they touch.
+        self._generation = 0
+        self._scope_generations: dict[tuple[str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, endpoint: str) -> float:
+        """Return the seconds responses of ``endpoint`` are kept."""
+        return self.ttls.get(path_template(endpoint), self.default_ttl)
+
+    def invalidate(
+        self, prefix: str = '', client: Optional['PonikaClient'] = None
+    ) -> None:
+        """Drop the responses whose path starts with ``prefix``.
+
+        Responses of all devices are dropped, or those of ``client``'s. Without
+        a prefix all of them are.
+        """
+        base_url = None if client is None else client._config.base_url
+        with self._lock:
+            self._generation += 1
+            self._drop(prefix, base_url)
+
+    def _drop(self, prefix: str, base_url: Optional[str]) -> None:
+        for key in [
+            key
+            for key in self._entries
+            if key[2].startswith(prefix)
+            and (base_url is None or key[0] == base_url)
+        ]:
+            del self._entries[key]
+
+    def _generation_of(self, scope: tuple[str, str]) -> tuple[int, int]:
+        return self._generation, self._scope_generations.get(scope, 0)
+
+    def __call__(
+        self, request: 'ApiRequest', call_next: 'Handler'
+    ) -> requests.Response:
+        if request.method != 'GET':
+            try:
+                return call_next(request)
+            finally:
+                scope = (request.client._config.base_url, _scope(request))
+                with self._lock:
+                    self._scope_generations[scope] = (
+                        self._scope_generations.get(scope, 0) + 1
+                    )
+                    self._drop(scope[1], scope[0])
+
+        ttl = self.ttl(request.endpoint)
+        if ttl <= 0:
+            return call_next(request)
+
+        base_url = request.client._config.base_url
+        key = (
+            base_url,
+            request.client._config.username,
+            str(request.endpoint),
+            json.dumps(request.params, sort_keys=True),
+        )
+        scope = (base_url, _scope(request))
+        now = monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+            generation = self._generation_of(scope)
+
+        if entry is not None and entry[0] > now:
+            if request.client.stats is not None:
+                request.client.stats.increment(request.endpoint, 'cache_hits')
+            return entry[1]
+
+        response = call_next(request)
+        if not _is_success(response):
+            return response
+        with self._lock:
+            if generation == self._generation_of(scope):
+                self._entries[key] = (monotonic() + ttl, response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return response
+
+
+def _scope(request: 'ApiRequest') -> str:
+    """Return the path prefix a write to ``request`` may change."""
+    return '/' + request.endpoint.lstrip('/').partition('/')[0] + '/'
+
+
+def _is_success(response: requests.Response) -> bool:
+    if response.status_code != 200:
+        return False
+    try:
+        body = json.loads(response.content)
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get('success') is True
@@ -0,0 +1,70 @@
+"""Single-flight execution of identical concurrent calls.
+
+When several threads, or tasks of :class:`ponika.aio.AsyncPonikaClient`, ask
+one client for the same resource at the same time, only the first sends the
+request. The others wait for it and share its result, or its exception.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from contextlib import AbstractContextManager
+from typing import Any, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call(Generic[T]):
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self, done: AbstractContextManager) -> None:
+        # Held by the caller running the call until it has finished.
+        self.done = done
+        self.value: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time, sharing its outcome.
+
+    ``create_lock`` makes the locks followers wait on, so that the async
+    client can provide ones that suspend the waiting task.
+    """
+
+    def __init__(self, create_lock: Callable[[], AbstractContextManager]):
+        self._create_lock = create_lock
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Return the result of ``fn`` and whether it came from another call.
+
+        ``fn`` runs unless a call with the same ``key`` is in flight, in which
+        case its result is awaited and returned instead.
+        """
+        call: _Call[T] = _Call(self._create_lock())
+        # Taken before the call is published, so it is never contended here.
+        call.done.__enter__()
+        with self._lock:
+            running = self._calls.setdefault(key, call)
+
+        if running is not call:
+            call.done.__exit__(None, None, None)
+            with running.done:
+                pass
+            if running.error is not None:
+                raise running.error
+            return running.value, True
+
+        try:
+            call.value = fn()
+            return call.value, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.__exit__(None, None, None)
@@ -1,8 +1,12 @@
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, field
+import json
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from hashlib import blake2b
 from typing import TYPE_CHECKING, Any, TypeAlias
 
+from pydantic_core import to_jsonable_python
+
 from ponika.endpoints import CRUDEndpoint
 from ponika.endpoints.auto_reboot.ping_wget import PingWgetCreatePayload
 from ponika.endpoints.auto_reboot.scheduler import SchedulerCreatePayload
@@ -29,7 +33,13 @@ from ponika.endpoints.zerotier.config import ZerotierConfigCreatePayload
 from ponika.endpoints.zerotier.networks import (
     ZerotierNetworkConfigCreatePayload,
 )
+from ponika.exceptions import (
+    TeltonikaApiException,
+    TeltonikaDeadlineExceeded,
+    TeltonikaLoginException,
+)
 from ponika.models import BaseModel, BasePayload
+from ponika.timeouts import deadline
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
@@ -39,6 +49,14 @@ ConfigValue: TypeAlias = BasePayload | BaseModel | Mapping[str, Any]
 ConfigSection: TypeAlias = Sequence[ConfigValue]
 ConfigDefinition: TypeAlias = Mapping[str, Mapping[str, ConfigSection]]
 
+# Sections whose items live below an item of another section, and are
+# written only once those have been.
+SECTION_DEPENDENCIES: Mapping[str, tuple[str, ...]] = {
+    'wireguard.peers': ('wireguard.config',),
+    'openvpn.tls_clients': ('openvpn.config',),
+    'zerotier.networks': ('zerotier.config',),
+}
+
 
 class RecipientsConfig(BaseModel):
     phone_groups: list[PhoneGroupCreatePayload] | None = None
@@ -155,25 +173,449 @@ class ConfigApplyResult:
         return [change for change in self.changes if change.action == action]
 
 
+# Bumped when the JSON form of ConfigPlan changes incompatibly.
+PLAN_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SectionPlan:
+    """Planned changes of one managed section.
+
+    ``params`` holds the path parameters of dynamic sections, such as the
+    ``interface_id`` of WireGuard peers. ``fingerprint`` is a digest of the
+    items read when planning, or ``None`` if they could not be read yet.
+    """
+
+    section: str
+    changes: list[ConfigChange] = field(default_factory=list)
+    fingerprint: str | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ConfigPlan(ConfigApplyResult):
+    """Changes computed by :meth:`ConfigApplier.plan`, for later apply.
+
+    ``changes`` lists the changes of all ``sections`` in order. Plans
+    round-trip through :meth:`to_json` and :meth:`from_json`.
+    """
+
+    sections: list[SectionPlan] = field(default_factory=list)
+    delete_unmanaged: bool = True
+
+    @classmethod
+    def from_sections(
+        cls, sections: list[SectionPlan], delete_unmanaged: bool = True
+    ) -> 'ConfigPlan':
+        return cls(
+            changes=[change for plan in sections for change in plan.changes],
+            sections=sections,
+            delete_unmanaged=delete_unmanaged,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the plan as JSON compatible data."""
+        return to_jsonable_python(
+            {
+                'version': PLAN_VERSION,
+                'delete_unmanaged': self.delete_unmanaged,
+                'sections': [asdict(plan) for plan in self.sections],
+            }
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'ConfigPlan':
+        if data.get('version') != PLAN_VERSION:
+            raise ValueError(
+                f'Unsupported config plan version: {data.get("version")!r}'
+            )
+        return cls.from_sections(
+            [
+                SectionPlan(
+                    section=plan['section'],
+                    changes=[
+                        ConfigChange(
+                            **{
+                                **change,
+                                'action': ConfigAction(change['action']),
+                            }
+                        )
+                        for change in plan['changes']
+                    ],
+                    fingerprint=plan['fingerprint'],
+                    params=plan['params'],
+                )
+                for plan in data['sections']
+            ],
+            delete_unmanaged=data['delete_unmanaged'],
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> 'ConfigPlan':
+        return cls.from_dict(json.loads(data))
+
+
+def dump_config(config: PonikaConfig | ConfigDefinition) -> ConfigDefinition:
+    """Return ``config`` as the plain mapping the applier works on.
+
+    Dump a config once before applying it to many devices.
+    """
+    if isinstance(config, PonikaConfig):
+        return config.model_dump(exclude_none=True)
+    return config
+
+
+def merge_configs(
+    base: PonikaConfig | ConfigDefinition,
+    override: PonikaConfig | ConfigDefinition,
+) -> ConfigDefinition:
+    """Return ``base`` with the sections set in ``override`` replaced.
+
+    Sections are replaced as a whole, other sections of the same group are
+    kept, e.g. overriding ``recipients.phone_groups`` keeps the
+    ``email_users`` of ``base``.
+    """
+    merged = dict(dump_config(base))
+    for group_name, group_config in dump_config(override).items():
+        current = merged.get(group_name)
+        if isinstance(current, Mapping) and isinstance(group_config, Mapping):
+            merged[group_name] = {**current, **group_config}
+        else:
+            merged[group_name] = group_config
+    return merged
+
+
+@dataclass(frozen=True)
+class _ManagedSection:
+    section: str
+    endpoint: CRUDEndpoint
+    desired_items: ConfigSection
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+
 class ConfigApplier:
     """Apply declarative configuration sections to a Ponika device.
 
     The applier reconciles only sections present in the given config. For each
     managed section it creates missing items, updates changed items and deletes
     existing items that are not present in the desired configuration.
+
+    The current items of all managed sections are read up front, and the
+    changes are computed from that snapshot. Sections are then written
+    concurrently, except that a section listed in ``dependencies`` waits for
+    the sections it depends on. At most ``max_concurrency`` requests to the
+    device are in flight at a time. Where the endpoint allows it, updates
+    and deletes of a section are sent through ``update_bulk`` and
+    ``delete_bulk``, at most ``bulk_size`` items per request.
+
+    To review changes before making them, :meth:`plan` returns them as a
+    :class:`ConfigPlan` that :meth:`apply_plan` carries out later without
+    reading the device again.
     """
 
-    def __init__(self, client: 'PonikaClient') -> None:
+    def __init__(
+        self,
+        client: 'PonikaClient',
+        bulk_size: int = 100,
+        max_concurrency: int = 4,
+        dependencies: Mapping[str, Collection[str]] = SECTION_DEPENDENCIES,
+    ) -> None:
+        if bulk_size < 1:
+            raise ValueError('bulk_size must be at least 1.')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1.')
+
         self._client = client
+        self.bulk_size = bulk_size
+        self.max_concurrency = max_concurrency
+        self.dependencies = dict(dependencies)
 
     def apply(
         self,
         config: PonikaConfig | ConfigDefinition,
         dry_run: bool = False,
         delete_unmanaged: bool = True,
+        timeout: float | None = None,
     ) -> ConfigApplyResult:
-        changes: list[ConfigChange] = []
+        """Reconcile the device with ``config``.
+
+        ``timeout`` limits all reads and writes to that many seconds in total.
+        Once it is spent the next request raises
+        :class:`ponika.exceptions.TeltonikaDeadlineExceeded`; changes made so
+        far are not rolled back.
+        """
+        with deadline(timeout):
+            sections = list(self._managed_sections(config))
+            plan = self._plan(sections, delete_unmanaged)
+            if dry_run:
+                return ConfigApplyResult(changes=plan.changes)
+            return self._apply_plan(sections, plan, verify=False)
+
+    def plan(
+        self,
+        config: PonikaConfig | ConfigDefinition,
+        delete_unmanaged: bool = True,
+        timeout: float | None = None,
+    ) -> ConfigPlan:
+        """Read the device and return the changes ``apply`` would make.
+
+        Nothing is written. Pass the plan, or its JSON form, to
+        :meth:`apply_plan` to make the changes.
+        """
+        with deadline(timeout):
+            return self._plan(
+                list(self._managed_sections(config)), delete_unmanaged
+            )
+
+    def apply_plan(
+        self,
+        plan: ConfigPlan | Mapping[str, Any] | str | bytes,
+        verify: bool = False,
+        timeout: float | None = None,
+    ) -> ConfigApplyResult:
+        """Make the changes of a plan returned by :meth:`plan`.
+
+        Sections are written as planned, without reading them first. A
+        section is read and diffed again if a write fails and its current
+        items no longer match the fingerprint of the plan, if it could not
+        be read when planning, or, with ``verify``, if its fingerprint does
+        not match before writing. The result lists the changes made.
+        """
+        if isinstance(plan, (str, bytes)):
+            plan = ConfigPlan.from_json(plan)
+        elif not isinstance(plan, ConfigPlan):
+            plan = ConfigPlan.from_dict(plan)
+
+        with deadline(timeout):
+            sections = [
+                self._resolve(section_plan) for section_plan in plan.sections
+            ]
+            return self._apply_plan(sections, plan, verify)
+
+    def _plan(
+        self, sections: list[_ManagedSection], delete_unmanaged: bool
+    ) -> ConfigPlan:
+        parents = self._parents(sections)
+        self._write_order(parents)
+        snapshot = self._client._map(
+            lambda index: self._read(sections[index], bool(parents[index])),
+            list(range(len(sections))),
+            self.max_concurrency,
+        )
+        return ConfigPlan.from_sections(
+            [
+                SectionPlan(
+                    section=managed.section,
+                    changes=self.apply_endpoint(
+                        endpoint=managed.endpoint,
+                        desired_items=managed.desired_items,
+                        section=managed.section,
+                        dry_run=True,
+                        delete_unmanaged=delete_unmanaged,
+                        existing_items=existing_items or [],
+                    ),
+                    fingerprint=None
+                    if existing_items is None
+                    else self._fingerprint(existing_items),
+                    params=dict(managed.params),
+                )
+                for managed, existing_items in zip(sections, snapshot)
+            ],
+            delete_unmanaged=delete_unmanaged,
+        )
 
+    def _apply_plan(
+        self,
+        sections: list[_ManagedSection],
+        plan: ConfigPlan,
+        verify: bool,
+    ) -> ConfigApplyResult:
+        apply_section = (
+            self._verify_section_plan if verify else self._apply_section_plan
+        )
+        parents = self._parents(sections)
+        written = self._run_ordered(
+            parents,
+            self._write_order(parents),
+            lambda index: apply_section(
+                sections[index], plan.sections[index], plan.delete_unmanaged
+            ),
+        )
+        return ConfigApplyResult(
+            changes=[change for changes in written for change in changes]
+        )
+
+    def _apply_section_plan(
+        self,
+        managed: _ManagedSection,
+        section_plan: SectionPlan,
+        delete_unmanaged: bool,
+    ) -> list[ConfigChange]:
+        if section_plan.fingerprint is None:
+            return self._replan(managed, delete_unmanaged)
+
+        try:
+            self._write(managed.endpoint, section_plan.changes)
+        except (TeltonikaDeadlineExceeded, TeltonikaLoginException):
+            raise
+        except TeltonikaApiException:
+            existing_items = managed.endpoint.get_config()
+            if self._fingerprint(existing_items) == section_plan.fingerprint:
+                raise
+            # The section changed since it was planned.
+            return self._replan(managed, delete_unmanaged, existing_items)
+        return section_plan.changes
+
+    def _verify_section_plan(
+        self,
+        managed: _ManagedSection,
+        section_plan: SectionPlan,
+        delete_unmanaged: bool,
+    ) -> list[ConfigChange]:
+        existing_items = managed.endpoint.get_config()
+        if self._fingerprint(existing_items) != section_plan.fingerprint:
+            return self._replan(managed, delete_unmanaged, existing_items)
+        self._write(managed.endpoint, section_plan.changes)
+        return section_plan.changes
+
+    def _replan(
+        self,
+        managed: _ManagedSection,
+        delete_unmanaged: bool,
+        existing_items: ConfigSection | None = None,
+    ) -> list[ConfigChange]:
+        return self.apply_endpoint(
+            endpoint=managed.endpoint,
+            desired_items=managed.desired_items,
+            section=managed.section,
+            delete_unmanaged=delete_unmanaged,
+            existing_items=existing_items,
+        )
+
+    def _run_ordered(
+        self,
+        parents: list[frozenset[int]],
+        order: list[int],
+        fn: Callable[[int], list[ConfigChange]],
+    ) -> list[list[ConfigChange]]:
+        """Call ``fn`` for every section once those it depends on are done.
+
+        Returns the results in section order.
+        """
+        done = [self._client._create_event() for _ in parents]
+        failed: set[int] = set()
+
+        def run(index: int) -> list[ConfigChange]:
+            try:
+                for parent in parents[index]:
+                    done[parent].wait()
+                # The error of the parent is raised by _map.
+                if failed & parents[index]:
+                    failed.add(index)
+                    return []
+                return fn(index)
+            except BaseException:
+                failed.add(index)
+                raise
+            finally:
+                done[index].set()
+
+        # Parents come first, so they hold a worker whenever a dependent
+        # waits for them.
+        results = dict(
+            zip(order, self._client._map(run, order, self.max_concurrency))
+        )
+        return [results[index] for index in range(len(parents))]
+
+    def _parents(
+        self, sections: list[_ManagedSection]
+    ) -> list[frozenset[int]]:
+        """Return the indexes of the sections each section depends on."""
+        return [
+            frozenset(
+                index
+                for index, other in enumerate(sections)
+                if other.section in self.dependencies.get(managed.section, ())
+            )
+            for managed in sections
+        ]
+
+    def _write_order(self, parents: list[frozenset[int]]) -> list[int]:
+        """Sort sections so that each comes after those it depends on."""
+        order: list[int] = []
+        placed: set[int] = set()
+        while len(order) < len(parents):
+            ready = [
+                index
+                for index, section_parents in enumerate(parents)
+                if index not in placed and section_parents <= placed
+            ]
+            if not ready:
+                raise ValueError('Config section dependencies form a cycle.')
+            order.extend(ready)
+            placed.update(ready)
+        return order
+
+    def _read(
+        self, managed: _ManagedSection, has_parents: bool
+    ) -> ConfigSection | None:
+        """Return the current items of a section, if they can be read yet.
+
+        The parent of a dependent section, e.g. the WireGuard interface of
+        its peers, may only be created by this apply. Such sections are read
+        again once their parents have been written.
+        """
+        try:
+            return managed.endpoint.get_config()
+        except (TeltonikaDeadlineExceeded, TeltonikaLoginException):
+            raise
+        except TeltonikaApiException:
+            if not has_parents:
+                raise
+            return None
+
+    def _fingerprint(self, items: ConfigSection) -> str:
+        """Return a digest of the current items of a section."""
+        data = to_jsonable_python([self._to_data(item) for item in items])
+        encoded = json.dumps(data, sort_keys=True).encode()
+        return blake2b(encoded, digest_size=16).hexdigest()
+
+    def _resolve(self, section_plan: SectionPlan) -> _ManagedSection:
+        """Return the endpoint and desired items of a planned section."""
+        group_name, _, section_name = section_plan.section.partition('.')
+        endpoint = getattr(self._client, group_name, None)
+        if section_name:
+            endpoint = getattr(endpoint, section_name, None)
+        if endpoint is not None and section_plan.params:
+            endpoint = endpoint.config(**section_plan.params)
+        if endpoint is None or not self._is_reconcile_endpoint(endpoint):
+            raise ValueError(f'Unknown config section: {section_plan.section}')
+
+        id_field = endpoint.config_id_field
+        desired_items = []
+        for change in section_plan.changes:
+            if change.action == ConfigAction.DELETE:
+                continue
+            desired = dict(change.desired or {})
+            # Updates carry the id of the matched item, which the desired
+            # item only had if it was matched by it.
+            if change.match_field != id_field:
+                desired.pop(id_field, None)
+            desired_items.append(desired)
+        return _ManagedSection(
+            section_plan.section,
+            endpoint,
+            desired_items,
+            section_plan.params,
+        )
+
+    def _managed_sections(
+        self, config: PonikaConfig | ConfigDefinition
+    ) -> Iterator['_ManagedSection']:
+        """Resolve the endpoints of all sections included in ``config``."""
         for group_name, group_config in self._config_to_mapping(
             config
         ).items():
@@ -182,15 +624,7 @@ class ConfigApplier:
                 raise ValueError(f'Unknown config group: {group_name}')
 
             if self._is_reconcile_endpoint(group):
-                changes.extend(
-                    self.apply_endpoint(
-                        endpoint=group,
-                        desired_items=group_config,
-                        section=group_name,
-                        dry_run=dry_run,
-                        delete_unmanaged=delete_unmanaged,
-                    )
-                )
+                yield _ManagedSection(group_name, group, group_config)
                 continue
 
             for section_name, desired_items in group_config.items():
@@ -199,48 +633,31 @@ class ConfigApplier:
                     raise ValueError(
                         f'Unknown config section: {group_name}.{section_name}'
                     )
+                section = f'{group_name}.{section_name}'
                 if self._is_reconcile_endpoint(endpoint):
-                    changes.extend(
-                        self.apply_endpoint(
-                            endpoint=endpoint,
-                            desired_items=desired_items,
-                            section=f'{group_name}.{section_name}',
-                            dry_run=dry_run,
-                            delete_unmanaged=delete_unmanaged,
-                        )
-                    )
+                    yield _ManagedSection(section, endpoint, desired_items)
                     continue
 
                 if self._is_dynamic_config_section(endpoint, desired_items):
                     for dynamic_config in desired_items:
-                        dynamic_endpoint = endpoint.config(
-                            **self._dynamic_path_params(dynamic_config)
-                        )
-                        changes.extend(
-                            self.apply_endpoint(
-                                endpoint=dynamic_endpoint,
-                                desired_items=dynamic_config['items'],
-                                section=f'{group_name}.{section_name}',
-                                dry_run=dry_run,
-                                delete_unmanaged=delete_unmanaged,
-                            )
+                        params = self._dynamic_path_params(dynamic_config)
+                        yield _ManagedSection(
+                            section,
+                            endpoint.config(**params),
+                            dynamic_config['items'],
+                            params,
                         )
                     continue
 
-                if not self._is_reconcile_endpoint(endpoint):
-                    raise ValueError(
-                        f'Config section {group_name}.{section_name} does not '
-                        'support CRUD reconciliation.'
-                    )
-
-        return ConfigApplyResult(changes=changes)
+                raise ValueError(
+                    f'Config section {section} does not support CRUD '
+                    'reconciliation.'
+                )
 
     def _config_to_mapping(
         self, config: PonikaConfig | ConfigDefinition
     ) -> ConfigDefinition:
-        if isinstance(config, PonikaConfig):
-            return config.model_dump(exclude_none=True)
-        return config
+        return dump_config(config)
 
     def _is_reconcile_endpoint(self, endpoint: Any) -> bool:
         return isinstance(endpoint, CRUDEndpoint) or all(
@@ -286,8 +703,15 @@ class ConfigApplier:
         section: str,
         dry_run: bool = False,
         delete_unmanaged: bool = True,
+        existing_items: ConfigSection | None = None,
     ) -> list[ConfigChange]:
-        existing_items = endpoint.get_config()
+        """Reconcile one endpoint with ``desired_items``.
+
+        The current items are read from the endpoint unless already known,
+        as ``existing_items``.
+        """
+        if existing_items is None:
+            existing_items = endpoint.get_config()
         desired_data = [self._to_data(item) for item in desired_items]
         existing_data = [self._to_data(item) for item in existing_items]
 
@@ -297,7 +721,6 @@ class ConfigApplier:
         )
         existing_by_key = self._index_existing(existing_data, match_fields)
         matched_existing_ids: set[Any] = set()
-        deleted_existing_ids: set[Any] = set()
 
         changes: list[ConfigChange] = []
         for key, desired_item in desired_by_key.items():
@@ -305,8 +728,6 @@ class ConfigApplier:
             existing_item = existing_by_key.get(key)
 
             if existing_item is None:
-                if not dry_run:
-                    endpoint.create(endpoint.create_model(**desired_item))
                 changes.append(
                     ConfigChange(
                         section=section,
@@ -332,8 +753,6 @@ class ConfigApplier:
                     endpoint.config_id_field: item_id,
                     **desired_item,
                 }
-                if not dry_run:
-                    endpoint.update(endpoint.update_model(**update_data))
                 changes.append(
                     ConfigChange(
                         section=section,
@@ -356,9 +775,29 @@ class ConfigApplier:
                     )
                 )
 
-        if not delete_unmanaged:
-            return changes
+        if delete_unmanaged:
+            changes.extend(
+                self._plan_deletes(
+                    endpoint,
+                    existing_by_key,
+                    matched_existing_ids,
+                    section,
+                )
+            )
+
+        if not dry_run:
+            self._write(endpoint, changes)
+        return changes
 
+    def _plan_deletes(
+        self,
+        endpoint: CRUDEndpoint,
+        existing_by_key: dict[tuple[str, Any], dict[str, Any]],
+        matched_existing_ids: set[Any],
+        section: str,
+    ) -> list[ConfigChange]:
+        deleted_existing_ids: set[Any] = set()
+        changes: list[ConfigChange] = []
         for key, existing_item in existing_by_key.items():
             item_id = existing_item.get(endpoint.config_id_field)
             if item_id is None:
@@ -372,8 +811,6 @@ class ConfigApplier:
             ):
                 continue
 
-            if not dry_run:
-                endpoint.delete(item_id)
             deleted_existing_ids.add(item_id)
             changes.append(
                 ConfigChange(
@@ -387,6 +824,54 @@ class ConfigApplier:
 
         return changes
 
+    def _write(
+        self, endpoint: CRUDEndpoint, changes: list[ConfigChange]
+    ) -> None:
+        """Send the updates, creates and deletes among ``changes``."""
+        # Payloads are built first, so that invalid items fail before any
+        # write is made.
+        updates = [
+            endpoint.update_model(**change.desired)
+            for change in changes
+            if change.action == ConfigAction.UPDATE
+        ]
+        creates = [
+            endpoint.create_model(**change.desired)
+            for change in changes
+            if change.action == ConfigAction.CREATE
+        ]
+        deletes = [
+            change.existing[endpoint.config_id_field]
+            for change in changes
+            if change.action == ConfigAction.DELETE
+        ]
+
+        # Bulk updates identify items by the id in their body.
+        if (
+            len(updates) > 1
+            and getattr(endpoint, 'allow_bulk_update', False)
+            and not getattr(endpoint, 'bulk_update_strip_item_id', True)
+        ):
+            for chunk in self._chunks(updates):
+                endpoint.update_bulk(chunk)
+        else:
+            for payload in updates:
+                endpoint.update(payload)
+
+        for payload in creates:
+            endpoint.create(payload)
+
+        if len(deletes) > 1 and getattr(endpoint, 'allow_bulk_delete', False):
+            for chunk in self._chunks(deletes):
+                endpoint.delete_bulk(chunk)
+        else:
+            for item_id in deletes:
+                endpoint.delete(item_id)
+
+    def _chunks(self, items: list[Any]) -> Iterator[list[Any]]:
+        for start in range(0, len(items), self.bulk_size):
+            yield items[start : start + self.bulk_size]
+
     def _index_desired(
         self,
         items: list[dict[str, Any]],
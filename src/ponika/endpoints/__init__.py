@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,10 +11,9 @@ from typing import (
     overload,
 )
 
-from pydantic import ValidationError
-
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload, slim_model
+from ponika.parsing import ParseMode
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
@@ -27,6 +27,31 @@ TDeleteResponse = TypeVar('TDeleteResponse', bound=BaseModel)
 TStatusResponseModel = TypeVar('TStatusResponseModel', bound=BaseModel)
 
 
+class EndpointPath(str):
+    """Request path that remembers the template it was formatted from.
+
+    Behaves like the formatted path everywhere; the template groups requests
+    to the same API route, e.g. in :class:`ponika.stats.StatsCollector`.
+    """
+
+    template: str
+
+    def __new__(cls, path: str, template: str | None = None) -> 'EndpointPath':
+        instance = super().__new__(cls, path)
+        instance.template = path if template is None else template
+        return instance
+
+    @classmethod
+    def from_template(cls, template: str, **values: Any) -> 'EndpointPath':
+        return cls(template.format(**values), template)
+
+
+def item_path(path: str, item_id: str | int) -> EndpointPath:
+    """Return the path of item ``item_id`` below ``path``."""
+    template = getattr(path, 'template', path)
+    return EndpointPath(f'{path}/{item_id}', f'{template}/{{id}}')
+
+
 class Endpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
@@ -38,15 +63,35 @@ class StatusEndpoint(Generic[TStatusResponseModel]):
     allow_status_with_id: bool = True
 
     @overload
-    def get_status(self, item_id: int | str) -> TStatusResponseModel: ...
+    def get_status(
+        self,
+        item_id: int | str,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> TStatusResponseModel: ...
 
     @overload
-    def get_status(self) -> List[TStatusResponseModel]: ...
+    def get_status(
+        self,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> List[TStatusResponseModel]: ...
 
     def get_status(
-        self, item_id: int | str | None = None
+        self,
+        item_id: int | str | None = None,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
     ) -> List[TStatusResponseModel] | TStatusResponseModel:
-        """Fetch wireless interfaces status from the device."""
+        """Fetch wireless interfaces status from the device.
+
+        ``parse_mode`` overrides the parse mode of the client for this call,
+        see ``ponika.parsing``. ``fields`` limits the result to those fields
+        of the status model, see ``ponika.models.slim_model``.
+        """
         if item_id is None and not self.allow_status_without_id:
             raise ValueError(
                 f'{self.__class__.__name__}.get_status() without item_id is not available for this endpoint.'
@@ -58,26 +103,20 @@ class StatusEndpoint(Generic[TStatusResponseModel]):
             )
 
         endpoint = (
-            f'{self.status_endpoint_path}/{item_id}'
+            item_path(self.status_endpoint_path, item_id)
             if item_id
             else f'{self.status_endpoint_path}'
         )
-        ResultType = (
+        model = (
             self.status_response_model
-            if item_id
-            else List[self.status_response_model]
+            if fields is None
+            else slim_model(self.status_response_model, fields)
         )
+        ResultType = model if item_id else list[model]
 
-        response = self._client._get(endpoint)
-        try:
-            response_obj = ApiResponse[ResultType].model_validate(response)
-        except ValidationError as e:
-            print(f'Error during request: GET {endpoint}')
-            print(
-                f'Error during response validation to class ApiResponse[{ResultType}]'
-            )
-            print(f'Response we got: {response}')
-            raise e
+        response_obj = self._client._get_response(
+            endpoint, ResultType, parse_mode=parse_mode
+        )
 
         if not response_obj.success:
             raise TeltonikaApiException(response_obj.errors)
@@ -93,7 +132,7 @@ class DeleteEndpoint(Generic[TDeleteResponse]):
 
     def delete(self, item_id: str | int) -> TDeleteResponse:
         response = self._client._delete(
-            endpoint=f'{self.endpoint_path}/{item_id}',
+            endpoint=item_path(self.endpoint_path, item_id),
             data_model=self.delete_reponse_model,
         )
         if not response.success:
@@ -158,7 +197,7 @@ class UpdateEndpoint(Generic[TItemUpdatePayload, TConfigResponse]):
         payload: TItemUpdatePayload | dict,
     ) -> TConfigResponse:
         response = self._client._put_data(
-            endpoint=f'{self.endpoint_path}/{item_id}',
+            endpoint=item_path(self.endpoint_path, item_id),
             params=payload,
             data_model=self.config_response_model,
         )
@@ -197,17 +236,12 @@ class UpdateEndpoint(Generic[TItemUpdatePayload, TConfigResponse]):
             data.append(item_data)
 
         endpoint = self.bulk_endpoint_path or self.endpoint_path
-        response = self._client._put(
+        response_obj = self._client._put(
             endpoint=endpoint,
-            data_model=object,
+            data_model=list[self.config_response_model],
             params={'data': data},
         )
 
-        response_model = ApiResponse[List[self.config_response_model]]
-        response_obj = response_model.model_validate(
-            response.model_dump(mode='python')
-        )
-
         if not response_obj.success or response_obj.data is None:
             raise TeltonikaApiException(response_obj.errors)
         return cast(List[TConfigResponse], response_obj.data)
@@ -228,30 +262,39 @@ class ReadEndpoint(Generic[TConfigResponse]):
     config_response_model = Type[TConfigResponse]
 
     @overload
-    def get_config(self, item_id: int | str) -> TConfigResponse: ...
+    def get_config(
+        self,
+        item_id: int | str,
+        *,
+        parse_mode: ParseMode | str | None = None,
+    ) -> TConfigResponse: ...
 
     @overload
-    def get_config(self) -> List[TConfigResponse]: ...
+    def get_config(
+        self, *, parse_mode: ParseMode | str | None = None
+    ) -> List[TConfigResponse]: ...
 
     def get_config(
         self,
         item_id: str | int | None = None,
+        *,
+        parse_mode: ParseMode | str | None = None,
     ) -> List[TConfigResponse] | TConfigResponse:
         endpoint = (
-            f'{self.endpoint_path}/{item_id}'
+            item_path(self.endpoint_path, item_id)
             if item_id
             else self.endpoint_path
         )
 
-        response_model = (
-            ApiResponse[self.config_response_model]
+        data_model = (
+            self.config_response_model
             if item_id
-            else ApiResponse[list[self.config_response_model]]
+            else list[self.config_response_model]
         )
 
-        response = self._client._get(endpoint)
-
-        response = response_model.model_validate(response)
+        response = self._client._get_response(
+            endpoint, data_model, parse_mode=parse_mode
+        )
 
         if not response.success:
             raise TeltonikaApiException(response.errors)
@@ -305,4 +348,6 @@ class DynamicPathCRUDEndpoint(
 
     @property
     def endpoint_path(self) -> str:  # type: ignore[override]
-        return self.endpoint_path_template.format(**self._path_params)
+        return EndpointPath.from_template(
+            self.endpoint_path_template, **self._path_params
+        )
@@ -1,14 +1,34 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.auto_reboot.ping_wget import PingWgetEndpoint
-from ponika.endpoints.auto_reboot.scheduler import SchedulerEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.auto_reboot.ping_wget import PingWgetEndpoint
+    from ponika.endpoints.auto_reboot.scheduler import SchedulerEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'PingWgetEndpoint': 'ponika.endpoints.auto_reboot.ping_wget',
+        'SchedulerEndpoint': 'ponika.endpoints.auto_reboot.scheduler',
+    },
+)
 
 
 class AutoRebootEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.scheduler = SchedulerEndpoint(client)
-        self.ping_wget = PingWgetEndpoint(client)
+
+    @cached_property
+    def scheduler(self) -> 'SchedulerEndpoint':
+        from ponika.endpoints.auto_reboot.scheduler import SchedulerEndpoint
+
+        return SchedulerEndpoint(self._client)
+
+    @cached_property
+    def ping_wget(self) -> 'PingWgetEndpoint':
+        from ponika.endpoints.auto_reboot.ping_wget import PingWgetEndpoint
+
+        return PingWgetEndpoint(self._client)
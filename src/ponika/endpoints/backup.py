@@ -6,7 +6,7 @@ from pydantic import model_validator
 
 from ponika.endpoints import Endpoint
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 
 class BackupEncryptInfoPayload(BasePayload):
@@ -55,8 +55,8 @@ class BackupStatusResponse(BaseModel):
 
 class BackupEndpoint(Endpoint):
     def get_status(self) -> BackupStatusResponse:
-        response = ApiResponse[BackupStatusResponse].model_validate(
-            self._client._get('/backup/status')
+        response = self._client._get_response(
+            '/backup/status', BackupStatusResponse
         )
 
         if not response.success:
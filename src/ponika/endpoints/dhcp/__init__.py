@@ -1,17 +1,58 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
-from ponika.endpoints.dhcp.servers_ipv4 import IPv4ServerEndpoint
-from ponika.endpoints.dhcp.servers_ipv6 import IPv6ServerEndpoint
-from ponika.endpoints.dhcp.static_leases_ipv4 import StaticLeasesIPv4Endpoint
-from ponika.endpoints.dhcp.static_leases_ipv6 import StaticLeasesIPv6Endpoint
+
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.dhcp.servers_ipv4 import IPv4ServerEndpoint
+    from ponika.endpoints.dhcp.servers_ipv6 import IPv6ServerEndpoint
+    from ponika.endpoints.dhcp.static_leases_ipv4 import (
+        StaticLeasesIPv4Endpoint,
+    )
+    from ponika.endpoints.dhcp.static_leases_ipv6 import (
+        StaticLeasesIPv6Endpoint,
+    )
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'IPv4ServerEndpoint': 'ponika.endpoints.dhcp.servers_ipv4',
+        'IPv6ServerEndpoint': 'ponika.endpoints.dhcp.servers_ipv6',
+        'StaticLeasesIPv4Endpoint': 'ponika.endpoints.dhcp.static_leases_ipv4',
+        'StaticLeasesIPv6Endpoint': 'ponika.endpoints.dhcp.static_leases_ipv6',
+    },
+)
 
 
 class DHCPEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.server_ipv4 = IPv4ServerEndpoint(client)
-        self.server_ipv6 = IPv6ServerEndpoint(client)
-        self.static_leases_ipv4 = StaticLeasesIPv4Endpoint(client)
-        self.static_leases_ipv6 = StaticLeasesIPv6Endpoint(client)
+
+    @cached_property
+    def server_ipv4(self) -> 'IPv4ServerEndpoint':
+        from ponika.endpoints.dhcp.servers_ipv4 import IPv4ServerEndpoint
+
+        return IPv4ServerEndpoint(self._client)
+
+    @cached_property
+    def server_ipv6(self) -> 'IPv6ServerEndpoint':
+        from ponika.endpoints.dhcp.servers_ipv6 import IPv6ServerEndpoint
+
+        return IPv6ServerEndpoint(self._client)
+
+    @cached_property
+    def static_leases_ipv4(self) -> 'StaticLeasesIPv4Endpoint':
+        from ponika.endpoints.dhcp.static_leases_ipv4 import (
+            StaticLeasesIPv4Endpoint,
+        )
+
+        return StaticLeasesIPv4Endpoint(self._client)
+
+    @cached_property
+    def static_leases_ipv6(self) -> 'StaticLeasesIPv6Endpoint':
+        from ponika.endpoints.dhcp.static_leases_ipv6 import (
+            StaticLeasesIPv6Endpoint,
+        )
+
+        return StaticLeasesIPv6Endpoint(self._client)
@@ -10,7 +10,8 @@ from typing import TYPE_CHECKING, List
 
 from ponika.endpoints.dhcp.enums import DHCPMode
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
+from ponika.parsing import ParseMode
 
 
 if TYPE_CHECKING:
@@ -85,12 +86,14 @@ class IPv4ServerEndpoint(
 
     status_response_model = DhcpIpv4ServersStatusResponse
 
-    def get_dynamic_leases(self) -> List[DynamicLease]:
+    def get_dynamic_leases(
+        self, *, parse_mode: ParseMode | str | None = None
+    ) -> List[DynamicLease]:
         endpoint = '/dhcp/leases/ipv4/status'
 
-        response = self._client._get(endpoint)
-
-        response = ApiResponse[List[DynamicLease]].model_validate(response)
+        response = self._client._get_response(
+            endpoint, List[DynamicLease], parse_mode=parse_mode
+        )
 
         if not response.success:
             raise TeltonikaApiException(response.errors)
@@ -9,7 +9,8 @@ from pydantic import ConfigDict, Field
 from typing import TYPE_CHECKING, List
 
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
+from ponika.parsing import ParseMode
 
 from ponika.endpoints.wireless.enums import WifiMode
 
@@ -90,12 +91,14 @@ class IPv6ServerEndpoint(
 
     status_response_model = DhcpIpv6ServersStatusResponse
 
-    def get_dynamic_leases(self) -> List[DynamicLease]:
+    def get_dynamic_leases(
+        self, *, parse_mode: ParseMode | str | None = None
+    ) -> List[DynamicLease]:
         endpoint = '/dhcp/leases/ipv6/status'
 
-        response = self._client._get(endpoint)
-
-        response = ApiResponse[List[DynamicLease]].model_validate(response)
+        response = self._client._get_response(
+            endpoint, List[DynamicLease], parse_mode=parse_mode
+        )
 
         if not response.success:
             raise TeltonikaApiException(response.errors)
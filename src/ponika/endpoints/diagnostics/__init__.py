@@ -1,12 +1,26 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.diagnostics.actions import ActionsEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.diagnostics.actions import ActionsEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ActionsEndpoint': 'ponika.endpoints.diagnostics.actions',
+    },
+)
 
 
 class DiagnosticsEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.actions = ActionsEndpoint(client)
+
+    @cached_property
+    def actions(self) -> 'ActionsEndpoint':
+        from ponika.endpoints.diagnostics.actions import ActionsEndpoint
+
+        return ActionsEndpoint(self._client)
@@ -1,13 +1,27 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
+
 from ponika.endpoints import Endpoint
-from ponika.endpoints.firmware.device import FirmwareDeviceEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.firmware.device import FirmwareDeviceEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'FirmwareDeviceEndpoint': 'ponika.endpoints.firmware.device',
+    },
+)
 
 
 class FirmwareEndpoint(Endpoint):
     def __init__(self, client: 'PonikaClient') -> None:
         super().__init__(client)
 
-        self.device = FirmwareDeviceEndpoint(client)
+    @cached_property
+    def device(self) -> 'FirmwareDeviceEndpoint':
+        from ponika.endpoints.firmware.device import FirmwareDeviceEndpoint
+
+        return FirmwareDeviceEndpoint(self._client)
@@ -3,7 +3,7 @@ from ponika.endpoints import Endpoint
 from pydantic import BaseModel
 
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse
+from ponika.timeouts import deadline
 
 
 class FirmwareDeviceStatusResponse(BaseModel):
@@ -47,8 +47,8 @@ class FirmwareDeviceFotaUpdateStatusResponse(BaseModel):
 
 class FirmwareDeviceEndpoint(Endpoint):
     def get_status(self) -> FirmwareDeviceStatusResponse:
-        response = ApiResponse[FirmwareDeviceStatusResponse].model_validate(
-            self._client._get('/firmware/device/status')
+        response = self._client._get_response(
+            '/firmware/device/status', FirmwareDeviceStatusResponse
         )
 
         if not response.success:
@@ -57,9 +57,10 @@ class FirmwareDeviceEndpoint(Endpoint):
         return response.data
 
     def get_progress_status(self) -> FirmwareDeviceProgressStatusResponse:
-        response = ApiResponse[
-            FirmwareDeviceProgressStatusResponse
-        ].model_validate(self._client._get('/firmware/device/progress/status'))
+        response = self._client._get_response(
+            '/firmware/device/progress/status',
+            FirmwareDeviceProgressStatusResponse,
+        )
 
         if not response.success:
             raise TeltonikaApiException(response.errors)
@@ -67,9 +68,10 @@ class FirmwareDeviceEndpoint(Endpoint):
         return response.data
 
     def get_fota_update_status(self) -> FirmwareDeviceFotaUpdateStatusResponse:
-        response = ApiResponse[
-            FirmwareDeviceFotaUpdateStatusResponse
-        ].model_validate(self._client._get('/firmware/device/updates/status'))
+        response = self._client._get_response(
+            '/firmware/device/updates/status',
+            FirmwareDeviceFotaUpdateStatusResponse,
+        )
 
         if not response.success:
             raise TeltonikaApiException(response.errors)
@@ -121,6 +123,22 @@ class FirmwareDeviceEndpoint(Endpoint):
 
         return response.data
 
+    def upload_and_verify_firmware(
+        self,
+        file_path: str,
+        keep_settings: bool = True,
+        suppress_validation: bool = False,
+        timeout: float | None = None,
+    ) -> FirmwareDeviceUploadResponse:
+        """Upload a firmware image and verify it on the device.
+
+        ``timeout`` limits the upload and the verification to that many
+        seconds in total, see :func:`ponika.timeouts.deadline`.
+        """
+        with deadline(timeout):
+            self.upload_firmware(file_path, keep_settings, suppress_validation)
+            return self.verify_uploaded_firmware()
+
     def delete_uploaded_firmware(self) -> FirmwareDeviceUploadDeleteResponse:
         response = self._client._post(
             endpoint='/firmware/actions/delete_device_firmware',
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Literal, Optional
 from pydantic import BaseModel
 from typing import TYPE_CHECKING
@@ -11,7 +12,10 @@ if TYPE_CHECKING:
 class GpsEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.position = self.GpsPositionEndpoint(client)
+
+    @cached_property
+    def position(self) -> 'GpsPositionEndpoint':
+        return self.GpsPositionEndpoint(self._client)
 
     class GetGlobalResponseData(BaseModel):
         """Data model for GET /gps/global response."""
@@ -27,8 +31,8 @@ class GpsEndpoint:
 
     def get_global(self) -> 'ApiResponse[GetGlobalResponseData]':
         """Fetch global GPS config."""
-        return ApiResponse[self.GetGlobalResponseData].model_validate(
-            self._client._get('/gps/global')
+        return self._client._get_response(
+            '/gps/global', self.GetGlobalResponseData
         )
 
     class GpsStatusResponseData(BaseModel):
@@ -39,8 +43,8 @@ class GpsEndpoint:
 
     def get_status(self) -> 'ApiResponse[GpsStatusResponseData]':
         """Fetch GPS status from the device."""
-        return ApiResponse[self.GpsStatusResponseData].model_validate(
-            self._client._get('/gps/status')
+        return self._client._get_response(
+            '/gps/status', self.GpsStatusResponseData
         )
 
     class GpsPositionEndpoint:
@@ -64,6 +68,6 @@ class GpsEndpoint:
         def get_status(self) -> 'ApiResponse[GpsPositionResponseData]':
             """Fetch GPS position status from the device."""
 
-            return ApiResponse[self.GpsPositionResponseData].model_validate(
-                self._client._get('/gps/position/status')
+            return self._client._get_response(
+                '/gps/position/status', self.GpsPositionResponseData
             )
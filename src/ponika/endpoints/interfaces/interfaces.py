@@ -3,7 +3,7 @@ from typing import Any
 
 from pydantic import Field
 
-from ponika.endpoints import CRUDEndpoint, StatusEndpoint
+from ponika.endpoints import CRUDEndpoint, StatusEndpoint, item_path
 from ponika.exceptions import TeltonikaApiException
 from ponika.models import BaseModel, BasePayload
 
@@ -228,7 +228,7 @@ class InterfacesEndpoint(
 
     def delete(self, item_id: str | int) -> InterfaceDeleteResponse:
         response = self._client._delete(
-            endpoint=f'{self.endpoint_path}/{item_id}',
+            endpoint=item_path(self.endpoint_path, item_id),
             data_model=InterfaceDeleteResponse,
         )
         if not response.success:
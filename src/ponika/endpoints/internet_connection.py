@@ -26,6 +26,6 @@ class InternetConnectionEndpoint:
 
     def get_status(self) -> 'ApiResponse[InternetStatusResponseData]':
         """Fetch Internet status from the device."""
-        return ApiResponse[self.InternetStatusResponseData].model_validate(
-            self._client._get('/internet_connection/status')
+        return self._client._get_response(
+            '/internet_connection/status', self.InternetStatusResponseData
         )
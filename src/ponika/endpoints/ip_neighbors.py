@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List, Optional
 from pydantic import BaseModel
 from typing import TYPE_CHECKING
@@ -11,8 +12,14 @@ if TYPE_CHECKING:
 class IpNeighborsEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.ipv4 = self.Ipv4NeighborsEndpoint(client)
-        self.ipv6 = self.Ipv6NeighborsEndpoint(client)
+
+    @cached_property
+    def ipv4(self) -> 'Ipv4NeighborsEndpoint':
+        return self.Ipv4NeighborsEndpoint(self._client)
+
+    @cached_property
+    def ipv6(self) -> 'Ipv6NeighborsEndpoint':
+        return self.Ipv6NeighborsEndpoint(self._client)
 
     class Ipv4NeighborsEndpoint:
         def __init__(self, client: 'PonikaClient') -> None:
@@ -40,9 +47,10 @@ class IpNeighborsEndpoint:
             self,
         ) -> 'ApiResponse[List[Ipv4NeighborResponseDataItem]]':
             """Fetch IPv4 neighbors from the device."""
-            return ApiResponse[
-                List[self.Ipv4NeighborResponseDataItem]
-            ].model_validate(self._client._get('/ip_neighbors/ipv4/status'))
+            return self._client._get_response(
+                '/ip_neighbors/ipv4/status',
+                List[self.Ipv4NeighborResponseDataItem],
+            )
 
     class Ipv6NeighborsEndpoint:
         def __init__(self, client: 'PonikaClient') -> None:
@@ -70,6 +78,7 @@ class IpNeighborsEndpoint:
             self,
         ) -> 'ApiResponse[List[Ipv6NeighborResponseDataItem]]':
             """Fetch IPv6 neighbors from the device."""
-            return ApiResponse[
-                List[self.Ipv6NeighborResponseDataItem]
-            ].model_validate(self._client._get('/ip_neighbors/ipv6/status'))
+            return self._client._get_response(
+                '/ip_neighbors/ipv6/status',
+                List[self.Ipv6NeighborResponseDataItem],
+            )
@@ -1,14 +1,34 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.ip_routes.ipv4 import IPv4RouteEndpoint
-from ponika.endpoints.ip_routes.ipv6 import Ipv6RouteEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.ip_routes.ipv4 import IPv4RouteEndpoint
+    from ponika.endpoints.ip_routes.ipv6 import Ipv6RouteEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'IPv4RouteEndpoint': 'ponika.endpoints.ip_routes.ipv4',
+        'Ipv6RouteEndpoint': 'ponika.endpoints.ip_routes.ipv6',
+    },
+)
 
 
 class IPRouteEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.routes_ipv4 = IPv4RouteEndpoint(client)
-        self.routes_ipv6 = Ipv6RouteEndpoint(client)
+
+    @cached_property
+    def routes_ipv4(self) -> 'IPv4RouteEndpoint':
+        from ponika.endpoints.ip_routes.ipv4 import IPv4RouteEndpoint
+
+        return IPv4RouteEndpoint(self._client)
+
+    @cached_property
+    def routes_ipv6(self) -> 'Ipv6RouteEndpoint':
+        from ponika.endpoints.ip_routes.ipv6 import Ipv6RouteEndpoint
+
+        return Ipv6RouteEndpoint(self._client)
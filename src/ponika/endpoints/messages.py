@@ -5,7 +5,7 @@ from pydantic import field_validator
 
 from ponika.endpoints import Endpoint
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
@@ -65,11 +65,8 @@ class MessagesEndpoint(Endpoint):
 
     def read(self) -> List[MessagesStatusResponseItem]:
         """Fetch messages from the device."""
-        response_model = ApiResponse[List[MessagesStatusResponseItem]]
-        response = response_model.model_validate(
-            self._client._get(
-                '/messages/status',
-            )
+        response = self._client._get_response(
+            '/messages/status', List[MessagesStatusResponseItem]
         )
 
         if not response.success or response.data is None:
@@ -1,12 +1,33 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.modems.actions import ModemActionsEndpoint
-from ponika.endpoints.modems.global_config import ModemGlobalConfigEndpoint
-from ponika.endpoints.modems.sim_cards import ModemSimCardsEndpoint
-from ponika.endpoints.modems.status import ModemStatus, ModemStatusEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ponika import PonikaClient
+    from ponika.endpoints.modems.actions import ModemActionsEndpoint
+    from ponika.endpoints.modems.global_config import (
+        ModemGlobalConfigEndpoint,
+    )
+    from ponika.endpoints.modems.sim_cards import ModemSimCardsEndpoint
+    from ponika.parsing import ParseMode
+    from ponika.endpoints.modems.status import (
+        ModemStatus,
+        ModemStatusEndpoint,
+    )
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ModemActionsEndpoint': 'ponika.endpoints.modems.actions',
+        'ModemGlobalConfigEndpoint': 'ponika.endpoints.modems.global_config',
+        'ModemSimCardsEndpoint': 'ponika.endpoints.modems.sim_cards',
+        'ModemStatus': 'ponika.endpoints.modems.status',
+        'ModemStatusEndpoint': 'ponika.endpoints.modems.status',
+    },
+)
 
 
 class ModemsEndpoint:
@@ -14,15 +35,43 @@ class ModemsEndpoint:
 
     def __init__(self, client: 'PonikaClient') -> None:
         self._client = client
-        self.status = ModemStatusEndpoint(client)
-        self.global_config = ModemGlobalConfigEndpoint(client)
-        self.actions = ModemActionsEndpoint(client)
-        self.sim_cards = ModemSimCardsEndpoint(client)
+
+    @cached_property
+    def status(self) -> 'ModemStatusEndpoint':
+        from ponika.endpoints.modems.status import ModemStatusEndpoint
+
+        return ModemStatusEndpoint(self._client)
+
+    @cached_property
+    def global_config(self) -> 'ModemGlobalConfigEndpoint':
+        from ponika.endpoints.modems.global_config import (
+            ModemGlobalConfigEndpoint,
+        )
+
+        return ModemGlobalConfigEndpoint(self._client)
+
+    @cached_property
+    def actions(self) -> 'ModemActionsEndpoint':
+        from ponika.endpoints.modems.actions import ModemActionsEndpoint
+
+        return ModemActionsEndpoint(self._client)
+
+    @cached_property
+    def sim_cards(self) -> 'ModemSimCardsEndpoint':
+        from ponika.endpoints.modems.sim_cards import ModemSimCardsEndpoint
+
+        return ModemSimCardsEndpoint(self._client)
 
     def get_status(
-        self, modem_id: str | None = None
-    ) -> ModemStatus | list[ModemStatus]:
+        self,
+        modem_id: str | None = None,
+        *,
+        parse_mode: 'ParseMode | str | None' = None,
+        fields: 'Iterable[str] | None' = None,
+    ) -> 'ModemStatus | list[ModemStatus]':
         """Backward-compatible shortcut for :meth:`status.get_status`."""
         if modem_id is None:
-            return self.status.get_status()
-        return self.status.get_status(modem_id)
+            return self.status.get_status(parse_mode=parse_mode, fields=fields)
+        return self.status.get_status(
+            modem_id, parse_mode=parse_mode, fields=fields
+        )
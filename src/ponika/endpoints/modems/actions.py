@@ -2,7 +2,7 @@ from typing import Optional
 
 from pydantic import Field
 
-from ponika.endpoints import Endpoint
+from ponika.endpoints import Endpoint, EndpointPath
 from ponika.endpoints.modems.common import (
     EmptyModemActionResponse,
     ensure_success,
@@ -74,7 +74,9 @@ class ModemActionsEndpoint(Endpoint):
     ) -> SendUssdResponse:
         return response_data(
             self._client._post_data(
-                endpoint=f'/modems/{modem_id}/actions/send_ussd',
+                endpoint=EndpointPath.from_template(
+                    '/modems/{modem_id}/actions/send_ussd', modem_id=modem_id
+                ),
                 data_model=SendUssdResponse,
                 params=payload,
             )
@@ -83,7 +85,10 @@ class ModemActionsEndpoint(Endpoint):
     def scan_network(self, modem_id: str) -> list[ScanNetworkResponse]:
         return response_data(
             self._client._post(
-                endpoint=f'/modems/{modem_id}/actions/scan_network',
+                endpoint=EndpointPath.from_template(
+                    '/modems/{modem_id}/actions/scan_network',
+                    modem_id=modem_id,
+                ),
                 data_model=list[ScanNetworkResponse],
             )
         )
@@ -94,7 +99,9 @@ class ModemActionsEndpoint(Endpoint):
     def exec_at(self, modem_id: str, payload: ExecAtPayload) -> ExecAtResponse:
         return response_data(
             self._client._post_data(
-                endpoint=f'/modems/{modem_id}/actions/exec_at',
+                endpoint=EndpointPath.from_template(
+                    '/modems/{modem_id}/actions/exec_at', modem_id=modem_id
+                ),
                 data_model=ExecAtResponse,
                 params=payload,
             )
@@ -108,7 +115,9 @@ class ModemActionsEndpoint(Endpoint):
     ) -> SimUnblockResponse:
         return response_data(
             self._client._post_data(
-                endpoint=f'/modems/{modem_id}/actions/sim_unblock',
+                endpoint=EndpointPath.from_template(
+                    '/modems/{modem_id}/actions/sim_unblock', modem_id=modem_id
+                ),
                 data_model=SimUnblockResponse,
                 params=payload,
             )
@@ -122,7 +131,9 @@ class ModemActionsEndpoint(Endpoint):
     ) -> ChangePinResponse:
         return response_data(
             self._client._post_data(
-                endpoint=f'/modems/{modem_id}/actions/change_pin',
+                endpoint=EndpointPath.from_template(
+                    '/modems/{modem_id}/actions/change_pin', modem_id=modem_id
+                ),
                 data_model=ChangePinResponse,
                 params=payload,
             )
@@ -133,7 +144,9 @@ class ModemActionsEndpoint(Endpoint):
 
     def _empty_action(self, modem_id: str, action: str) -> None:
         response = self._client._post(
-            endpoint=f'/modems/{modem_id}/actions/{action}',
+            endpoint=EndpointPath.from_template(
+                f'/modems/{{modem_id}}/actions/{action}', modem_id=modem_id
+            ),
             data_model=EmptyModemActionResponse,
         )
         ensure_success(response)
@@ -142,7 +155,9 @@ class ModemActionsEndpoint(Endpoint):
         self, modem_id: str, action: str, payload: BasePayload
     ) -> None:
         response = self._client._post_data(
-            endpoint=f'/modems/{modem_id}/actions/{action}',
+            endpoint=EndpointPath.from_template(
+                f'/modems/{{modem_id}}/actions/{action}', modem_id=modem_id
+            ),
             data_model=EmptyModemActionResponse,
             params=payload,
         )
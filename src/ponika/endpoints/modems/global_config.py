@@ -1,8 +1,8 @@
 from typing import Optional
 
-from ponika.endpoints import Endpoint
+from ponika.endpoints import Endpoint, EndpointPath
 from ponika.endpoints.modems.common import response_data
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 
 class ModemGlobalConfigResponse(BaseModel):
@@ -17,16 +17,21 @@ class ModemGlobalConfigUpdatePayload(BasePayload):
 
 class ModemGlobalConfigEndpoint(Endpoint):
     def get(self, modem_id: str) -> ModemGlobalConfigResponse:
-        response = self._client._get(f'/modems/{modem_id}/global')
-        return response_data(
-            ApiResponse[ModemGlobalConfigResponse].model_validate(response)
+        response = self._client._get_response(
+            EndpointPath.from_template(
+                '/modems/{modem_id}/global', modem_id=modem_id
+            ),
+            ModemGlobalConfigResponse,
         )
+        return response_data(response)
 
     def update(
         self, modem_id: str, payload: ModemGlobalConfigUpdatePayload
     ) -> ModemGlobalConfigResponse:
         response = self._client._put_data(
-            endpoint=f'/modems/{modem_id}/global',
+            endpoint=EndpointPath.from_template(
+                '/modems/{modem_id}/global', modem_id=modem_id
+            ),
             data_model=ModemGlobalConfigResponse,
             params=payload,
         )
@@ -2,7 +2,7 @@ from typing import Optional
 
 from pydantic import Field, field_validator
 
-from ponika.endpoints import Endpoint
+from ponika.endpoints import Endpoint, EndpointPath, item_path
 from ponika.endpoints.modems.common import response_data
 from ponika.endpoints.modems.enums import (
     BandSelection,
@@ -19,7 +19,7 @@ from ponika.endpoints.modems.enums import (
     UmtsBand,
     VolteMode,
 )
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 
 class SimCardOptionsBase:
@@ -80,15 +80,15 @@ class ModemSimCardsEndpoint(Endpoint):
     def get_config(
         self, modem_id: str, sim_id: str | None = None
     ) -> SimCardConfigResponse | list[SimCardConfigResponse]:
-        endpoint = f'/modems/{modem_id}/sim_cards/config'
+        endpoint = EndpointPath.from_template(
+            '/modems/{modem_id}/sim_cards/config', modem_id=modem_id
+        )
         if sim_id is not None:
-            endpoint = f'{endpoint}/{sim_id}'
+            endpoint = item_path(endpoint, sim_id)
             model = SimCardConfigResponse
         else:
             model = list[SimCardConfigResponse]
-        response = ApiResponse[model].model_validate(
-            self._client._get(endpoint)
-        )
+        response = self._client._get_response(endpoint, model)
         return response_data(response)
 
     def update(
@@ -98,7 +98,11 @@ class ModemSimCardsEndpoint(Endpoint):
         payload: SimCardUpdatePayload,
     ) -> SimCardConfigResponse:
         response = self._client._put_data(
-            endpoint=f'/modems/{modem_id}/sim_cards/config/{sim_id}',
+            endpoint=EndpointPath.from_template(
+                '/modems/{modem_id}/sim_cards/config/{id}',
+                modem_id=modem_id,
+                id=sim_id,
+            ),
             data_model=SimCardConfigResponse,
             params=payload,
         )
@@ -108,7 +112,9 @@ class ModemSimCardsEndpoint(Endpoint):
         self, modem_id: str, payloads: list[SimCardBulkUpdatePayload]
     ) -> list[SimCardConfigResponse]:
         response = self._client._put(
-            endpoint=f'/modems/{modem_id}/sim_cards/config',
+            endpoint=EndpointPath.from_template(
+                '/modems/{modem_id}/sim_cards/config', modem_id=modem_id
+            ),
             data_model=list[SimCardConfigResponse],
             params={'data': [payload.asdict() for payload in payloads]},
         )
@@ -1,8 +1,10 @@
-from typing import Any, Optional, overload
+from collections.abc import Iterable
+from functools import cache
+from typing import TYPE_CHECKING, Any, Optional, TypedDict, overload
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
-from ponika.endpoints import Endpoint
+from ponika.endpoints import Endpoint, item_path
 from ponika.endpoints.modems.common import response_data
 from ponika.endpoints.modems.enums import (
     ApnAuthentication,
@@ -23,7 +25,11 @@ from ponika.endpoints.modems.enums import (
     SimState,
     SimStateId,
 )
-from ponika.models import ApiResponse, BaseModel
+from ponika.models import BaseModel, slim_model, type_adapter
+from ponika.parsing import ParseMode
+
+if TYPE_CHECKING:
+    from ponika import PonikaClient
 
 
 class ModemCellInfo(BaseModel):
@@ -162,19 +168,66 @@ class ModemOfflineStatus(BaseModel):
 
 ModemStatus = ModemOnlineStatus | ModemOfflineStatus
 MODEM_STATUS_OFFLINE_FIELDS = frozenset({'offline', 'blocked', 'disabled'})
-MODEM_STATUS_ADAPTERS = {
-    True: TypeAdapter(ModemOfflineStatus),
-    False: TypeAdapter(ModemOnlineStatus),
+MODEM_STATUS_MODELS = {
+    True: ModemOfflineStatus,
+    False: ModemOnlineStatus,
 }
+MODEM_STATUS_FIELDS = frozenset(
+    ModemOnlineStatus.model_fields.keys()
+    | ModemOfflineStatus.model_fields.keys()
+)
 
 
-def parse_modem_status(data: Any) -> ModemStatus:
-    """Parse status without allowing a failed online model to become offline."""
+def parse_modem_status(
+    data: Any,
+    parse_mode: ParseMode = ParseMode.VALIDATE,
+    fields: frozenset[str] | None = None,
+) -> ModemStatus:
+    """Parse status without allowing a failed online model to become offline.
+
+    With ``fields``, only those of them that the online or offline model
+    has are parsed, into a slim model, or kept in raw mode.
+    """
+    if parse_mode is ParseMode.RAW:
+        if fields is None or not isinstance(data, dict):
+            return data
+        keys = _modem_status_projection(fields)[0].__optional_keys__
+        return {key: value for key, value in data.items() if key in keys}
     if not isinstance(data, dict):
-        return TypeAdapter(ModemStatus).validate_python(data)
+        return type_adapter(ModemStatus).validate_python(data)
 
     is_offline = bool(MODEM_STATUS_OFFLINE_FIELDS.intersection(data))
-    return MODEM_STATUS_ADAPTERS[is_offline].validate_python(data)
+    models = (
+        MODEM_STATUS_MODELS
+        if fields is None
+        else _modem_status_projection(fields)[1]
+    )
+    model = models[is_offline]
+    return type_adapter(model).validate_python(data)
+
+
+@cache
+def _modem_status_projection(
+    fields: frozenset[str],
+) -> tuple[Any, dict[bool, type[BaseModel]]]:
+    """Return the keys to decode and the slim models for ``fields``.
+
+    Responses are decoded into a dict of those keys only, which parses the
+    rest, e.g. cell info, without building Python objects for it.
+    """
+    models = {
+        is_offline: slim_model(model, fields & model.model_fields.keys())
+        for is_offline, model in MODEM_STATUS_MODELS.items()
+    }
+    keys = set(MODEM_STATUS_OFFLINE_FIELDS)
+    for model in models.values():
+        keys.update(
+            field.alias or name for name, field in model.model_fields.items()
+        )
+    status_keys = TypedDict(
+        'ModemStatusKeys', {key: Any for key in keys}, total=False
+    )
+    return status_keys, models
 
 
 class ModemApnStatus(BaseModel):
@@ -239,39 +292,90 @@ class ModemCountryStatus(BaseModel):
 
 
 class ModemStatusEndpoint(Endpoint):
+    def __init__(self, client: 'PonikaClient') -> None:
+        super().__init__(client)
+        # Data and result of the last call, per modem and parse options.
+        self._parsed: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+
     @overload
-    def get_status(self, modem_id: str) -> ModemStatus: ...
+    def get_status(
+        self,
+        modem_id: str,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> ModemStatus: ...
 
     @overload
-    def get_status(self) -> list[ModemStatus]: ...
+    def get_status(
+        self,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[ModemStatus]: ...
 
     def get_status(
-        self, modem_id: str | None = None
+        self,
+        modem_id: str | None = None,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
     ) -> ModemStatus | list[ModemStatus]:
+        """Fetch the status of one or all modems.
+
+        ``fields`` names the fields to parse, e.g. ``('rssi', 'state')``.
+        Offline modems get those that ``ModemOfflineStatus`` has.
+        """
         endpoint = '/modems/status'
         if modem_id is not None:
-            endpoint = f'{endpoint}/{modem_id}'
-
-        response = ApiResponse[Any].model_validate(self._client._get(endpoint))
+            endpoint = item_path(endpoint, modem_id)
+
+        if fields is not None:
+            fields = frozenset(fields)
+            unknown = fields - MODEM_STATUS_FIELDS
+            if unknown:
+                raise ValueError(
+                    f'ModemStatus has no fields {", ".join(sorted(unknown))}'
+                )
+
+        data_model = Any
+        if fields is not None:
+            status_keys, _ = _modem_status_projection(fields)
+            data_model = (
+                status_keys if modem_id is not None else list[status_keys]
+            )
+
+        mode = self._client._parse_mode(parse_mode)
+        response = self._client._get_response(
+            endpoint, data_model, parse_mode=mode
+        )
         data = response_data(response)
+        # With reuse_unchanged, an unchanged body returns the same data.
+        call = (modem_id, mode, fields)
+        previous = self._parsed.get(call)
+        if previous is not None and previous[0] is data:
+            return previous[1]
+
         if modem_id is not None:
-            return parse_modem_status(data)
-        if not isinstance(data, list):
-            return TypeAdapter(list[ModemStatus]).validate_python(data)
-        return [parse_modem_status(item) for item in data]
+            result = parse_modem_status(data, mode, fields)
+        elif not isinstance(data, list):
+            result = type_adapter(list[ModemStatus]).validate_python(data)
+        else:
+            result = [parse_modem_status(item, mode, fields) for item in data]
+        if self._client._config.reuse_unchanged:
+            self._parsed[call] = (data, result)
+        return result
 
     def get_apns(
         self, modem_id: str | None = None
     ) -> list[ModemApnStatus] | list[ModemApnsStatus | ModemStatusError]:
         endpoint = '/modems/apns/status'
         if modem_id is not None:
-            endpoint = f'{endpoint}/{modem_id}'
+            endpoint = item_path(endpoint, modem_id)
             model = list[ModemApnStatus]
         else:
             model = list[ModemApnsStatus | ModemStatusError]
-        response = ApiResponse[model].model_validate(
-            self._client._get(endpoint)
-        )
+        response = self._client._get_response(endpoint, model)
         return response_data(response)
 
     def get_signal(
@@ -279,13 +383,11 @@ class ModemStatusEndpoint(Endpoint):
     ) -> list[ModemSignalStatus] | list[ModemSignalsStatus | ModemStatusError]:
         endpoint = '/modems/signal/status'
         if modem_id is not None:
-            endpoint = f'{endpoint}/{modem_id}'
+            endpoint = item_path(endpoint, modem_id)
             model = list[ModemSignalStatus]
         else:
             model = list[ModemSignalsStatus | ModemStatusError]
-        response = ApiResponse[model].model_validate(
-            self._client._get(endpoint)
-        )
+        response = self._client._get_response(endpoint, model)
         return response_data(response)
 
     def get_scan(
@@ -294,16 +396,14 @@ class ModemStatusEndpoint(Endpoint):
         endpoint = '/modems/scan/status'
         model = ModemScanStatus
         if modem_id is not None:
-            endpoint = f'{endpoint}/{modem_id}'
+            endpoint = item_path(endpoint, modem_id)
         else:
             model = list[ModemScansStatus]
-        response = ApiResponse[model].model_validate(
-            self._client._get(endpoint)
-        )
+        response = self._client._get_response(endpoint, model)
         return response_data(response)
 
     def get_countries(self) -> list[ModemCountryStatus]:
-        response = ApiResponse[list[ModemCountryStatus]].model_validate(
-            self._client._get('/modems/countries/status')
+        response = self._client._get_response(
+            '/modems/countries/status', list[ModemCountryStatus]
         )
         return response_data(response)
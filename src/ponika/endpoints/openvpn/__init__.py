@@ -1,14 +1,34 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.openvpn.config import ConfigEndpoint
-from ponika.endpoints.openvpn.tls_clients import TlsClientsEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.openvpn.config import ConfigEndpoint
+    from ponika.endpoints.openvpn.tls_clients import TlsClientsEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ConfigEndpoint': 'ponika.endpoints.openvpn.config',
+        'TlsClientsEndpoint': 'ponika.endpoints.openvpn.tls_clients',
+    },
+)
 
 
 class OpenvpnEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.config = ConfigEndpoint(client)
-        self.tls_clients = TlsClientsEndpoint(client)
+
+    @cached_property
+    def config(self) -> 'ConfigEndpoint':
+        from ponika.endpoints.openvpn.config import ConfigEndpoint
+
+        return ConfigEndpoint(self._client)
+
+    @cached_property
+    def tls_clients(self) -> 'TlsClientsEndpoint':
+        from ponika.endpoints.openvpn.tls_clients import TlsClientsEndpoint
+
+        return TlsClientsEndpoint(self._client)
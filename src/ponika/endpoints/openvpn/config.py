@@ -2,7 +2,12 @@ from typing import List
 
 from pydantic import Field, model_validator
 
-from ponika.endpoints import CRUDEndpoint, StatusEndpoint
+from ponika.endpoints import (
+    CRUDEndpoint,
+    EndpointPath,
+    StatusEndpoint,
+    item_path,
+)
 from ponika.endpoints.openvpn.enums import (
     OpenvpnAuth,
     OpenvpnAuthMode,
@@ -23,6 +28,7 @@ from ponika.endpoints.openvpn.enums import (
 )
 from ponika.exceptions import TeltonikaApiException
 from ponika.models import BaseModel, BasePayload
+from ponika.timeouts import deadline
 
 
 class OpenvpnConfigBase:
@@ -228,21 +234,28 @@ class ConfigEndpoint(
         self,
         payload: OpenvpnConfigCreatePayload,
         file_path: str,
+        timeout: float | None = None,
     ) -> OpenvpnConfigCreateWithUploadResponse:
+        """Create an instance and upload its configuration file.
+
+        ``timeout`` limits the three requests to that many seconds in total,
+        see :func:`ponika.timeouts.deadline`.
+        """
         if payload.configuration != OpenvpnConfiguration.CUSTOM:
             raise ValueError(
                 'create_with_config_upload requires '
                 'configuration=OpenvpnConfiguration.CUSTOM.'
             )
 
-        created = self.create(payload)
-        upload = self.upload_config(payload.name, file_path)
-        config = self.update(
-            OpenvpnConfigUpdatePayload(
-                id=payload.name,
-                config=upload.path,
+        with deadline(timeout):
+            created = self.create(payload)
+            upload = self.upload_config(payload.name, file_path)
+            config = self.update(
+                OpenvpnConfigUpdatePayload(
+                    id=payload.name,
+                    config=upload.path,
+                )
             )
-        )
         return OpenvpnConfigCreateWithUploadResponse(
             created=created,
             upload=upload,
@@ -255,7 +268,7 @@ class ConfigEndpoint(
         file_path: str,
     ) -> OpenvpnConfigUploadResponse:
         response = self._client._post_files(
-            endpoint=f'{self.endpoint_path}/{item_id}',
+            endpoint=item_path(self.endpoint_path, item_id),
             data_model=OpenvpnConfigUploadResponse,
             files={'file': file_path},
             params={'option': 'config'},
@@ -268,7 +281,9 @@ class ConfigEndpoint(
 
     def download_config(self, item_id: str | int) -> bytes:
         response = self._client._post_raw(
-            endpoint=f'/openvpn/{item_id}/actions/download'
+            endpoint=EndpointPath.from_template(
+                '/openvpn/{id}/actions/download', id=item_id
+            )
         )
         response.raise_for_status()
         return response.content
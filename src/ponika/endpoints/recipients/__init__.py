@@ -1,14 +1,36 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.recipients.email_users import EmailUsersEndpoint
-from ponika.endpoints.recipients.phone_groups import PhoneGroupsEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.recipients.email_users import EmailUsersEndpoint
+    from ponika.endpoints.recipients.phone_groups import PhoneGroupsEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'EmailUsersEndpoint': 'ponika.endpoints.recipients.email_users',
+        'PhoneGroupsEndpoint': 'ponika.endpoints.recipients.phone_groups',
+    },
+)
 
 
 class RecipientsEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.phone_groups = PhoneGroupsEndpoint(client)
-        self.email_users = EmailUsersEndpoint(client)
+
+    @cached_property
+    def phone_groups(self) -> 'PhoneGroupsEndpoint':
+        from ponika.endpoints.recipients.phone_groups import (
+            PhoneGroupsEndpoint,
+        )
+
+        return PhoneGroupsEndpoint(self._client)
+
+    @cached_property
+    def email_users(self) -> 'EmailUsersEndpoint':
+        from ponika.endpoints.recipients.email_users import EmailUsersEndpoint
+
+        return EmailUsersEndpoint(self._client)
@@ -1,6 +1,6 @@
 from typing import List
 
-from ponika.endpoints import CRUDEndpoint
+from ponika.endpoints import CRUDEndpoint, item_path
 from ponika.endpoints.recipients.common import (
     DeleteResponse,
     UploadFileResponse,
@@ -49,7 +49,7 @@ class PhoneGroupsEndpoint(
         self, item_id: str | int, file_path: str
     ) -> UploadFileResponse:
         response = self._client._post_files(
-            endpoint=f'{self.endpoint_path}/{item_id}',
+            endpoint=item_path(self.endpoint_path, item_id),
             data_model=UploadFileResponse,
             files={'file': file_path},
         )
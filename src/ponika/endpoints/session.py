@@ -19,6 +19,6 @@ class SessionEndpoint:
     def get_status(self) -> 'ApiResponse[SessionResponseData]':
         """Fetch session information from the device."""
 
-        return ApiResponse[self.SessionResponseData].model_validate(
-            self._client._get('/session/status')
+        return self._client._get_response(
+            '/session/status', self.SessionResponseData
         )
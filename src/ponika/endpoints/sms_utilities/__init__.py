@@ -1,12 +1,26 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.sms_utilities.rules import RulesEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.sms_utilities.rules import RulesEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'RulesEndpoint': 'ponika.endpoints.sms_utilities.rules',
+    },
+)
 
 
 class SmsUtilitiesEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.rules = RulesEndpoint(client)
+
+    @cached_property
+    def rules(self) -> 'RulesEndpoint':
+        from ponika.endpoints.sms_utilities.rules import RulesEndpoint
+
+        return RulesEndpoint(self._client)
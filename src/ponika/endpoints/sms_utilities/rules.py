@@ -14,7 +14,7 @@ from ponika.endpoints.sms_utilities.enums import (
     SmsRuleSimcard,
 )
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 
 class SmsRuleConfigBase:
@@ -112,9 +112,8 @@ class RulesEndpoint(
     config_match_fields = ('id', 'smstext')
 
     def get_options(self) -> SmsRuleOptionsResponse:
-        response = self._client._get('/sms_utilities/rules/options')
-        response_obj = ApiResponse[SmsRuleOptionsResponse].model_validate(
-            response
+        response_obj = self._client._get_response(
+            '/sms_utilities/rules/options', SmsRuleOptionsResponse
         )
 
         if not response_obj.success or response_obj.data is None:
@@ -1,22 +1,66 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.system.actions import ActionsEndpoint
-from ponika.endpoints.system.banner import BannerEndpoint
-from ponika.endpoints.system.buttons import ButtonsEndpoint
-from ponika.endpoints.system.device import DeviceEndpoint
-from ponika.endpoints.system.general import GeneralEndpoint
-from ponika.endpoints.system.led import LedEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.system.actions import ActionsEndpoint
+    from ponika.endpoints.system.banner import BannerEndpoint
+    from ponika.endpoints.system.buttons import ButtonsEndpoint
+    from ponika.endpoints.system.device import DeviceEndpoint
+    from ponika.endpoints.system.general import GeneralEndpoint
+    from ponika.endpoints.system.led import LedEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ActionsEndpoint': 'ponika.endpoints.system.actions',
+        'BannerEndpoint': 'ponika.endpoints.system.banner',
+        'ButtonsEndpoint': 'ponika.endpoints.system.buttons',
+        'DeviceEndpoint': 'ponika.endpoints.system.device',
+        'GeneralEndpoint': 'ponika.endpoints.system.general',
+        'LedEndpoint': 'ponika.endpoints.system.led',
+    },
+)
 
 
 class SystemEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
-        self._client = client
-        self.actions = ActionsEndpoint(client)
-        self.banner = BannerEndpoint(client)
-        self.buttons = ButtonsEndpoint(client)
-        self.general = GeneralEndpoint(client)
-        self.device = DeviceEndpoint(client)
-        self.led = LedEndpoint(client)
+        self._client: 'PonikaClient' = client
+
+    @cached_property
+    def actions(self) -> 'ActionsEndpoint':
+        from ponika.endpoints.system.actions import ActionsEndpoint
+
+        return ActionsEndpoint(self._client)
+
+    @cached_property
+    def banner(self) -> 'BannerEndpoint':
+        from ponika.endpoints.system.banner import BannerEndpoint
+
+        return BannerEndpoint(self._client)
+
+    @cached_property
+    def buttons(self) -> 'ButtonsEndpoint':
+        from ponika.endpoints.system.buttons import ButtonsEndpoint
+
+        return ButtonsEndpoint(self._client)
+
+    @cached_property
+    def general(self) -> 'GeneralEndpoint':
+        from ponika.endpoints.system.general import GeneralEndpoint
+
+        return GeneralEndpoint(self._client)
+
+    @cached_property
+    def device(self) -> 'DeviceEndpoint':
+        from ponika.endpoints.system.device import DeviceEndpoint
+
+        return DeviceEndpoint(self._client)
+
+    @cached_property
+    def led(self) -> 'LedEndpoint':
+        from ponika.endpoints.system.led import LedEndpoint
+
+        return LedEndpoint(self._client)
@@ -1,8 +1,8 @@
 from typing import Generic, TypeVar, cast
 
-from ponika.endpoints import Endpoint
+from ponika.endpoints import Endpoint, item_path
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 
 TConfig = TypeVar('TConfig', bound=BaseModel)
@@ -22,9 +22,7 @@ class ReadUpdateEndpoint(Endpoint, Generic[TConfig, TUpdate]):
             if item_id is not None
             else list[self.config_response_model]
         )
-        response = ApiResponse[data_model].model_validate(
-            self._client._get(endpoint)
-        )
+        response = self._client._get_response(endpoint, data_model)
         if not response.success or response.data is None:
             raise TeltonikaApiException(response.errors)
         return response.data
@@ -58,7 +56,7 @@ class ReadUpdateEndpoint(Endpoint, Generic[TConfig, TUpdate]):
 
     def _item_endpoint(self, item_id: str | int | None) -> str:
         return (
-            f'{self.endpoint_path}/{item_id}'
+            item_path(self.endpoint_path, item_id)
             if item_id is not None
             else self.endpoint_path
         )
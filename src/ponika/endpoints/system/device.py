@@ -1,8 +1,11 @@
+from collections.abc import Iterable
+
 from ponika.endpoints import Endpoint
 from pydantic import Field
 from ponika.endpoints.system.enums import DeviceParameterType
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel
+from ponika.models import BaseModel, slim_model
+from ponika.parsing import ParseMode
 
 
 class ManufacturingInfo(BaseModel):
@@ -234,12 +237,26 @@ class DeviceParameter(BaseModel):
 
 
 class DeviceEndpoint(Endpoint):
-    def get_status(self) -> DeviceStatusResponse:
-        return self._get('/system/device/status', DeviceStatusResponse)
+    def get_status(
+        self,
+        *,
+        parse_mode: ParseMode | str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> DeviceStatusResponse:
+        model = (
+            DeviceStatusResponse
+            if fields is None
+            else slim_model(DeviceStatusResponse, fields)
+        )
+        return self._get('/system/device/status', model, parse_mode)
 
-    def get_usage_status(self) -> DeviceUsageStatusResponse:
+    def get_usage_status(
+        self, *, parse_mode: ParseMode | str | None = None
+    ) -> DeviceUsageStatusResponse:
         return self._get(
-            '/system/device/usage/status', DeviceUsageStatusResponse
+            '/system/device/usage/status',
+            DeviceUsageStatusResponse,
+            parse_mode,
         )
 
     def get_load_status(self) -> list[list[float]]:
@@ -253,9 +270,14 @@ class DeviceEndpoint(Endpoint):
             '/system/device/parameters/status', list[DeviceParameter]
         )
 
-    def _get(self, endpoint: str, data_model):
-        response = ApiResponse[data_model].model_validate(
-            self._client._get(endpoint)
+    def _get(
+        self,
+        endpoint: str,
+        data_model,
+        parse_mode: ParseMode | str | None = ParseMode.VALIDATE,
+    ):
+        response = self._client._get_response(
+            endpoint, data_model, parse_mode=parse_mode
         )
         if not response.success or response.data is None:
             raise TeltonikaApiException(response.errors)
@@ -1,6 +1,6 @@
 from ponika.endpoints.system.common import ReadUpdateEndpoint
 from ponika.exceptions import TeltonikaApiException
-from ponika.models import ApiResponse, BaseModel, BasePayload
+from ponika.models import BaseModel, BasePayload
 
 
 class GeneralConfigBase:
@@ -36,8 +36,8 @@ class GeneralEndpoint(
     config_response_model = GeneralConfigResponse
 
     def get_languages(self) -> list[LanguageOption]:
-        response = ApiResponse[list[LanguageOption]].model_validate(
-            self._client._get('/system/languages/options')
+        response = self._client._get_response(
+            '/system/languages/options', list[LanguageOption]
         )
         if not response.success or response.data is None:
             raise TeltonikaApiException(response.errors)
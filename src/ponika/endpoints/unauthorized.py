@@ -21,8 +21,6 @@ class UnauthorizedEndpoint:
     def get_status(self) -> 'ApiResponse[UnauthorizedStatusResponseData]':
         """Fetch unauthorized status from the device."""
         self._client.logger.info('Accessing unauthorized endpoint...')
-        return ApiResponse[self.UnauthorizedStatusResponseData].model_validate(
-            self._client._get(
-                '/unauthorized/status',
-            )
+        return self._client._get_response(
+            '/unauthorized/status', self.UnauthorizedStatusResponseData
         )
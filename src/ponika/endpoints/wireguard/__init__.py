@@ -1,16 +1,42 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.wireguard.actions import ActionsEndpoint
-from ponika.endpoints.wireguard.config import ConfigEndpoint
-from ponika.endpoints.wireguard.peers import PeersEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.wireguard.actions import ActionsEndpoint
+    from ponika.endpoints.wireguard.config import ConfigEndpoint
+    from ponika.endpoints.wireguard.peers import PeersEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ActionsEndpoint': 'ponika.endpoints.wireguard.actions',
+        'ConfigEndpoint': 'ponika.endpoints.wireguard.config',
+        'PeersEndpoint': 'ponika.endpoints.wireguard.peers',
+    },
+)
 
 
 class WireguardEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.config = ConfigEndpoint(client)
-        self.actions = ActionsEndpoint(client)
-        self.peers = PeersEndpoint(client)
+
+    @cached_property
+    def config(self) -> 'ConfigEndpoint':
+        from ponika.endpoints.wireguard.config import ConfigEndpoint
+
+        return ConfigEndpoint(self._client)
+
+    @cached_property
+    def actions(self) -> 'ActionsEndpoint':
+        from ponika.endpoints.wireguard.actions import ActionsEndpoint
+
+        return ActionsEndpoint(self._client)
+
+    @cached_property
+    def peers(self) -> 'PeersEndpoint':
+        from ponika.endpoints.wireguard.peers import PeersEndpoint
+
+        return PeersEndpoint(self._client)
@@ -1,15 +1,42 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
-from ponika.endpoints.wireless.actions import ActionsEndpoint
-from ponika.endpoints.wireless.devices import DevicesEndpoint
-from ponika.endpoints.wireless.interfaces import InterfacesEndpoint
+
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.wireless.actions import ActionsEndpoint
+    from ponika.endpoints.wireless.devices import DevicesEndpoint
+    from ponika.endpoints.wireless.interfaces import InterfacesEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ActionsEndpoint': 'ponika.endpoints.wireless.actions',
+        'DevicesEndpoint': 'ponika.endpoints.wireless.devices',
+        'InterfacesEndpoint': 'ponika.endpoints.wireless.interfaces',
+    },
+)
 
 
 class WirelessEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.actions = ActionsEndpoint(client)
-        self.interfaces = InterfacesEndpoint(client)
-        self.devices = DevicesEndpoint(client)
+
+    @cached_property
+    def actions(self) -> 'ActionsEndpoint':
+        from ponika.endpoints.wireless.actions import ActionsEndpoint
+
+        return ActionsEndpoint(self._client)
+
+    @cached_property
+    def interfaces(self) -> 'InterfacesEndpoint':
+        from ponika.endpoints.wireless.interfaces import InterfacesEndpoint
+
+        return InterfacesEndpoint(self._client)
+
+    @cached_property
+    def devices(self) -> 'DevicesEndpoint':
+        from ponika.endpoints.wireless.devices import DevicesEndpoint
+
+        return DevicesEndpoint(self._client)
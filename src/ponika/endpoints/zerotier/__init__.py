@@ -1,14 +1,34 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ponika.endpoints.zerotier.config import ConfigEndpoint
-from ponika.endpoints.zerotier.networks import NetworksEndpoint
+from ponika.lazy import lazy_imports
 
 if TYPE_CHECKING:
     from ponika import PonikaClient
+    from ponika.endpoints.zerotier.config import ConfigEndpoint
+    from ponika.endpoints.zerotier.networks import NetworksEndpoint
+
+__getattr__ = lazy_imports(
+    __name__,
+    {
+        'ConfigEndpoint': 'ponika.endpoints.zerotier.config',
+        'NetworksEndpoint': 'ponika.endpoints.zerotier.networks',
+    },
+)
 
 
 class ZerotierEndpoint:
     def __init__(self, client: 'PonikaClient') -> None:
         self._client: 'PonikaClient' = client
-        self.config = ConfigEndpoint(client)
-        self.networks = NetworksEndpoint(client)
+
+    @cached_property
+    def config(self) -> 'ConfigEndpoint':
+        from ponika.endpoints.zerotier.config import ConfigEndpoint
+
+        return ConfigEndpoint(self._client)
+
+    @cached_property
+    def networks(self) -> 'NetworksEndpoint':
+        from ponika.endpoints.zerotier.networks import NetworksEndpoint
+
+        return NetworksEndpoint(self._client)
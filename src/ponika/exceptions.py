@@ -16,3 +16,13 @@ class TeltonikaLoginException(TeltonikaApiException):
 
     def __str__(self):
         return ', '.join([str(error) for error in self.errors])
+
+
+class TeltonikaDeadlineExceeded(TeltonikaApiException):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+        self.errors = args or ['The deadline of the operation was exceeded.']
+
+    def __str__(self):
+        return ', '.join([str(error) for error in self.errors])
@@ -0,0 +1,264 @@
+"""Run client calls against many devices concurrently."""
+
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from ponika import ClientConfig, PonikaClient
+
+if TYPE_CHECKING:
+    from ponika.aio import AsyncPonikaClient
+    from ponika.config import (
+        ConfigApplyResult,
+        ConfigDefinition,
+        PonikaConfig,
+    )
+
+
+T = TypeVar('T')
+
+# Called with the number of devices done, the number of devices and the
+# result of the device that just finished.
+Progress = Callable[[int, int, 'FleetResult[Any]'], None]
+
+
+@dataclass(frozen=True)
+class FleetResult(Generic[T]):
+    """Outcome of one fleet call on a single device."""
+
+    config: ClientConfig
+    value: T | None = None
+    error: BaseException | None = None
+
+    @property
+    def host(self) -> str:
+        return self.config.host
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Fleet:
+    """A group of devices addressed with the same client calls.
+
+    Clients are created on first use and reused for later runs, so every
+    device logs in once per fleet instead of once per call. Extra keyword
+    arguments, such as ``token_store``, are passed to every client::
+
+        fleet = Fleet(configs, max_workers=64)
+        for result in fleet.run(lambda c: c.modems.status.get_status()):
+            print(result.host, result.value if result.ok else result.error)
+    """
+
+    def __init__(
+        self,
+        configs: Iterable[ClientConfig],
+        max_workers: int = 32,
+        **client_options: Any,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+
+        self.configs: list[ClientConfig] = list(configs)
+        self.max_workers = max_workers
+        self.client_options = client_options
+        self._clients: dict[int, PonikaClient] = {}
+        self._async_clients: dict[int, 'AsyncPonikaClient'] = {}
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def client(self, index: int) -> PonikaClient:
+        """Return the synchronous client for ``configs[index]``."""
+        if index not in self._clients:
+            self._clients[index] = PonikaClient.from_config(
+                self.configs[index], **self.client_options
+            )
+        return self._clients[index]
+
+    def async_client(self, index: int) -> 'AsyncPonikaClient':
+        """Return the asyncio client for ``configs[index]``."""
+        from ponika.aio import AsyncPonikaClient
+
+        if index not in self._async_clients:
+            self._async_clients[index] = AsyncPonikaClient.from_config(
+                self.configs[index], **self.client_options
+            )
+        return self._async_clients[index]
+
+    def run(self, fn: Callable[[PonikaClient], T]) -> Iterator[FleetResult[T]]:
+        """Call ``fn`` for every device on a bounded thread pool.
+
+        Results are yielded as devices finish. Exceptions raised by ``fn`` are
+        captured in :attr:`FleetResult.error` and do not stop the batch.
+        """
+        if not self.configs:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.configs)),
+            thread_name_prefix='ponika-fleet',
+        )
+        try:
+            futures = [
+                executor.submit(self._call, index, fn)
+                for index in range(len(self.configs))
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def arun(
+        self, fn: Callable[['AsyncPonikaClient'], Awaitable[T]]
+    ) -> AsyncIterator[FleetResult[T]]:
+        """Await ``fn`` for every device with at most ``max_workers`` running.
+
+        This is the asyncio counterpart of :meth:`run` and requires the
+        ``async`` extra.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def call(index: int) -> FleetResult[T]:
+            async with semaphore:
+                try:
+                    value = await fn(self.async_client(index))
+                except Exception as e:
+                    return FleetResult(config=self.configs[index], error=e)
+                return FleetResult(config=self.configs[index], value=value)
+
+        tasks = [
+            asyncio.ensure_future(call(index))
+            for index in range(len(self.configs))
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def apply_config(
+        self,
+        config: 'PonikaConfig | ConfigDefinition',
+        overrides: Mapping[str, 'PonikaConfig | ConfigDefinition']
+        | None = None,
+        *,
+        dry_run: bool = False,
+        delete_unmanaged: bool = True,
+        timeout: float | None = None,
+        progress: Progress | None = None,
+        **applier_options: Any,
+    ) -> Iterator[FleetResult['ConfigApplyResult']]:
+        """Reconcile every device with ``config``, see :meth:`run`.
+
+        ``overrides`` maps hosts to sections replacing those of ``config``
+        on that device, see :func:`ponika.config.merge_configs`. Configs are
+        dumped once up front, not per device. ``progress`` is called as
+        devices finish. Other keyword arguments, such as ``bulk_size``, are
+        passed to every :class:`ponika.config.ConfigApplier`.
+        """
+        from ponika.config import ConfigApplier
+
+        desired = self._desired_configs(config, overrides)
+
+        def apply(client: PonikaClient) -> 'ConfigApplyResult':
+            return ConfigApplier(client, **applier_options).apply(
+                desired(client._config.host),
+                dry_run=dry_run,
+                delete_unmanaged=delete_unmanaged,
+                timeout=timeout,
+            )
+
+        for done, result in enumerate(self.run(apply), start=1):
+            if progress is not None:
+                progress(done, len(self.configs), result)
+            yield result
+
+    async def aapply_config(
+        self,
+        config: 'PonikaConfig | ConfigDefinition',
+        overrides: Mapping[str, 'PonikaConfig | ConfigDefinition']
+        | None = None,
+        *,
+        dry_run: bool = False,
+        delete_unmanaged: bool = True,
+        timeout: float | None = None,
+        progress: Progress | None = None,
+        **applier_options: Any,
+    ) -> AsyncIterator[FleetResult['ConfigApplyResult']]:
+        """Asyncio counterpart of :meth:`apply_config`, see :meth:`arun`."""
+        from ponika.aio import AsyncEndpoint
+        from ponika.config import ConfigApplier
+
+        desired = self._desired_configs(config, overrides)
+
+        async def apply(client: 'AsyncPonikaClient') -> 'ConfigApplyResult':
+            applier = ConfigApplier(client.sync_client, **applier_options)
+            return await AsyncEndpoint(applier).apply(
+                desired(client.sync_client._config.host),
+                dry_run=dry_run,
+                delete_unmanaged=delete_unmanaged,
+                timeout=timeout,
+            )
+
+        done = 0
+        async for result in self.arun(apply):
+            done += 1
+            if progress is not None:
+                progress(done, len(self.configs), result)
+            yield result
+
+    def _desired_configs(
+        self,
+        config: 'PonikaConfig | ConfigDefinition',
+        overrides: Mapping[str, 'PonikaConfig | ConfigDefinition'] | None,
+    ) -> Callable[[str], 'ConfigDefinition']:
+        """Return a lookup of the config to apply to each host."""
+        from ponika.config import dump_config, merge_configs
+
+        hosts = {device.host for device in self.configs}
+        unknown = set(overrides or ()) - hosts
+        if unknown:
+            raise ValueError(
+                f'Overrides for hosts not in the fleet: '
+                f'{", ".join(sorted(unknown))}'
+            )
+
+        base = dump_config(config)
+        merged = {
+            host: merge_configs(base, override)
+            for host, override in (overrides or {}).items()
+        }
+        return lambda host: merged.get(host, base)
+
+    def close(self) -> None:
+        """Close the HTTP sessions of all synchronous clients."""
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients of all asyncio clients."""
+        for client in self._async_clients.values():
+            await client.aclose()
+        self._async_clients.clear()
+
+    def _call(
+        self, index: int, fn: Callable[[PonikaClient], T]
+    ) -> FleetResult[T]:
+        try:
+            value = fn(self.client(index))
+        except Exception as e:
+            return FleetResult(config=self.configs[index], error=e)
+        return FleetResult(config=self.configs[index], value=value)
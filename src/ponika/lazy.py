@@ -0,0 +1,36 @@
+"""Helpers for importing endpoint modules on first use."""
+
+from collections.abc import Callable, Mapping
+from importlib import import_module
+import sys
+from typing import Any
+
+
+def lazy_imports(
+    module_name: str, attributes: Mapping[str, str]
+) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` importing ``attributes`` on access.
+
+    ``attributes`` maps a public name to the module defining it. Relative
+    module names are resolved against ``module_name``. Imported values are
+    stored in the module, so each name is only resolved once::
+
+        __getattr__ = lazy_imports(__name__, {'ModemsEndpoint': '.modems'})
+    """
+    package = module_name.rpartition('.')[0]
+    if hasattr(sys.modules[module_name], '__path__'):
+        package = module_name
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f'module {module_name!r} has no attribute {name!r}'
+            ) from None
+
+        value = getattr(import_module(source, package), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
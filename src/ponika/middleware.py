@@ -0,0 +1,226 @@
+"""Request pipeline shared by all HTTP calls of :class:`PonikaClient`.
+
+Every request passes through the client's middleware chain before it reaches
+the HTTP session. A middleware is a callable taking the request and the next
+handler; it may change the request, retry, short-circuit or inspect the
+response::
+
+    def log_status(request, call_next):
+        response = call_next(request)
+        print(request.method, request.endpoint, response.status_code)
+        return response
+
+    client.add_middleware(log_status)
+"""
+
+import random
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Optional
+
+import requests
+
+from ponika import timeouts
+
+if TYPE_CHECKING:
+    from ponika import PonikaClient
+
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+# Gateway errors returned while the device or its uplink is briefly away.
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+@dataclass
+class ApiRequest:
+    """A request on its way through the middleware chain."""
+
+    client: 'PonikaClient'
+    method: str
+    endpoint: str
+    params: Optional[dict[str, Any]] = None
+    json: Any = None
+    data: Any = None
+    files: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+    auth_required: bool = True
+
+    @property
+    def url(self) -> str:
+        return f'{self.client._config.base_url}{self.endpoint}'
+
+    def rewind(self) -> None:
+        """Seek uploaded files back to the start before sending again."""
+        for value in (self.files or {}).values():
+            handle = value[1] if isinstance(value, tuple) else value
+            if hasattr(handle, 'seek'):
+                handle.seek(0)
+
+
+Handler = Callable[[ApiRequest], requests.Response]
+Middleware = Callable[[ApiRequest, Handler], requests.Response]
+
+
+class AuthMiddleware:
+    """Add the bearer token to requests that require authentication.
+
+    When the device rejects the token with HTTP 401, for example because it
+    was restarted or the session was revoked, the token is dropped and the
+    request is sent once more after logging in again. The device did not act
+    on the rejected request, so this is safe for every method.
+    """
+
+    def __call__(
+        self, request: ApiRequest, call_next: Handler
+    ) -> requests.Response:
+        if not request.auth_required:
+            return call_next(request)
+
+        client = request.client
+        token = client._get_auth_token()
+        if token:
+            request.headers['Authorization'] = f'Bearer {token}'
+
+        response = call_next(request)
+        if response.status_code != 401 or not token:
+            return response
+
+        client._logger.info(
+            'Token rejected for %s %s, logging in again',
+            request.method,
+            request.endpoint,
+        )
+        token = client._renew_auth_token(token)
+        request.headers['Authorization'] = f'Bearer {token}'
+        request.rewind()
+        return call_next(request)
+
+
+class TimingMiddleware:
+    """Log the duration of every request, including retries."""
+
+    def __call__(
+        self, request: ApiRequest, call_next: Handler
+    ) -> requests.Response:
+        started = perf_counter()
+        try:
+            return call_next(request)
+        finally:
+            request.client._logger.debug(
+                '%s %s took %.3fs',
+                request.method,
+                request.endpoint,
+                perf_counter() - started,
+            )
+
+
+class StatsMiddleware:
+    """Record calls, response size and errors per endpoint.
+
+    Placed outside :class:`RetryMiddleware`, so that a call is counted once
+    however many attempts it took; the client records the network time of
+    every attempt. Does nothing unless the client was created with a
+    :class:`ponika.stats.StatsCollector`.
+    """
+
+    def __call__(
+        self, request: ApiRequest, call_next: Handler
+    ) -> requests.Response:
+        stats = request.client.stats
+        if stats is None:
+            return call_next(request)
+
+        stats.increment(request.endpoint, 'calls')
+        try:
+            response = call_next(request)
+        except Exception:
+            stats.increment(request.endpoint, 'errors')
+            raise
+
+        stats.observe(
+            request.endpoint, 'response_bytes', len(response.content)
+        )
+        if response.status_code >= 400:
+            stats.increment(request.endpoint, 'errors')
+        return response
+
+
+class RetryMiddleware:
+    """Retry requests that failed on the way to or from the device.
+
+    Connection errors, timeouts and gateway errors (``statuses``) are retried
+    up to ``max_attempts`` in total. Only ``methods`` are retried, idempotent
+    ones by default, since a non-idempotent request may have reached the
+    device before the connection dropped.
+
+    Attempts are spaced with exponential backoff and full jitter: the n-th
+    retry waits a random time of up to ``backoff * 2 ** (n - 1)`` seconds,
+    capped at ``max_backoff``, so a fleet of clients does not retry in
+    lockstep. No retry is made if the wait would outlast the current
+    deadline, see :mod:`ponika.timeouts`.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        statuses: Collection[int] = RETRY_STATUSES,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1.')
+
+        self.max_attempts = max_attempts
+        self.methods = frozenset(method.upper() for method in methods)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+
+    def delay(self, attempt: int) -> float:
+        """Return the seconds to wait after the failed ``attempt``."""
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def __call__(
+        self, request: ApiRequest, call_next: Handler
+    ) -> requests.Response:
+        if request.method not in self.methods:
+            return call_next(request)
+
+        attempt = 1
+        while True:
+            try:
+                response = call_next(request)
+            except (requests.ConnectionError, requests.Timeout):
+                if not self._wait(request, attempt):
+                    raise
+            else:
+                if response.status_code not in self.statuses or not (
+                    self._wait(request, attempt)
+                ):
+                    return response
+            attempt += 1
+            request.rewind()
+
+    def _wait(self, request: ApiRequest, attempt: int) -> bool:
+        """Sleep before the next attempt, if one should be made."""
+        if attempt >= self.max_attempts:
+            return False
+
+        delay = self.delay(attempt)
+        remaining = timeouts.remaining()
+        if remaining is not None and delay >= remaining:
+            return False
+
+        request.client._logger.info(
+            'Retrying %s %s in %.2fs (attempt %d of %d)',
+            request.method,
+            request.endpoint,
+            delay,
+            attempt + 1,
+            self.max_attempts,
+        )
+        request.client._sleep(delay)
+        return True
@@ -1,35 +1,106 @@
-from enum import Enum
+from collections.abc import Iterable
+from copy import copy
+from functools import cache
+from time import time
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Generic, List, Optional, TypeVar
 
 if TYPE_CHECKING:
     pass
 
-from pydantic import BaseModel as PydanticBaseModel, ConfigDict
+from pydantic import (
+    BaseModel as PydanticBaseModel,
+    ConfigDict,
+    GetCoreSchemaHandler,
+    TypeAdapter,
+    create_model,
+)
+from pydantic_core import CoreSchema, core_schema
 
 
 T = TypeVar('T')
 
 
 class BasePayload(PydanticBaseModel):
-    def asdict(self) -> dict[str, Any]:
-        def convert(value: Any) -> Any:
-            if isinstance(value, Enum):
-                return value.value
-            if isinstance(value, list):
-                return [convert(v) for v in value]
-            if isinstance(value, bool):
-                return '1' if value is True else '0'
-            if isinstance(value, dict):
-                return {k: convert(v) for k, v in value.items()}
+    """Request payload in the RutOS wire format.
+
+    In JSON mode, i.e. :meth:`asdict` and ``model_dump_json()``, booleans are
+    serialized as ``'1'``/``'0'`` and enums by value. The boolean serializer
+    is part of each payload's schema, so pydantic produces the wire format in
+    a single pass.
+    """
 
-            return value
+    # Schemas are built on first use, see build_models.
+    model_config = ConfigDict(defer_build=True)
 
-        response = self.model_dump(exclude_none=True, by_alias=True)
-        return convert(response)
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[PydanticBaseModel], handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return _with_wire_serializers(handler(source))
+
+    def asdict(self) -> dict[str, Any]:
+        return self.model_dump(mode='json', exclude_none=True, by_alias=True)
+
+
+def _wire_value(value: Any) -> Any:
+    if value is True or value is False:
+        return '1' if value else '0'
+    if isinstance(value, list):
+        return [_wire_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _wire_value(v) for k, v in value.items()}
+    return value
+
+
+_WIRE_SERIALIZERS = {
+    'bool': core_schema.plain_serializer_function_ser_schema(
+        _wire_value, when_used='json'
+    ),
+    'any': core_schema.plain_serializer_function_ser_schema(
+        _wire_value, when_used='json'
+    ),
+}
+
+
+def _with_wire_serializers(schema: Any) -> Any:
+    """Return ``schema`` with booleans serialized the RutOS way.
+
+    Schemas are copied on the way since pydantic may share them between
+    models.
+    """
+    if isinstance(schema, tuple):
+        return (_with_wire_serializers(schema[0]), *schema[1:])
+    if isinstance(schema, list):
+        return [_with_wire_serializers(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    schema_type = schema.get('type')
+    if schema_type in _WIRE_SERIALIZERS:
+        return {**schema, 'serialization': _WIRE_SERIALIZERS[schema_type]}
+    if schema_type == 'model-fields':
+        return {
+            **schema,
+            'fields': {
+                name: _with_wire_serializers(field)
+                for name, field in schema['fields'].items()
+            },
+        }
+    if schema_type == 'definition-ref':
+        # Referenced models bring their own serializers.
+        return schema
+    return {
+        key: _with_wire_serializers(value)
+        if key in ('schema', 'items_schema', 'values_schema', 'choices')
+        else value
+        for key, value in schema.items()
+    }
 
 
 class BaseModel(PydanticBaseModel):
-    model_config = ConfigDict(frozen=True)
+    # Schemas are built on first use, see build_models.
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class TeltonikaApiError(BaseModel):
@@ -60,8 +131,88 @@ class ApiResponse(BaseModel, Generic[T]):
     errors: Optional[List[TeltonikaApiError]] = None
 
 
+@cache
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return a shared ``TypeAdapter`` for ``tp``, built on first use."""
+    return TypeAdapter(tp)
+
+
+@cache
+def response_adapter(data_model: Any) -> TypeAdapter[ApiResponse[Any]]:
+    """Return the validator for ``ApiResponse[data_model]``.
+
+    Parametrizing ``ApiResponse`` and building its validator on every call is
+    noticeable when polling, so it happens once per response shape.
+    ``Model`` and ``list[Model]`` are distinct shapes.
+    """
+    return type_adapter(ApiResponse[data_model])
+
+
+def slim_model(
+    model: type[BaseModel], fields: Iterable[str]
+) -> type[BaseModel]:
+    """Return a model holding only ``fields`` of ``model``.
+
+    Validating a handful of fields skips the nested lists and enums of wide
+    status models. The other keys of a response are ignored. Slim models are
+    built once per model and set of fields.
+    """
+    fields = frozenset(fields)
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise ValueError(
+            f'{model.__name__} has no fields {", ".join(sorted(unknown))}'
+        )
+    return _slim_model(model, fields)
+
+
+@cache
+def _slim_model(
+    model: type[BaseModel], fields: frozenset[str]
+) -> type[BaseModel]:
+    return create_model(
+        f'Slim{model.__name__}',
+        __base__=BaseModel,
+        __module__=model.__module__,
+        **{
+            name: (field.annotation, copy(field))
+            for name, field in model.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+def build_models(module: ModuleType) -> None:
+    """Build the schemas of all models defined in ``module``.
+
+    Models defer building their schema until first use. This builds them
+    ahead of time, including models nested in classes such as endpoints.
+    """
+    pending = list(vars(module).values())
+    seen: set[type] = set()
+    while pending:
+        value = pending.pop()
+        if (
+            not isinstance(value, type)
+            or value in seen
+            or value.__module__ != module.__name__
+        ):
+            continue
+        seen.add(value)
+        if issubclass(value, PydanticBaseModel):
+            value.model_rebuild()
+        pending.extend(vars(value).values())
+
+
 class Token(BaseModel):
     """Data model for token storage."""
 
     token: str
     expires_at: int
+    # Point in time after which the client fetches a new token. Tokens
+    # without it are used until they expire.
+    refresh_at: Optional[int] = None
+
+    def is_usable(self) -> bool:
+        """Return whether the token is not yet due for a refresh."""
+        return (self.refresh_at or self.expires_at) > int(time())
@@ -0,0 +1,18 @@
+"""How responses of read-only calls are turned into Python objects.
+
+Validation is the default. Scrapers polling their own, trusted devices can
+skip it per client or per call::
+
+    client = PonikaClient(..., parse_mode=ParseMode.RAW)
+    client.modems.status.get_status(parse_mode='validate')
+
+``raw`` returns the decoded JSON as is. Error responses are always
+validated.
+"""
+
+from enum import Enum
+
+
+class ParseMode(str, Enum):
+    VALIDATE = 'validate'
+    RAW = 'raw'
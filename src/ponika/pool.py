@@ -0,0 +1,87 @@
+"""HTTP connection pooling shared between clients.
+
+Each :class:`ponika.PonikaClient` keeps its own pool of keep-alive connections,
+sized by the ``pool_*`` options of :class:`ponika.ClientConfig`. A
+:class:`SharedPool` replaces those per-client pools with one pool for the
+whole process, capping the number of sockets a large fleet opens at once::
+
+    pool = SharedPool(max_connections=64)
+    fleet = Fleet(configs, max_workers=128, pool=pool)
+
+:class:`ponika.aio.AsyncPonikaClient` honours the pool as well: clients
+created with it share one ``httpx.AsyncClient`` limited to
+``max_connections`` connections, closed by :meth:`SharedPool.aclose`.
+"""
+
+import threading
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+
+class _SharedAdapter(HTTPAdapter):
+    """Adapter that admits at most ``max_connections`` requests at once."""
+
+    def __init__(self, max_connections: int, **kwargs: Any) -> None:
+        self._slots = threading.BoundedSemaphore(max_connections)
+        super().__init__(**kwargs)
+
+    def send(
+        self, request: PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> Response:
+        with self._slots:
+            response = super().send(request, stream=stream, **kwargs)
+            if not stream:
+                # Read the body while holding the slot; this returns the
+                # connection to the pool.
+                response.content
+            return response
+
+    def close(self) -> None:
+        # Closing one client must not close the connections of the others.
+        pass
+
+
+class SharedPool:
+    """Process-wide connection pool for many clients.
+
+    At most ``max_connections`` requests are on the wire at any time, across
+    all clients using the pool; further requests wait for a free slot.
+    Keep-alive connections are kept for the most recently used devices, up to
+    ``pool_maxsize`` per device and ``max_connections`` in total, so idle
+    sockets are capped as well. ``max_retries`` is passed on to
+    :class:`requests.adapters.HTTPAdapter`.
+
+    The pool settings of the clients themselves are not used.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        pool_maxsize: int = 1,
+        max_retries: int = 0,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError('max_connections must be at least 1.')
+
+        self.max_connections = max_connections
+        self.adapter: HTTPAdapter = _SharedAdapter(
+            max_connections,
+            pool_connections=max(1, max_connections // pool_maxsize),
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+        # httpx.AsyncClient per TLS verification setting, created by the
+        # async clients using this pool.
+        self.async_clients: dict[bool, Any] = {}
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        HTTPAdapter.close(self.adapter)
+
+    async def aclose(self) -> None:
+        """Close the connections of the async clients using this pool."""
+        for http_client in self.async_clients.values():
+            await http_client.aclose()
+        self.async_clients.clear()
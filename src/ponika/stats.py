@@ -0,0 +1,123 @@
+"""Per-endpoint request statistics.
+
+Statistics are opt-in. Pass a collector to the client, or share one between
+the clients of a fleet, and read it back as a plain dict::
+
+    stats = StatsCollector()
+    client = PonikaClient(..., stats=stats)
+    client.modems.status.get_status()
+    stats.snapshot()['/modems/status']['network_seconds']
+
+Requests are grouped by path template, so ``/modems/1-1/global`` and
+``/modems/2-1/global`` both count towards ``/modems/{modem_id}/global``.
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from time import perf_counter
+
+# Called with the path template, the metric name and the observed value.
+Observer = Callable[[str, str, float], None]
+
+
+@dataclass
+class EndpointStats:
+    """Totals recorded for one path template."""
+
+    calls: int = 0
+    errors: int = 0
+    network_seconds: float = 0.0
+    # JSON decoding of responses that are not validated by a response model;
+    # others are parsed as part of validation_seconds.
+    decode_seconds: float = 0.0
+    validation_seconds: float = 0.0
+    response_bytes: int = 0
+    # Responses served by a ponika.cache.ResponseCache, not in calls.
+    cache_hits: int = 0
+    # GETs that shared the request of an identical one in flight, not in
+    # calls. See ponika.coalescing.
+    coalesced: int = 0
+    # Calls whose body matched the previous one, returning its result
+    # without parsing. Included in calls, see unchanged_rate.
+    unchanged: int = 0
+
+    @property
+    def unchanged_rate(self) -> float:
+        """Share of calls answered with an unchanged body."""
+        return self.unchanged / self.calls if self.calls else 0.0
+
+
+def path_template(endpoint: str) -> str:
+    """Return the template of an endpoint path, or the path itself."""
+    return getattr(endpoint, 'template', endpoint)
+
+
+class StatsCollector:
+    """Thread-safe collector of :class:`EndpointStats` per path template.
+
+    Observers registered with :meth:`add_observer` receive every single
+    timing and response size, for example to feed histograms of a metrics
+    library. Totals are always available from :meth:`snapshot`.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, EndpointStats] = {}
+        self._observers: list[Observer] = []
+        self._lock = threading.Lock()
+
+    def add_observer(self, observer: Observer) -> None:
+        self._observers.append(observer)
+
+    def increment(self, endpoint: str, metric: str) -> None:
+        """Add one to a counter, e.g. ``calls``, of ``endpoint``."""
+        self._add(path_template(endpoint), metric, 1)
+
+    def observe(self, endpoint: str, metric: str, value: float) -> None:
+        """Record a timing or size and pass it on to the observers."""
+        template = path_template(endpoint)
+        self._add(template, metric, value)
+        for observer in self._observers:
+            observer(template, metric, value)
+
+    @contextmanager
+    def timed(
+        self, endpoint: str, metric: str, count_errors: bool = True
+    ) -> Iterator[None]:
+        """Record the duration of the block.
+
+        Exceptions count as errors unless ``count_errors`` is false, e.g.
+        because the call was already counted as an error.
+        """
+        started = perf_counter()
+        try:
+            yield
+        except Exception:
+            if count_errors:
+                self.increment(endpoint, 'errors')
+            raise
+        finally:
+            self.observe(endpoint, metric, perf_counter() - started)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return a copy of the totals and rates, keyed by path template."""
+        with self._lock:
+            return {
+                template: {
+                    **asdict(stats),
+                    'unchanged_rate': stats.unchanged_rate,
+                }
+                for template, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _add(self, template: str, metric: str, value: float) -> None:
+        with self._lock:
+            stats = self._stats.get(template)
+            if stats is None:
+                stats = self._stats[template] = EndpointStats()
+            setattr(stats, metric, getattr(stats, metric) + value)
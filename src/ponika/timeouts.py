@@ -0,0 +1,123 @@
+"""Per-call timeouts and deadlines spanning several requests.
+
+Connect and read timeouts default to the values of
+:class:`ponika.ClientConfig`. Both can be overridden for the requests made in
+a block::
+
+    with request_timeout(read=300):
+        client.backup.download(...)
+
+A deadline limits the total time of everything done in a block. Each request
+gets at most the time that is left, and once the budget is spent the next
+request fails with :class:`ponika.exceptions.TeltonikaDeadlineExceeded`
+instead of being sent::
+
+    with deadline(120):
+        ConfigApplier(client).apply(config)
+
+Both are kept in context variables, so they follow the code across threads
+started with :func:`contextvars.copy_context` and into the calls of
+:class:`ponika.aio.AsyncPonikaClient`. Nested deadlines can only shorten the
+budget.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Optional
+
+from ponika.exceptions import TeltonikaDeadlineExceeded
+
+# requests style (connect, read) timeout in seconds, None waits forever.
+Timeout = tuple[Optional[float], Optional[float]]
+
+_UNSET = object()
+
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    'ponika_deadline', default=None
+)
+_timeout: ContextVar[Optional[dict[str, Optional[float]]]] = ContextVar(
+    'ponika_timeout', default=None
+)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Limit all requests made in the block to ``seconds`` in total.
+
+    ``None`` leaves the current deadline, if any, untouched.
+    """
+    if seconds is None:
+        yield
+        return
+
+    expires_at = monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def request_timeout(
+    connect: Optional[float] | object = _UNSET,
+    read: Optional[float] | object = _UNSET,
+) -> Iterator[None]:
+    """Override the connect and/or read timeout for requests in the block.
+
+    Pass ``None`` to wait without a limit.
+    """
+    overrides = dict(_timeout.get() or {})
+    if connect is not _UNSET:
+        overrides['connect'] = connect
+    if read is not _UNSET:
+        overrides['read'] = read
+
+    token = _timeout.set(overrides)
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Return the seconds left before the current deadline, if there is one."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - monotonic()
+
+
+def resolve(connect: Optional[float], read: Optional[float]) -> Timeout:
+    """Return the timeout of the next request.
+
+    ``connect`` and ``read`` are the client defaults. Overrides of the current
+    context take precedence and both are capped by the remaining deadline.
+    Raises :class:`TeltonikaDeadlineExceeded` if the deadline has passed.
+    """
+    overrides = _timeout.get()
+    if overrides:
+        connect = overrides.get('connect', connect)
+        read = overrides.get('read', read)
+
+    left = remaining()
+    if left is None:
+        return connect, read
+    if left <= 0:
+        raise TeltonikaDeadlineExceeded()
+    return (
+        left if connect is None else min(connect, left),
+        left if read is None else min(read, left),
+    )
+
+
+def expired() -> bool:
+    """Return whether the current deadline, if any, has passed."""
+    left = remaining()
+    return left is not None and left <= 0
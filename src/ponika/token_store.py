@@ -0,0 +1,125 @@
+"""Bearer token storage shared between clients and processes."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from ponika.models import Token
+
+if TYPE_CHECKING:
+    from ponika import ClientConfig
+
+
+@dataclass(frozen=True)
+class TokenKey:
+    """Identifies the device account a token belongs to."""
+
+    host: str
+    port: int
+    username: str
+
+    @classmethod
+    def from_config(cls, config: 'ClientConfig') -> 'TokenKey':
+        return cls(
+            host=config.host,
+            port=config.resolved_port,
+            username=config.username,
+        )
+
+    def __str__(self) -> str:
+        return f'{self.username}@{self.host}:{self.port}'
+
+
+class TokenStore(ABC):
+    """Storage for bearer tokens, keyed by host, port and username.
+
+    Implementations only return tokens that are still usable.
+    """
+
+    @abstractmethod
+    def load(self, key: TokenKey) -> Token | None: ...
+
+    @abstractmethod
+    def save(self, key: TokenKey, token: Token) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: TokenKey) -> None: ...
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by all clients of the current process."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[TokenKey, Token] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: TokenKey) -> Token | None:
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None and not token.is_usable():
+                del self._tokens[key]
+                return None
+            return token
+
+    def save(self, key: TokenKey, token: Token) -> None:
+        with self._lock:
+            self._tokens[key] = token
+
+    def delete(self, key: TokenKey) -> None:
+        with self._lock:
+            self._tokens.pop(key, None)
+
+
+def default_token_directory() -> Path:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'ponika' / 'tokens'
+
+
+class FileTokenStore(TokenStore):
+    """Token store persisting one JSON file per device account.
+
+    Files are replaced atomically and readable by the owner only, so
+    concurrent processes never see a partially written token.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory or default_token_directory())
+
+    def load(self, key: TokenKey) -> Token | None:
+        try:
+            token = Token.model_validate_json(self._path(key).read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+        if not token.is_usable():
+            self.delete(key)
+            return None
+        return token
+
+    def save(self, key: TokenKey, token: Token) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(token.model_dump(), file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: TokenKey) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: TokenKey) -> Path:
+        digest = hashlib.sha256(str(key).encode()).hexdigest()
+        return self.directory / f'{digest}.json'
@@ -0,0 +1,270 @@
+"""Poll a status call and yield what changed between polls.
+
+Instead of diffing the results of hand-rolled polling loops, pass the call
+to :func:`watch`::
+
+    for delta in watch(client.ip_neighbors.ipv4.get_status, interval=30):
+        for mac, neighbor in delta.added.items():
+            print('new neighbor', mac, neighbor.dest)
+
+The first poll reports every item as added; later ones are only yielded
+when something was added, removed or changed. Items are matched by the
+first of :data:`KEY_FIELDS` they have, so lists of any length are compared
+through dict indexes in linear time. :func:`awatch` does the same for
+:class:`ponika.aio.AsyncPonikaClient` calls.
+
+Failed polls (connection errors, timeouts and API errors) are retried with
+exponential backoff instead of ending the stream, up to ``max_failures`` in
+a row.
+"""
+
+import asyncio
+import random
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterator,
+    Mapping,
+)
+from dataclasses import dataclass, field
+from logging import getLogger
+from operator import attrgetter, itemgetter
+from time import sleep
+from typing import Any, Generic, Optional, TypeVar
+
+import requests
+
+from ponika.exceptions import TeltonikaApiException, TeltonikaLoginException
+from ponika.models import ApiResponse
+
+T = TypeVar('T')
+
+# Fields identifying list items, tried in order. Leases use macaddr and
+# ipaddr, IP neighbors dest.
+KEY_FIELDS: tuple[str, ...] = ('id', 'mac', 'macaddr', 'ip', 'ipaddr', 'dest')
+
+# Errors after which polling goes on. Invalid credentials will not fix
+# themselves and are raised right away.
+_TRANSIENT_ERRORS = (requests.RequestException, TeltonikaApiException)
+
+_logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Delta(Generic[T]):
+    """Items that differ between two polls, keyed like :func:`diff`.
+
+    ``changed`` maps keys to the previous and the current item.
+    """
+
+    added: dict[Hashable, T] = field(default_factory=dict)
+    removed: dict[Hashable, T] = field(default_factory=dict)
+    changed: dict[Hashable, tuple[T, T]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff(
+    before: Mapping[Hashable, T], after: Mapping[Hashable, T]
+) -> Delta[T]:
+    """Compare two indexes of items, e.g. built by :func:`index`."""
+    return Delta(
+        added={k: after[k] for k in after.keys() - before.keys()},
+        removed={k: before[k] for k in before.keys() - after.keys()},
+        changed={
+            k: (before[k], after[k])
+            for k in after.keys() & before.keys()
+            if before[k] is not after[k] and before[k] != after[k]
+        },
+    )
+
+
+def index(
+    result: Any, key: str | Callable[[Any], Hashable] | None = None
+) -> dict[Hashable, Any]:
+    """Return the items of a call ``result`` keyed by ``key``.
+
+    ``key`` is a field name or a function of an item. By default the first
+    of :data:`KEY_FIELDS` set on the first item is used. Items without the key
+    field set raise :class:`ValueError`. Results that are not lists are
+    indexed as a single item under ``None``; unsuccessful
+    :class:`ponika.models.ApiResponse` objects raise
+    :class:`ponika.exceptions.TeltonikaApiException`.
+    """
+    if isinstance(result, ApiResponse):
+        if not result.success:
+            raise TeltonikaApiException(result.errors)
+        result = result.data
+
+    if not isinstance(result, list):
+        return {None: result}
+    if not result:
+        return {}
+
+    if callable(key):
+        return {key(item): item for item in result}
+
+    name = _key_field(result[0], key)
+    keyed = {}
+    for item in result:
+        value = _field(item, name)
+        if value is None:
+            raise _unkeyable(item)
+        keyed[value] = item
+    return keyed
+
+
+def _key_field(item: Any, key: str | None) -> str:
+    for name in KEY_FIELDS if key is None else (key,):
+        if _field(item, name) is not None:
+            return name
+    raise _unkeyable(item)
+
+
+def _field(item: Any, name: str) -> Any:
+    getter = itemgetter if isinstance(item, Mapping) else attrgetter
+    try:
+        return getter(name)(item)
+    except (AttributeError, KeyError):
+        return None
+
+
+def _unkeyable(item: Any) -> ValueError:
+    return ValueError(
+        f'Cannot key items of type {type(item).__name__}, '
+        f'pass key= with one of their fields.'
+    )
+
+
+class _Poller:
+    """Diffing and scheduling shared by :func:`watch` and :func:`awatch`."""
+
+    def __init__(
+        self,
+        interval: float,
+        key: str | Callable[[Any], Hashable] | None,
+        jitter: float,
+        backoff: float,
+        max_interval: float,
+        max_failures: Optional[int],
+    ) -> None:
+        if interval < 0:
+            raise ValueError('interval must not be negative.')
+        if not 0 <= jitter <= 1:
+            raise ValueError('jitter must be between 0 and 1.')
+        if backoff < 1:
+            raise ValueError('backoff must be at least 1.')
+        if max_failures is not None and max_failures < 1:
+            raise ValueError('max_failures must be at least 1.')
+
+        self.interval = interval
+        self.key = key
+        self.jitter = jitter
+        self.backoff = backoff
+        self.max_interval = max(interval, max_interval)
+        self.max_failures = max_failures
+        self.failures = 0
+        self._result: Any = None
+        self._items: Optional[dict[Hashable, Any]] = None
+
+    def update(self, result: Any) -> Delta[Any]:
+        """Return what changed since the previous successful poll."""
+        self.failures = 0
+        # Reused results (see reuse_unchanged) cannot have changed.
+        if self._items is not None and result is self._result:
+            return Delta()
+
+        items = index(result, self.key)
+        delta = diff(self._items or {}, items)
+        self._result, self._items = result, items
+        return delta
+
+    def failed(self, error: BaseException) -> bool:
+        """Count a failed poll and return whether to keep polling."""
+        self.failures += 1
+        if self.max_failures is not None and (
+            self.failures >= self.max_failures
+        ):
+            return False
+
+        _logger.warning('Poll failed (%d in a row): %s', self.failures, error)
+        return True
+
+    def delay(self) -> float:
+        """Return the seconds to wait before the next poll."""
+        delay = min(
+            self.max_interval, self.interval * self.backoff**self.failures
+        )
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+def watch(
+    fetch: Callable[[], Any],
+    interval: float = 10.0,
+    *,
+    key: str | Callable[[Any], Hashable] | None = None,
+    jitter: float = 0.1,
+    backoff: float = 2.0,
+    max_interval: float = 300.0,
+    max_failures: Optional[int] = None,
+) -> Iterator[Delta[Any]]:
+    """Call ``fetch`` every ``interval`` seconds and yield the changes.
+
+    Each wait is randomized by up to ``jitter`` times its length, so that
+    watchers started together spread out. After a failed poll the interval
+    is multiplied by ``backoff`` per failure in a row, up to
+    ``max_interval`` seconds. The error is raised once ``max_failures``
+    polls in a row have failed; by default polling goes on.
+    """
+    poller = _Poller(
+        interval, key, jitter, backoff, max_interval, max_failures
+    )
+    while True:
+        try:
+            delta = poller.update(fetch())
+        except TeltonikaLoginException:
+            raise
+        except _TRANSIENT_ERRORS as e:
+            if not poller.failed(e):
+                raise
+        else:
+            if delta:
+                yield delta
+        sleep(poller.delay())
+
+
+async def awatch(
+    fetch: Callable[[], Awaitable[Any]],
+    interval: float = 10.0,
+    *,
+    key: str | Callable[[Any], Hashable] | None = None,
+    jitter: float = 0.1,
+    backoff: float = 2.0,
+    max_interval: float = 300.0,
+    max_failures: Optional[int] = None,
+) -> AsyncIterator[Delta[Any]]:
+    """Await ``fetch`` every ``interval`` seconds and yield the changes.
+
+    This is the asyncio counterpart of :func:`watch`::
+
+        async for delta in awatch(client.modems.status.get_status):
+            ...
+    """
+    poller = _Poller(
+        interval, key, jitter, backoff, max_interval, max_failures
+    )
+    while True:
+        try:
+            delta = poller.update(await fetch())
+        except TeltonikaLoginException:
+            raise
+        except _TRANSIENT_ERRORS as e:
+            if not poller.failed(e):
+                raise
+        else:
+            if delta:
+                yield delta
+        await asyncio.sleep(poller.delay())
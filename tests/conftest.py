@@ -2,7 +2,8 @@
 
 import pytest
 import responses
-from ponika import PonikaClient
+from ponika import PonikaClient, cache, timeouts
+from tests.mocks import FakeClock
 
 # Base URL for mocked API
 BASE_URL = 'https://test-device:443/api'
@@ -44,3 +45,12 @@ def mock_login():
         json=LOGIN_RESPONSE,
         status=200,
     )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock of deadlines and the response cache."""
+    fake = FakeClock()
+    monkeypatch.setattr(timeouts, 'monotonic', fake)
+    monkeypatch.setattr(cache, 'monotonic', fake)
+    return fake
@@ -4,6 +4,8 @@ import json
 import responses
 from typing import Any, Dict, Callable
 
+from ponika import PonikaClient
+
 # Base URL for mocked API
 BASE_URL = 'https://test-device:443/api'
 
@@ -209,6 +211,24 @@ SESSION_STATUS_RESPONSE = {
 # }
 
 
+def make_client(username: str = 'admin', **options: Any) -> PonikaClient:
+    """Create a client for the mocked test device.
+
+    Keyword arguments are passed on to PonikaClient.
+    """
+    return PonikaClient('test-device', username, 'admin', **options)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand through its ``now`` attribute."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 def login_callback(request):
     """Callback for login endpoint that validates credentials.
 
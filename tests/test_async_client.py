@@ -0,0 +1,274 @@
+"""Unit tests for the asyncio client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ponika.aio import AsyncPonikaClient
+from ponika.cache import ResponseCache
+from ponika.config import PonikaConfig, RecipientsConfig
+from ponika.endpoints.recipients.phone_groups import PhoneGroupCreatePayload
+from ponika.exceptions import TeltonikaApiException
+from tests.mocks import LOGIN_RESPONSE
+
+
+def _async_client(routes: dict, calls: list | None = None):
+    """Create an AsyncPonikaClient answering requests from ``routes``.
+
+    ``routes`` maps ``(method, path)`` to the JSON response body.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix('/api')
+        if calls is not None:
+            calls.append((request.method, path, request.content))
+        if (request.method, path) == ('POST', '/login'):
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        return httpx.Response(200, json=routes[(request.method, path)])
+
+    return AsyncPonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.mark.unit
+def test_async_client_status_endpoint():
+    client = _async_client(
+        {
+            ('GET', '/internet_connection/status'): {
+                'success': True,
+                'data': {
+                    'ipv4_status': 'up',
+                    'ipv6_status': 'down',
+                    'dns_status': 'up',
+                },
+            }
+        }
+    )
+
+    async def run():
+        async with client:
+            return await client.internet_connection.get_status()
+
+    response = asyncio.run(run())
+
+    assert response.success is True
+    assert response.data.ipv4_status == 'up'
+
+
+@pytest.mark.unit
+def test_async_client_runs_concurrent_calls_on_one_loop():
+    calls = []
+    client = _async_client(
+        {
+            ('GET', '/wireguard/config'): {
+                'success': True,
+                'data': [{'id': 'wg0', 'enabled': '1'}],
+            }
+        },
+        calls,
+    )
+
+    async def run():
+        return await asyncio.gather(
+            *(client.wireguard.config.get_config() for _ in range(50))
+        )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 50
+    assert all(result[0].id == 'wg0' for result in results)
+    assert [call[1] for call in calls].count('/login') == 1
+
+
+@pytest.mark.unit
+def test_async_client_dynamic_path_endpoint():
+    client = _async_client(
+        {
+            ('GET', '/wireguard/wg0/peers/config'): {
+                'success': True,
+                'data': [{'id': 'peer1', 'public_key': 'key'}],
+            }
+        }
+    )
+
+    peers = client.wireguard.peers.config('wg0')
+    result = asyncio.run(peers.get_config())
+
+    assert result[0].id == 'peer1'
+
+
+@pytest.mark.unit
+def test_async_client_raises_api_errors():
+    client = _async_client(
+        {
+            ('GET', '/wireguard/config'): {
+                'success': False,
+                'errors': [{'code': 122, 'error': 'Not found'}],
+            }
+        }
+    )
+
+    with pytest.raises(TeltonikaApiException):
+        asyncio.run(client.wireguard.config.get_config())
+
+
+@pytest.mark.unit
+def test_async_client_calls_served_from_cache_are_awaitable():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == '/api/login':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        return httpx.Response(
+            200, json={'success': True, 'data': [{'code': 'en'}]}
+        )
+
+    client = AsyncPonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        cache=ResponseCache(),
+        coalesce_gets=False,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run():
+        first = await client.system.general.get_languages()
+        second = await client.system.general.get_languages()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first[0].code == second[0].code == 'en'
+    assert calls.count('/api/system/languages/options') == 1
+
+
+@pytest.mark.unit
+def test_async_client_config_applier():
+    calls = []
+    client = _async_client(
+        {
+            ('GET', '/recipients/phone_groups/config'): {
+                'success': True,
+                'data': [],
+            },
+            ('POST', '/recipients/phone_groups/config'): {
+                'success': True,
+                'data': {'id': '1', 'name': 'Ops', 'tel': ['+49170222222']},
+            },
+        },
+        calls,
+    )
+
+    result = asyncio.run(
+        client.config.apply(
+            PonikaConfig(
+                recipients=RecipientsConfig(
+                    phone_groups=[
+                        PhoneGroupCreatePayload(
+                            name='Ops', tel=['+49170222222']
+                        )
+                    ]
+                )
+            )
+        )
+    )
+
+    assert len(result.created) == 1
+    assert calls[-1][0] == 'POST'
+    assert json.loads(calls[-1][2])['data'] == {
+        'name': 'Ops',
+        'tel': ['+49170222222'],
+    }
+
+
+@pytest.mark.unit
+def test_async_client_config_applier_reads_sections_concurrently():
+    in_flight = peak = 0
+    read_timeouts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if request.method == 'POST':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        read_timeouts.append(request.extensions['timeout']['read'])
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={'success': True, 'data': []})
+
+    client = AsyncPonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    result = asyncio.run(
+        client.config.apply(
+            {
+                'recipients': {'phone_groups': [], 'email_users': []},
+                'sms_utilities': {'rules': []},
+            },
+            timeout=5,
+        )
+    )
+
+    assert result.changes == []
+    assert peak == 3
+    # The deadline of apply() reaches the concurrent reads.
+    assert len(read_timeouts) == 3
+    assert all(timeout <= 5 for timeout in read_timeouts)
+
+
+@pytest.mark.unit
+def test_async_client_config_applier_waits_for_parent_sections():
+    writes = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix('/api')
+        if path == '/login':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        if request.method == 'GET':
+            return httpx.Response(200, json={'success': True, 'data': []})
+        writes.append(f'{path} start')
+        if path == '/wireguard/config':
+            await asyncio.sleep(0.02)
+        writes.append(f'{path} end')
+        body = json.loads(request.content)['data']
+        return httpx.Response(200, json={'success': True, 'data': body})
+
+    client = AsyncPonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    asyncio.run(
+        client.config.apply(
+            {
+                'wireguard': {
+                    'peers': [
+                        {'interface_id': 'wg1', 'items': [{'id': 'peer1'}]}
+                    ],
+                    'config': [{'id': 'wg1'}],
+                }
+            }
+        )
+    )
+
+    assert writes == [
+        '/wireguard/config start',
+        '/wireguard/config end',
+        '/wireguard/wg1/peers/config start',
+        '/wireguard/wg1/peers/config end',
+    ]
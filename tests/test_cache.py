@@ -0,0 +1,134 @@
+"""Unit tests for the response cache."""
+
+import pytest
+import responses
+
+from ponika.cache import ResponseCache
+from ponika.exceptions import TeltonikaApiException
+from ponika.stats import StatsCollector
+from tests.mocks import (
+    BASE_URL,
+    LOGIN_RESPONSE,
+    make_client,
+    mock_error_response,
+)
+
+LANGUAGES_URL = f'{BASE_URL}/system/languages/options'
+LANGUAGES_RESPONSE = {
+    'success': True,
+    'data': [{'name': 'English', 'code': 'en'}],
+}
+
+
+def _get_count(url: str) -> int:
+    return sum(
+        call.request.method == 'GET' and call.request.url == url
+        for call in responses.calls
+    )
+
+
+@pytest.mark.unit
+@responses.activate
+def test_metadata_is_served_from_the_cache_until_it_expires(clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(LANGUAGES_URL, json=LANGUAGES_RESPONSE)
+    stats = StatsCollector()
+    client = make_client(cache=ResponseCache(), stats=stats)
+
+    first = client.system.general.get_languages()
+    clock.now += 3599
+    second = client.system.general.get_languages()
+    clock.now += 1
+    client.system.general.get_languages()
+
+    assert first == second
+    assert _get_count(LANGUAGES_URL) == 2
+    assert stats.snapshot()['/system/languages/options']['cache_hits'] == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_writes_invalidate_the_same_path_prefix(clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(LANGUAGES_URL, json=LANGUAGES_RESPONSE)
+    responses.put(f'{BASE_URL}/modems/1-1/global', json={'success': True})
+    responses.put(f'{BASE_URL}/system/config', json={'success': True})
+    client = make_client(cache=ResponseCache())
+
+    client.system.general.get_languages()
+    client._put('/modems/1-1/global', dict)
+    client.system.general.get_languages()
+    client._put('/system/config', dict)
+    client.system.general.get_languages()
+
+    assert _get_count(LANGUAGES_URL) == 2
+
+
+@pytest.mark.unit
+@responses.activate
+def test_responses_are_cached_per_username(clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(LANGUAGES_URL, json=LANGUAGES_RESPONSE)
+    responses.put(f'{BASE_URL}/system/config', json={'success': True})
+    response_cache = ResponseCache()
+    admin = make_client(cache=response_cache)
+    viewer = make_client('viewer', cache=response_cache)
+
+    admin.system.general.get_languages()
+    viewer.system.general.get_languages()
+    viewer.system.general.get_languages()
+    assert _get_count(LANGUAGES_URL) == 2
+    assert len(response_cache) == 2
+
+    # A write changes the device for every account.
+    admin._put('/system/config', dict)
+    assert len(response_cache) == 0
+
+
+@pytest.mark.unit
+@responses.activate
+def test_cache_is_bounded_and_skips_endpoints_without_ttl(clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    for path in ('/a', '/b', '/c'):
+        responses.get(f'{BASE_URL}{path}', json={'success': True, 'data': 1})
+    response_cache = ResponseCache(ttls={'/a': 60, '/b': 60}, maxsize=1)
+    client = make_client(cache=response_cache)
+
+    for path in ('/a', '/a', '/b', '/a', '/c', '/c'):
+        client._get(path)
+
+    assert len(response_cache) == 1
+    assert _get_count(f'{BASE_URL}/a') == 2
+    assert _get_count(f'{BASE_URL}/c') == 2
+
+
+@pytest.mark.unit
+@responses.activate
+def test_errors_are_not_cached(clock):
+    mock_error_response('get', '/system/languages/options')
+    client = make_client(cache=ResponseCache())
+
+    for _ in range(2):
+        with pytest.raises(TeltonikaApiException):
+            client.system.general.get_languages()
+
+    assert _get_count(LANGUAGES_URL) == 2
+
+
+@pytest.mark.unit
+@responses.activate
+def test_explicit_invalidation_by_prefix_and_device(clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(LANGUAGES_URL, json=LANGUAGES_RESPONSE)
+    response_cache = ResponseCache()
+    client = make_client(cache=response_cache)
+    client.system.general.get_languages()
+
+    response_cache.invalidate('/modems')
+    response_cache.invalidate(
+        client=make_client(cache=response_cache, port=8443)
+    )
+    assert len(response_cache) == 1
+
+    response_cache.invalidate('/system', client)
+    assert len(response_cache) == 0
@@ -0,0 +1,180 @@
+"""Unit tests for coalescing identical concurrent GETs."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+import responses
+
+from ponika import PonikaClient
+from ponika.aio import AsyncPonikaClient
+from ponika.stats import StatsCollector
+from tests.mocks import BASE_URL, ERROR_NOT_FOUND, LOGIN_RESPONSE
+from tests.test_modems import ONLINE_STATUS
+
+CALLERS = 8
+STATUS_URL = f'{BASE_URL}/internet_connection/status'
+STATUS_RESPONSE = {
+    'success': True,
+    'data': {'ipv4_status': 'up', 'ipv6_status': 'down', 'dns_status': 'up'},
+}
+
+
+def _run_concurrently(
+    client: PonikaClient,
+    body: dict,
+    get: Callable[[], Any] | None = None,
+    url: str = STATUS_URL,
+) -> list:
+    """Call the status endpoint, or ``get`` of ``url``, from many threads."""
+    get = get or client.internet_connection.get_status
+
+    def slow(request):
+        time.sleep(0.1)
+        return 200, {}, json.dumps(body)
+
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.add_callback(responses.GET, url, callback=slow)
+    client._get_auth_token()
+    start = threading.Barrier(CALLERS)
+
+    def call():
+        start.wait()
+        return get()
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        futures = [executor.submit(call) for _ in range(CALLERS)]
+        return [future.result() for future in futures]
+
+
+def _get_count() -> int:
+    return sum(call.request.method == 'GET' for call in responses.calls)
+
+
+@pytest.mark.unit
+@responses.activate
+def test_concurrent_identical_gets_share_one_request():
+    stats = StatsCollector()
+    client = PonikaClient('test-device', 'admin', 'admin', stats=stats)
+
+    results = _run_concurrently(client, STATUS_RESPONSE)
+
+    assert _get_count() == 1
+    assert all(result is results[0] for result in results)
+    snapshot = stats.snapshot()['/internet_connection/status']
+    assert snapshot['calls'] == 1
+    assert snapshot['coalesced'] == CALLERS - 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_coalescing_can_be_disabled():
+    client = PonikaClient('test-device', 'admin', 'admin', coalesce_gets=False)
+
+    results = _run_concurrently(client, STATUS_RESPONSE)
+
+    assert _get_count() == CALLERS
+    assert len({id(result) for result in results}) == CALLERS
+
+
+@pytest.mark.unit
+@responses.activate
+def test_coalesced_callers_get_lists_of_their_own():
+    client = PonikaClient('test-device', 'admin', 'admin')
+
+    results = _run_concurrently(
+        client,
+        {'success': True, 'data': [{'id': 'wg0'}, {'id': 'wg1'}]},
+        client.wireguard.config.get_config,
+        f'{BASE_URL}/wireguard/config',
+    )
+    results[0].sort(key=lambda item: item.id, reverse=True)
+
+    assert _get_count() == 1
+    assert len({id(result) for result in results}) == CALLERS
+    assert [item.id for item in results[1]] == ['wg0', 'wg1']
+    # The frozen models themselves are shared.
+    assert results[1][0] is results[2][0]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_raw_results_are_not_shared_between_callers():
+    client = PonikaClient('test-device', 'admin', 'admin')
+
+    results = _run_concurrently(
+        client,
+        STATUS_RESPONSE,
+        lambda: client._get_response(
+            '/internet_connection/status', dict, parse_mode='raw'
+        ),
+    )
+
+    assert _get_count() == 1
+    assert all(result.data == STATUS_RESPONSE['data'] for result in results)
+    assert len({id(result.data) for result in results}) == CALLERS
+
+
+@pytest.mark.unit
+@responses.activate
+def test_raw_modem_statuses_are_not_shared_between_callers():
+    client = PonikaClient('test-device', 'admin', 'admin')
+
+    results = _run_concurrently(
+        client,
+        {'success': True, 'data': [ONLINE_STATUS]},
+        lambda: client.modems.status.get_status(parse_mode='raw'),
+        f'{BASE_URL}/modems/status',
+    )
+
+    assert _get_count() == 1
+    assert all(result == [ONLINE_STATUS] for result in results)
+    assert len({id(result[0]) for result in results}) == CALLERS
+
+
+@pytest.mark.unit
+@responses.activate
+def test_error_responses_are_shared_with_waiting_callers():
+    client = PonikaClient('test-device', 'admin', 'admin')
+
+    results = _run_concurrently(client, ERROR_NOT_FOUND)
+
+    assert _get_count() == 1
+    assert results[0].success is False
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.unit
+def test_async_tasks_share_one_request():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == '/api/login':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=STATUS_RESPONSE)
+
+    client = AsyncPonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run():
+        async with client:
+            return await asyncio.gather(
+                *(client.internet_connection.get_status() for _ in range(4))
+            )
+
+    results = asyncio.run(run())
+
+    assert calls.count('/api/internet_connection/status') == 1
+    assert all(result is results[0] for result in results)
@@ -1,6 +1,8 @@
 """Unit tests for declarative config reconciliation."""
 
 import json
+import threading
+import time
 
 import pytest
 import responses
@@ -9,6 +11,7 @@ from ponika.config import (
     AutoRebootConfig,
     ConfigAction,
     ConfigApplier,
+    ConfigPlan,
     DhcpConfig,
     IpRoutesConfig,
     OpenvpnConfig,
@@ -19,10 +22,15 @@ from ponika.config import (
     WirelessConfig,
     ZerotierConfig,
 )
+from ponika.endpoints.dhcp.static_leases_ipv4 import (
+    StaticLeaseIpv4CreatePayload,
+)
 from ponika.endpoints.recipients.email_users import EmailUserCreatePayload
 from ponika.endpoints.recipients.phone_groups import PhoneGroupCreatePayload
 from ponika.endpoints.users import UserDefinition
-from tests.mocks import mock_endpoint
+from ponika.endpoints.wireguard.config import WireguardConfigCreatePayload
+from ponika.endpoints.wireguard.peers import WireguardPeerCreateItemPayload
+from tests.mocks import BASE_URL, ERROR_NOT_FOUND, mock_endpoint
 
 
 def _request_json_body(call_index: int) -> dict:
@@ -226,6 +234,350 @@ def test_config_as_code_dry_run_previews_without_writing(mock_client):
     }
 
 
+@pytest.mark.unit
+@responses.activate
+def test_config_as_code_sends_bulk_updates_and_deletes(mock_client):
+    leases = [
+        {'id': f'lease{i}', 'name': f'host{i}', 'ip': f'192.168.1.{i}'}
+        for i in range(5)
+    ]
+    mock_endpoint(
+        'get',
+        '/dhcp/static_leases/ipv4/config',
+        {'success': True, 'data': leases},
+    )
+    mock_endpoint(
+        'put',
+        '/dhcp/static_leases/ipv4/config',
+        {'success': True, 'data': leases[:2]},
+        include_login=False,
+    )
+    mock_endpoint(
+        'post',
+        '/dhcp/static_leases/ipv4/config',
+        {'success': True, 'data': {'id': 'lease9', 'name': 'host9'}},
+        include_login=False,
+    )
+    mock_endpoint(
+        'delete',
+        '/dhcp/static_leases/ipv4/config',
+        {'success': True, 'data': [{'id': 'lease3'}, {'id': 'lease4'}]},
+        include_login=False,
+    )
+
+    result = ConfigApplier(mock_client, bulk_size=2).apply(
+        PonikaConfig(
+            dhcp=DhcpConfig(
+                static_leases_ipv4=[
+                    StaticLeaseIpv4CreatePayload(
+                        name=f'host{i}', ip=f'10.0.0.{i}'
+                    )
+                    for i in (0, 1, 2, 9)
+                ]
+            )
+        )
+    )
+
+    assert len(result.updated) == 3
+    assert len(result.deleted) == 2
+    assert [
+        (call.request.method, call.request.url.rsplit('/api', 1)[1])
+        for call in responses.calls[2:]
+    ] == [
+        ('PUT', '/dhcp/static_leases/ipv4/config'),
+        ('PUT', '/dhcp/static_leases/ipv4/config'),
+        ('POST', '/dhcp/static_leases/ipv4/config'),
+        ('DELETE', '/dhcp/static_leases/ipv4/config'),
+    ]
+    assert [item['id'] for item in _request_json_body(2)['data']] == [
+        'lease0',
+        'lease1',
+    ]
+    assert _request_json_body(3)['data'] == [
+        {'id': 'lease2', 'name': 'host2', 'ip': '10.0.0.2'}
+    ]
+    assert _request_json_body(5)['data'] == ['lease3', 'lease4']
+
+
+@pytest.mark.unit
+@responses.activate
+def test_config_as_code_reads_all_sections_before_writing(mock_client):
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def slow_read(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return 200, {}, json.dumps({'success': True, 'data': []})
+
+    mock_endpoint(
+        'post',
+        '/recipients/phone_groups/config',
+        {'success': True, 'data': {'id': '1', 'name': 'Ops'}},
+    )
+    for path in (
+        '/recipients/phone_groups/config',
+        '/recipients/email_users/config',
+        '/sms_utilities/rules/config',
+    ):
+        responses.add_callback(
+            responses.GET, f'https://test-device:443/api{path}', slow_read
+        )
+
+    mock_client.config.apply(
+        {
+            'recipients': {
+                'phone_groups': [PhoneGroupCreatePayload(name='Ops')],
+                'email_users': [],
+            },
+            'sms_utilities': {'rules': []},
+        }
+    )
+
+    assert peak == 3
+    assert [call.request.method for call in responses.calls] == [
+        'POST',
+        'GET',
+        'GET',
+        'GET',
+        'POST',
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_config_as_code_writes_dependent_sections_after_parents(mock_client):
+    events = []
+    peer_reads = 0
+
+    def write(name, data):
+        def callback(request):
+            events.append(f'{name} start')
+            time.sleep(0.05)
+            events.append(f'{name} end')
+            return 200, {}, json.dumps({'success': True, 'data': data})
+
+        return callback
+
+    def read_peers(request):
+        nonlocal peer_reads
+        peer_reads += 1
+        # The interface does not exist before wireguard.config is written.
+        if peer_reads == 1:
+            return 404, {}, json.dumps(ERROR_NOT_FOUND)
+        return 200, {}, json.dumps({'success': True, 'data': []})
+
+    mock_endpoint('get', '/wireguard/config', {'success': True, 'data': []})
+    mock_endpoint(
+        'get',
+        '/recipients/phone_groups/config',
+        {'success': True, 'data': []},
+        include_login=False,
+    )
+    for method, path, callback in (
+        ('GET', '/wireguard/wg1/peers/config', read_peers),
+        ('POST', '/wireguard/config', write('interface', {'id': 'wg1'})),
+        (
+            'POST',
+            '/wireguard/wg1/peers/config',
+            write('peer', {'id': 'peer1'}),
+        ),
+        (
+            'POST',
+            '/recipients/phone_groups/config',
+            write('group', {'id': '1', 'name': 'Ops'}),
+        ),
+    ):
+        responses.add_callback(method, f'{BASE_URL}{path}', callback)
+
+    result = mock_client.config.apply(
+        {
+            'wireguard': {
+                'config': [WireguardConfigCreatePayload(id='wg1')],
+                'peers': [
+                    {
+                        'interface_id': 'wg1',
+                        'items': [WireguardPeerCreateItemPayload(id='peer1')],
+                    }
+                ],
+            },
+            'recipients': {
+                'phone_groups': [PhoneGroupCreatePayload(name='Ops')]
+            },
+        }
+    )
+
+    assert [change.section for change in result.created] == [
+        'wireguard.config',
+        'wireguard.peers',
+        'recipients.phone_groups',
+    ]
+    assert peer_reads == 2
+    # The independent group is written alongside the interface; the peer
+    # only once the interface exists.
+    assert events.index('group start') < events.index('interface end')
+    assert events.index('interface end') < events.index('peer start')
+
+
+@pytest.mark.unit
+def test_config_as_code_rejects_dependency_cycles(mock_client):
+    applier = ConfigApplier(
+        mock_client,
+        dependencies={
+            'recipients.phone_groups': ('recipients.email_users',),
+            'recipients.email_users': ('recipients.phone_groups',),
+        },
+    )
+
+    with pytest.raises(ValueError, match='cycle'):
+        applier.apply({'recipients': {'phone_groups': [], 'email_users': []}})
+
+
+@pytest.mark.unit
+@responses.activate
+def test_config_as_code_rejects_unknown_sections_before_reading(mock_client):
+    with pytest.raises(ValueError, match='Unknown config section'):
+        mock_client.config.apply(
+            {
+                'recipients': {
+                    'phone_groups': [PhoneGroupCreatePayload(name='Ops')],
+                    'missing': [],
+                }
+            }
+        )
+
+    assert len(responses.calls) == 0
+
+
+@pytest.mark.unit
+@responses.activate
+def test_config_as_code_applies_serialized_plan_without_reading(mock_client):
+    mock_endpoint(
+        'get',
+        '/recipients/phone_groups/config',
+        {
+            'success': True,
+            'data': [
+                {'id': 'keep', 'name': 'Admins', 'tel': ['+49170000000']},
+                {'id': 'remove', 'name': 'Old', 'tel': ['+49179999999']},
+            ],
+        },
+    )
+    mock_endpoint(
+        'put',
+        '/recipients/phone_groups/config/keep',
+        {'success': True, 'data': {'id': 'keep', 'name': 'Admins'}},
+        include_login=False,
+    )
+    mock_endpoint(
+        'post',
+        '/recipients/phone_groups/config',
+        {'success': True, 'data': {'id': 'new', 'name': 'Ops'}},
+        include_login=False,
+    )
+    mock_endpoint(
+        'delete',
+        '/recipients/phone_groups/config/remove',
+        {'success': True, 'data': {'id': 'remove'}},
+        include_login=False,
+    )
+    applier = ConfigApplier(mock_client)
+
+    plan = applier.plan(
+        {
+            'recipients': {
+                'phone_groups': [
+                    PhoneGroupCreatePayload(
+                        name='Admins', tel=['+49170123456']
+                    ),
+                    PhoneGroupCreatePayload(name='Ops', tel=['+49170222222']),
+                ]
+            }
+        }
+    )
+    restored = ConfigPlan.from_json(json.dumps(json.loads(plan.to_json())))
+    result = applier.apply_plan(restored)
+
+    assert restored == plan
+    assert [change.action for change in result.changes] == [
+        ConfigAction.UPDATE,
+        ConfigAction.CREATE,
+        ConfigAction.DELETE,
+    ]
+    assert [call.request.method for call in responses.calls] == [
+        'POST',
+        'GET',
+        'PUT',
+        'POST',
+        'DELETE',
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_config_as_code_replans_sections_changed_since_planning(mock_client):
+    mock_endpoint(
+        'get',
+        '/recipients/phone_groups/config',
+        {
+            'success': True,
+            'data': [{'id': 'keep', 'name': 'Admins', 'tel': ['+4917000']}],
+        },
+    )
+    # The group is deleted on the device before the plan is applied.
+    mock_endpoint(
+        'put',
+        '/recipients/phone_groups/config/keep',
+        ERROR_NOT_FOUND,
+        status=404,
+        include_login=False,
+    )
+    mock_endpoint(
+        'get',
+        '/recipients/phone_groups/config',
+        {'success': True, 'data': []},
+        include_login=False,
+    )
+    mock_endpoint(
+        'post',
+        '/recipients/phone_groups/config',
+        {'success': True, 'data': {'id': 'new', 'name': 'Admins'}},
+        include_login=False,
+    )
+    applier = ConfigApplier(mock_client)
+    plan = applier.plan(
+        {
+            'recipients': {
+                'phone_groups': [
+                    PhoneGroupCreatePayload(name='Admins', tel=['+4917111'])
+                ]
+            }
+        }
+    )
+
+    result = applier.apply_plan(plan.to_dict())
+
+    assert plan.updated[0].match_value == 'Admins'
+    assert [change.action for change in result.changes] == [
+        ConfigAction.CREATE
+    ]
+    assert _request_json_body(4)['data'] == {
+        'name': 'Admins',
+        'tel': ['+4917111'],
+    }
+
+
+@pytest.mark.unit
+def test_config_as_code_rejects_plans_of_other_versions(mock_client):
+    with pytest.raises(ValueError, match='plan version'):
+        ConfigApplier(mock_client).apply_plan({'version': 0, 'sections': []})
+
+
 @pytest.mark.unit
 @responses.activate
 def test_config_as_code_users_match_by_username(mock_client):
@@ -0,0 +1,242 @@
+"""Unit tests for running calls across a fleet of devices."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import responses
+
+from ponika import ClientConfig
+from ponika.aio import AsyncPonikaClient
+from ponika.config import PonikaConfig, RecipientsConfig
+from ponika.endpoints.recipients.phone_groups import PhoneGroupCreatePayload
+from ponika.exceptions import TeltonikaApiException
+from ponika.fleet import Fleet
+from tests.mocks import LOGIN_RESPONSE
+
+
+HOSTS = ['rut-a', 'rut-b', 'rut-c']
+
+WIREGUARD_CONFIG_RESPONSE = {
+    'success': True,
+    'data': [{'id': 'wg0', 'enabled': '1'}],
+}
+
+
+def _configs() -> list[ClientConfig]:
+    return [
+        ClientConfig(host=host, username='admin', password='admin')
+        for host in HOSTS
+    ]
+
+
+def _mock_host(host: str, success: bool = True) -> None:
+    base_url = f'https://{host}:443/api'
+    responses.post(f'{base_url}/login', json=LOGIN_RESPONSE)
+    responses.get(
+        f'{base_url}/wireguard/config',
+        json=(
+            WIREGUARD_CONFIG_RESPONSE
+            if success
+            else {
+                'success': False,
+                'errors': [{'code': 122, 'error': 'Not found'}],
+            }
+        ),
+    )
+
+
+@pytest.mark.unit
+@responses.activate
+def test_fleet_run_collects_results_and_errors():
+    _mock_host('rut-a')
+    _mock_host('rut-b', success=False)
+    _mock_host('rut-c')
+
+    fleet = Fleet(_configs(), max_workers=2)
+    results = {
+        result.host: result
+        for result in fleet.run(lambda c: c.wireguard.config.get_config())
+    }
+
+    assert set(results) == set(HOSTS)
+    assert results['rut-a'].ok
+    assert results['rut-a'].value[0].id == 'wg0'
+    assert not results['rut-b'].ok
+    assert isinstance(results['rut-b'].error, TeltonikaApiException)
+
+
+@pytest.mark.unit
+@responses.activate
+def test_fleet_reuses_clients_between_runs():
+    for host in HOSTS:
+        _mock_host(host)
+
+    fleet = Fleet(_configs())
+    list(fleet.run(lambda c: c.wireguard.config.get_config()))
+    list(fleet.run(lambda c: c.wireguard.config.get_config()))
+
+    logins = [
+        call for call in responses.calls if call.request.url.endswith('/login')
+    ]
+    assert len(logins) == len(HOSTS)
+
+
+@pytest.mark.unit
+def test_fleet_client_options_override_config_fields():
+    fleet = Fleet(_configs(), read_timeout=5, max_attempts=1)
+
+    client = fleet.client(0)
+    async_client = fleet.async_client(0)
+
+    assert client._config.read_timeout == 5
+    assert client._config.max_attempts == 1
+    assert async_client.sync_client._config.read_timeout == 5
+
+
+@pytest.mark.unit
+def test_fleet_arun_limits_concurrency():
+    running = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal running, peak
+        if request.url.path == '/api/login':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if request.url.host == 'rut-b':
+            return httpx.Response(500, text='Internal Server Error')
+        return httpx.Response(200, json=WIREGUARD_CONFIG_RESPONSE)
+
+    fleet = Fleet(_configs(), max_workers=2)
+    transport = httpx.MockTransport(handler)
+    for index, config in enumerate(fleet.configs):
+        fleet._async_clients[index] = AsyncPonikaClient.from_config(
+            config,
+            http_client=httpx.AsyncClient(transport=transport),
+        )
+
+    async def run():
+        results = [
+            result
+            async for result in fleet.arun(
+                lambda c: c.wireguard.config.get_config()
+            )
+        ]
+        await fleet.aclose()
+        return results
+
+    results = {result.host: result for result in asyncio.run(run())}
+
+    assert peak <= 2
+    assert results['rut-a'].value[0].id == 'wg0'
+    assert results['rut-c'].ok
+    assert not results['rut-b'].ok
+
+
+def _phone_groups(*names: str) -> PonikaConfig:
+    return PonikaConfig(
+        recipients=RecipientsConfig(
+            phone_groups=[PhoneGroupCreatePayload(name=name) for name in names]
+        )
+    )
+
+
+def _created_names(result) -> list[str]:
+    return [change.desired['name'] for change in result.value.created]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_fleet_apply_config_streams_results_with_overrides(monkeypatch):
+    for host in HOSTS:
+        base_url = f'https://{host}:443/api'
+        responses.post(f'{base_url}/login', json=LOGIN_RESPONSE)
+        responses.get(
+            f'{base_url}/recipients/phone_groups/config',
+            json={'success': True, 'data': []},
+        )
+        responses.post(
+            f'{base_url}/recipients/phone_groups/config',
+            json={'success': True, 'data': {'id': '1', 'name': 'x'}},
+        )
+    dumps = 0
+    model_dump = PonikaConfig.model_dump
+
+    def counting_dump(self, **kwargs):
+        nonlocal dumps
+        dumps += 1
+        return model_dump(self, **kwargs)
+
+    monkeypatch.setattr(PonikaConfig, 'model_dump', counting_dump)
+    progress = []
+
+    fleet = Fleet(_configs(), max_workers=2)
+    results = {
+        result.host: result
+        for result in fleet.apply_config(
+            _phone_groups('Ops'),
+            overrides={'rut-b': _phone_groups('Ops', 'Night shift')},
+            progress=lambda done, total, result: progress.append(
+                (done, total, result.ok)
+            ),
+        )
+    }
+
+    assert _created_names(results['rut-a']) == ['Ops']
+    assert _created_names(results['rut-b']) == ['Ops', 'Night shift']
+    assert _created_names(results['rut-c']) == ['Ops']
+    assert progress == [(1, 3, True), (2, 3, True), (3, 3, True)]
+    # Once for the config and once for the override, not per device.
+    assert dumps == 2
+
+
+@pytest.mark.unit
+def test_fleet_apply_config_rejects_overrides_of_unknown_hosts():
+    fleet = Fleet(_configs())
+
+    with pytest.raises(ValueError, match='rut-x'):
+        next(fleet.apply_config({}, overrides={'rut-x': {}}))
+
+
+@pytest.mark.unit
+def test_fleet_aapply_config_streams_results():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix('/api')
+        if path == '/login':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        if request.method == 'GET':
+            return httpx.Response(200, json={'success': True, 'data': []})
+        body = json.loads(request.content)['data']
+        return httpx.Response(200, json={'success': True, 'data': body})
+
+    fleet = Fleet(_configs(), max_workers=2)
+    transport = httpx.MockTransport(handler)
+    for index, config in enumerate(fleet.configs):
+        fleet._async_clients[index] = AsyncPonikaClient.from_config(
+            config,
+            http_client=httpx.AsyncClient(transport=transport),
+        )
+    progress = []
+
+    async def run():
+        results = [
+            result
+            async for result in fleet.aapply_config(
+                _phone_groups('Ops'),
+                overrides={'rut-c': {}},
+                dry_run=True,
+                progress=lambda done, total, result: progress.append(done),
+            )
+        ]
+        await fleet.aclose()
+        return results
+
+    results = {result.host: result for result in asyncio.run(run())}
+
+    assert all(_created_names(results[host]) == ['Ops'] for host in HOSTS)
+    assert progress == [1, 2, 3]
@@ -167,6 +167,25 @@ def test_interfaces_get_status_single(mock_client):
     assert result.subdevices[0].ifname == 'eth0'
 
 
+@pytest.mark.unit
+@responses.activate
+def test_interfaces_get_status_projects_fields(mock_client):
+    mock_endpoint('get', '/interfaces/status', INTERFACE_STATUS_RESPONSE)
+
+    result = mock_client.interfaces.get_status(fields=('id', 'is_up'))
+
+    assert result[0].model_dump() == {'id': 'lan', 'is_up': True}
+    assert type(result[0]) is type(
+        mock_client.interfaces.get_status(fields=['is_up', 'id'])[0]
+    )
+
+
+@pytest.mark.unit
+def test_interfaces_get_status_rejects_unknown_fields(mock_client):
+    with pytest.raises(ValueError, match='rssi'):
+        mock_client.interfaces.get_status(fields=('id', 'rssi'))
+
+
 @pytest.mark.unit
 @responses.activate
 def test_interfaces_config_state_dry_run(mock_client):
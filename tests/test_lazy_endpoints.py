@@ -0,0 +1,67 @@
+"""Unit tests for lazily created endpoints and deferred model building."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ponika
+from ponika.endpoints.modems import ModemsEndpoint
+
+
+@pytest.mark.unit
+def test_endpoints_are_created_on_first_access(mock_client):
+    assert 'modems' not in vars(mock_client)
+
+    modems = mock_client.modems
+
+    assert isinstance(modems, ModemsEndpoint)
+    assert mock_client.modems is modems
+    assert modems.status is modems.status
+    assert modems.status._client is mock_client
+
+
+@pytest.mark.unit
+def test_endpoint_classes_remain_importable_from_packages():
+    from ponika.endpoints.wireguard import PeersEndpoint
+
+    assert ponika.ModemsEndpoint is ModemsEndpoint
+    assert PeersEndpoint.__name__ == 'PeersEndpoint'
+    with pytest.raises(AttributeError):
+        ponika.MissingEndpoint
+
+
+@pytest.mark.unit
+def test_import_does_not_load_endpoint_modules():
+    code = (
+        'import sys, ponika\n'
+        "print(sorted(m for m in sys.modules if m.startswith('ponika.')))"
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+
+    assert 'ponika.endpoints.modems' not in output
+    assert 'ponika.config' not in output
+
+
+@pytest.mark.unit
+def test_warm_up_builds_deferred_models():
+    code = (
+        'from ponika import PonikaClient\n'
+        'from ponika.endpoints.wireguard import peers\n'
+        'from ponika.endpoints.modems import status\n'
+        'models = (\n'
+        '    peers.WireguardPeerConfigResponse,\n'
+        '    peers.WireguardPeerCreateItemPayload,\n'
+        ')\n'
+        'print([m.__pydantic_complete__ for m in models])\n'
+        "PonikaClient('h', 'u', 'p').warm_up('wireguard.peers')\n"
+        'print([m.__pydantic_complete__ for m in models])\n'
+        'print(status.ModemOnlineStatus.__pydantic_complete__)\n'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+
+    assert output.split('\n')[:3] == [
+        '[False, False]',
+        '[True, True]',
+        'False',
+    ]
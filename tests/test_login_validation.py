@@ -1,11 +1,17 @@
 """Unit tests demonstrating login parameter validation."""
 
+import json
+import threading
+import time
+
 import pytest
 import responses
 from ponika import PonikaClient
 
 from ponika.exceptions import TeltonikaLoginException
 from tests.mocks import (
+    BASE_URL,
+    LOGIN_RESPONSE,
     mock_endpoint,
     mock_login_with_validation,
 )
@@ -222,3 +228,63 @@ def test_custom_parameter_validation():
     assert not result_invalid.success
     assert result_invalid.errors[0].code == 400
     assert 'enabled' in result_invalid.errors[0].error
+
+
+@pytest.mark.unit
+@responses.activate
+def test_concurrent_callers_share_one_login(mock_client):
+    """Test that an expired token is refreshed by exactly one thread."""
+
+    def slow_login(request):
+        time.sleep(0.05)
+        return (200, {}, json.dumps(LOGIN_RESPONSE))
+
+    responses.add_callback(
+        responses.POST, f'{BASE_URL}/login', callback=slow_login
+    )
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    barrier = threading.Barrier(16)
+
+    def call():
+        barrier.wait()
+        mock_client._get('/test')
+
+    threads = [threading.Thread(target=call) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    logins = [
+        call for call in responses.calls if call.request.url.endswith('/login')
+    ]
+    assert len(logins) == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_token_is_refreshed_ahead_of_expiry():
+    """Test that the token is renewed once it is within the refresh skew."""
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    client = PonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        token_refresh_skew=60,
+    )
+    client._get('/test')
+
+    assert client.auth.refresh_at == client.auth.expires_at - 60
+
+    client.auth = client.auth.model_copy(
+        update={'refresh_at': int(time.time()) - 1}
+    )
+    client._get('/test')
+
+    logins = [
+        call for call in responses.calls if call.request.url.endswith('/login')
+    ]
+    assert len(logins) == 2
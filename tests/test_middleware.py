@@ -0,0 +1,163 @@
+"""Unit tests for the request pipeline and its middlewares."""
+
+import pytest
+import requests
+import responses
+
+from ponika.middleware import (
+    AuthMiddleware,
+    RetryMiddleware,
+    StatsMiddleware,
+    TimingMiddleware,
+)
+from ponika.exceptions import TeltonikaApiException
+from tests.mocks import BASE_URL, ERROR_UNAUTHORIZED, LOGIN_RESPONSE
+
+WIREGUARD_CONFIG_RESPONSE = {
+    'success': True,
+    'data': [{'id': 'wg0', 'enabled': '1'}],
+}
+
+
+@pytest.mark.unit
+def test_default_pipeline(mock_client):
+    assert [type(m) for m in mock_client.middleware] == [
+        TimingMiddleware,
+        StatsMiddleware,
+        RetryMiddleware,
+        AuthMiddleware,
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_custom_middleware_runs_before_auth(mock_client):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(
+        f'{BASE_URL}/wireguard/config', json=WIREGUARD_CONFIG_RESPONSE
+    )
+    seen = []
+
+    def record(request, call_next):
+        seen.append((request.method, request.endpoint, dict(request.headers)))
+        response = call_next(request)
+        seen.append(response.status_code)
+        return response
+
+    mock_client.add_middleware(record)
+    mock_client.wireguard.config.get_config()
+
+    assert mock_client.middleware[3] is record
+    # The login runs through the pipeline while the GET waits for a token.
+    assert seen == [
+        ('GET', '/wireguard/config', {}),
+        ('POST', '/login', {}),
+        200,
+        200,
+    ]
+    assert (
+        responses.calls[-1].request.headers['Authorization']
+        == 'Bearer test-token-123'
+    )
+
+
+@pytest.mark.unit
+@responses.activate
+def test_retry_middleware_retries_idempotent_requests(mock_client):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(
+        f'{BASE_URL}/wireguard/config',
+        body=requests.ConnectionError('connection reset'),
+    )
+    responses.get(
+        f'{BASE_URL}/wireguard/config', json=WIREGUARD_CONFIG_RESPONSE
+    )
+    mock_client.add_middleware(RetryMiddleware(max_attempts=2, backoff=0))
+
+    result = mock_client.wireguard.config.get_config()
+
+    assert result[0].id == 'wg0'
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.unit
+@responses.activate
+def test_retry_middleware_does_not_retry_post(mock_client):
+    responses.post(
+        f'{BASE_URL}/login', body=requests.ConnectionError('connection reset')
+    )
+    mock_client.add_middleware(RetryMiddleware(max_attempts=3))
+
+    with pytest.raises(requests.ConnectionError):
+        mock_client.login(username='admin', password='admin')
+
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_client_retries_gateway_errors_with_backoff(mock_client):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/wireguard/config', status=503)
+    responses.get(f'{BASE_URL}/wireguard/config', status=503)
+    responses.get(
+        f'{BASE_URL}/wireguard/config', json=WIREGUARD_CONFIG_RESPONSE
+    )
+    delays = []
+    mock_client._sleep = delays.append
+
+    result = mock_client.wireguard.config.get_config()
+
+    assert result[0].id == 'wg0'
+    assert len(responses.calls) == 4
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 0.5
+    assert 0 <= delays[1] <= 1.0
+
+
+@pytest.mark.unit
+def test_retry_backoff_is_capped():
+    retry = RetryMiddleware(backoff=1, max_backoff=4)
+
+    assert all(retry.delay(10) <= 4 for _ in range(100))
+
+
+@pytest.mark.unit
+@responses.activate
+def test_rejected_token_triggers_one_login(mock_client):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.post(
+        f'{BASE_URL}/wireguard/config',
+        status=401,
+        json=ERROR_UNAUTHORIZED,
+    )
+    responses.post(
+        f'{BASE_URL}/wireguard/config',
+        json={'success': True, 'data': {'id': 'wg1'}},
+    )
+
+    response = mock_client._post_raw('/wireguard/config', {})
+
+    assert response.status_code == 200
+    assert [call.request.url.split('/api')[1] for call in responses.calls] == [
+        '/login',
+        '/wireguard/config',
+        '/login',
+        '/wireguard/config',
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_rejected_token_is_not_renewed_twice(mock_client):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(
+        f'{BASE_URL}/wireguard/config',
+        status=401,
+        json=ERROR_UNAUTHORIZED,
+    )
+
+    with pytest.raises(TeltonikaApiException):
+        mock_client.wireguard.config.get_config()
+
+    assert len(responses.calls) == 4
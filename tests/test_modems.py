@@ -29,11 +29,14 @@ from ponika.endpoints.modems.sim_cards import (
     SimCardUpdatePayload,
 )
 from ponika.endpoints.modems.status import (
+    ModemCountryStatus,
     ModemOfflineStatus,
     ModemOnlineStatus,
+    ModemStatus,
     ModemStatusError,
 )
 from ponika.exceptions import TeltonikaApiException
+from ponika.models import response_adapter, type_adapter
 from tests.mocks import mock_endpoint, mock_error_response
 
 
@@ -289,6 +292,24 @@ def test_invalid_online_status_does_not_fall_back_to_offline(mock_client):
         mock_client.modems.status.get_status()
 
 
+@pytest.mark.unit
+@responses.activate
+def test_modem_status_projects_fields(mock_client):
+    invalid_cell_info = {**REAL_ONLINE_STATUS, 'cell_info': 'N/A'}
+    mock_endpoint(
+        'get',
+        '/modems/status',
+        {'success': True, 'data': [invalid_cell_info, OFFLINE_STATUS]},
+    )
+
+    online, offline = mock_client.modems.status.get_status(
+        fields=('rssi', 'state', 'offline')
+    )
+
+    assert online.model_dump() == {'rssi': -48, 'state': 'Connected'}
+    assert offline.model_dump() == {'offline': True}
+
+
 @pytest.mark.unit
 @responses.activate
 def test_modem_apns_list_includes_per_modem_error(mock_client):
@@ -646,3 +667,12 @@ def test_modem_api_error_raises(mock_client):
 
     with pytest.raises(TeltonikaApiException):
         mock_client.modems.status.get_status()
+
+
+@pytest.mark.unit
+def test_response_adapters_are_cached_per_shape():
+    single = response_adapter(ModemCountryStatus)
+
+    assert response_adapter(ModemCountryStatus) is single
+    assert response_adapter(list[ModemCountryStatus]) is not single
+    assert type_adapter(ModemStatus) is type_adapter(ModemStatus)
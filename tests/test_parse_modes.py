@@ -0,0 +1,62 @@
+"""Unit tests for the raw parse mode."""
+
+import pytest
+import responses
+
+from ponika import PonikaClient
+from ponika.endpoints.dhcp.servers_ipv4 import DynamicLease
+from ponika.exceptions import TeltonikaApiException
+from ponika.parsing import ParseMode
+from tests.mocks import mock_endpoint, mock_error_response
+
+LEASE = {
+    'expires': 3600,
+    'macaddr': '00:11:22:33:44:55',
+    'ipaddr': '192.168.1.10',
+    'hostname': 'laptop',
+    'interface': 'lan',
+}
+
+
+@pytest.mark.unit
+@responses.activate
+def test_raw_returns_decoded_json(mock_client):
+    mock_endpoint(
+        'get', '/dhcp/leases/ipv4/status', {'success': True, 'data': [LEASE]}
+    )
+
+    leases = mock_client.dhcp.server_ipv4.get_dynamic_leases(
+        parse_mode=ParseMode.RAW
+    )
+
+    assert leases == [LEASE]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_client_default_can_be_overridden_per_call():
+    client = PonikaClient(
+        'test-device', 'admin', 'admin', parse_mode=ParseMode.RAW
+    )
+    mock_endpoint(
+        'get', '/dhcp/leases/ipv4/status', {'success': True, 'data': [LEASE]}
+    )
+
+    raw = client.dhcp.server_ipv4.get_dynamic_leases()
+    validated = client.dhcp.server_ipv4.get_dynamic_leases(
+        parse_mode='validate'
+    )
+
+    assert raw == [LEASE]
+    assert isinstance(validated[0], DynamicLease)
+    assert validated[0].model_dump() == LEASE
+
+
+@pytest.mark.unit
+@responses.activate
+def test_errors_are_raised_in_every_parse_mode(mock_client):
+    mock_error_response('get', '/system/device/status')
+
+    for mode in ParseMode:
+        with pytest.raises(TeltonikaApiException):
+            mock_client.system.device.get_status(parse_mode=mode)
@@ -0,0 +1,103 @@
+"""Unit tests for connection pool options and the shared pool."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from ponika.aio import AsyncPonikaClient
+from ponika.pool import SharedPool
+from tests.mocks import BASE_URL, LOGIN_RESPONSE, make_client
+
+
+@pytest.mark.unit
+def test_session_adapter_uses_pool_options():
+    client = make_client(
+        pool_connections=2, pool_maxsize=32, pool_block=True, max_retries=2
+    )
+
+    adapter = client._request.get_adapter(BASE_URL)
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 2
+    assert client._request.get_adapter('http://test-device') is adapter
+
+
+@pytest.mark.unit
+@responses.activate
+def test_keep_alive_can_be_disabled():
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    make_client(keep_alive=False)._get('/test')
+
+    assert all(
+        call.request.headers['Connection'] == 'close'
+        for call in responses.calls
+    )
+
+
+@pytest.mark.unit
+def test_shared_pool_survives_closing_a_client():
+    pool = SharedPool(max_connections=4)
+    first, second = make_client(pool=pool), make_client(pool=pool)
+    manager = pool.adapter.poolmanager
+    manager.connection_from_url(BASE_URL)
+
+    first.close()
+
+    assert second._request.get_adapter(BASE_URL) is pool.adapter
+    assert len(manager.pools) == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_shared_pool_caps_requests_in_flight():
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def slow(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return 200, {}, '{"success": true, "data": {}}'
+
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.add_callback(responses.GET, f'{BASE_URL}/test', callback=slow)
+    pool = SharedPool(max_connections=2)
+    clients = [make_client(pool=pool) for _ in range(8)]
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda client: client._get('/test'), clients))
+
+    assert peak == 2
+
+
+@pytest.mark.unit
+def test_async_clients_share_the_http_client_of_a_pool():
+    pool = SharedPool(max_connections=3)
+    first = AsyncPonikaClient('test-device', 'admin', 'admin', pool=pool)
+    second = AsyncPonikaClient('other-device', 'admin', 'admin', pool=pool)
+
+    http_client = first._http_client
+
+    assert second._http_client is http_client
+    assert http_client._transport._pool._max_connections == 3
+
+    async def close():
+        await first.aclose()
+        assert not http_client.is_closed
+        await pool.aclose()
+
+    asyncio.run(close())
+
+    assert http_client.is_closed
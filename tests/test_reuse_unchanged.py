@@ -0,0 +1,96 @@
+"""Unit tests for reusing results of unchanged response bodies."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+import ponika
+from ponika import PonikaClient
+from ponika.stats import StatsCollector
+from tests.mocks import BASE_URL, LOGIN_RESPONSE
+from tests.test_modems import ONLINE_STATUS
+
+STATUS_URL = f'{BASE_URL}/interfaces/status'
+
+
+def _status(rx_bytes: int) -> dict:
+    return {'success': True, 'data': [{'id': 'lan', 'rx_bytes': rx_bytes}]}
+
+
+@pytest.mark.unit
+@responses.activate
+def test_unchanged_body_returns_the_previous_result():
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    for rx_bytes in (1, 1, 2):
+        responses.get(STATUS_URL, json=_status(rx_bytes))
+    stats = StatsCollector()
+    client = PonikaClient(
+        'test-device', 'admin', 'admin', reuse_unchanged=True, stats=stats
+    )
+
+    first = client.interfaces.get_status()
+    second = client.interfaces.get_status()
+    third = client.interfaces.get_status()
+
+    assert second is first
+    assert third is not first
+    assert third[0].rx_bytes == 2
+    snapshot = stats.snapshot()['/interfaces/status']
+    assert snapshot['unchanged'] == 1
+    assert snapshot['unchanged_rate'] == pytest.approx(1 / 3)
+
+
+@pytest.mark.unit
+@responses.activate
+def test_bodies_are_parsed_every_time_by_default():
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(STATUS_URL, json=_status(1))
+    client = PonikaClient('test-device', 'admin', 'admin')
+
+    assert client.interfaces.get_status() is not client.interfaces.get_status()
+
+
+@pytest.mark.unit
+@responses.activate
+def test_unchanged_modem_status_is_not_parsed_again():
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(
+        f'{BASE_URL}/modems/status',
+        json={'success': True, 'data': [ONLINE_STATUS]},
+    )
+    client = PonikaClient(
+        'test-device', 'admin', 'admin', reuse_unchanged=True
+    )
+
+    first = client.modems.status.get_status()
+
+    assert client.modems.status.get_status() is first
+    assert client.modems.status.get_status(fields=('id',)) is not first
+
+
+@pytest.mark.unit
+@responses.activate
+def test_remembered_calls_are_bounded_across_threads(monkeypatch):
+    monkeypatch.setattr(ponika, '_MAX_UNCHANGED', 4)
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(STATUS_URL, json=_status(1))
+    client = PonikaClient(
+        'test-device',
+        'admin',
+        'admin',
+        reuse_unchanged=True,
+        coalesce_gets=False,
+    )
+    client._get_auth_token()
+
+    def poll(worker: int) -> None:
+        for call in range(50):
+            client._get_response(
+                '/interfaces/status', list, params={'n': worker * 100 + call}
+            )
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(poll, range(8)))
+
+    assert len(client._unchanged) == 4
@@ -0,0 +1,126 @@
+"""Unit tests for per-endpoint request statistics."""
+
+import pytest
+import responses
+from pydantic import ValidationError
+
+from ponika.exceptions import TeltonikaApiException
+from ponika.stats import StatsCollector
+from tests.mocks import (
+    BASE_URL,
+    LOGIN_RESPONSE,
+    make_client,
+    mock_error_response,
+)
+
+
+def _mock_global_config(modem_id: str) -> None:
+    responses.get(
+        f'{BASE_URL}/modems/{modem_id}/global',
+        json={'success': True, 'data': {'modem': modem_id}},
+    )
+
+
+@pytest.mark.unit
+@responses.activate
+def test_stats_are_grouped_by_path_template():
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    _mock_global_config('1-1')
+    _mock_global_config('2-1')
+    stats = StatsCollector()
+    client = make_client(stats=stats)
+
+    client.modems.global_config.get('1-1')
+    client.modems.global_config.get('2-1')
+
+    snapshot = stats.snapshot()
+    assert set(snapshot) == {'/login', '/modems/{modem_id}/global'}
+    modem = snapshot['/modems/{modem_id}/global']
+    assert modem['calls'] == 2
+    assert modem['errors'] == 0
+    assert modem['response_bytes'] == sum(
+        len(call.response.content) for call in responses.calls[1:]
+    )
+    assert modem['network_seconds'] > 0
+    # Validated responses are parsed from bytes as part of validation.
+    assert modem['decode_seconds'] == 0
+    assert modem['validation_seconds'] > 0
+
+
+@pytest.mark.unit
+@responses.activate
+def test_stats_count_api_errors_and_notify_observers():
+    mock_error_response('get', '/wireguard/config', error_code=122)
+    observed = []
+    stats = StatsCollector()
+    stats.add_observer(
+        lambda template, metric, value: observed.append((template, metric))
+    )
+
+    with pytest.raises(TeltonikaApiException):
+        make_client(stats=stats).wireguard.config.get_config()
+
+    assert stats.snapshot()['/wireguard/config']['errors'] == 1
+    assert ('/wireguard/config', 'network_seconds') in observed
+    assert ('/wireguard/config', 'validation_seconds') in observed
+
+
+@pytest.mark.unit
+@responses.activate
+@pytest.mark.parametrize(
+    ('body', 'error'),
+    [
+        (
+            {'success': False, 'errors': [{'code': 122, 'error': 'Missing'}]},
+            TeltonikaApiException,
+        ),
+        ({'detail': 'not an API response'}, ValidationError),
+    ],
+)
+def test_stats_count_failed_http_statuses_once(body, error):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/wireguard/config', status=404, json=body)
+    stats = StatsCollector()
+
+    with pytest.raises(error):
+        make_client(stats=stats).wireguard.config.get_config()
+
+    snapshot = stats.snapshot()['/wireguard/config']
+    assert snapshot['calls'] == 1
+    assert snapshot['errors'] == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_stats_count_a_retried_call_once():
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/modems/1-1/global', status=503)
+    responses.get(f'{BASE_URL}/modems/1-1/global', status=503)
+    _mock_global_config('1-1')
+    stats = StatsCollector()
+    client = make_client(stats=stats)
+    client._sleep = lambda seconds: None
+    observed = []
+    stats.add_observer(
+        lambda template, metric, value: observed.append((template, metric))
+    )
+
+    client.modems.global_config.get('1-1')
+
+    modem = stats.snapshot()['/modems/{modem_id}/global']
+    assert modem['calls'] == 1
+    assert modem['errors'] == 0
+    # Network time is still recorded for every attempt.
+    network = ('/modems/{modem_id}/global', 'network_seconds')
+    assert observed.count(network) == 3
+
+
+@pytest.mark.unit
+@responses.activate
+def test_stats_are_disabled_by_default(mock_client):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    _mock_global_config('1-1')
+
+    mock_client.modems.global_config.get('1-1')
+
+    assert mock_client.stats is None
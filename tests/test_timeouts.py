@@ -0,0 +1,214 @@
+"""Unit tests for request timeouts and deadlines."""
+
+import asyncio
+import json
+from time import time
+
+import httpx
+import pytest
+import requests
+import responses
+
+from ponika.aio import AsyncPonikaClient
+from ponika.exceptions import TeltonikaDeadlineExceeded
+from ponika.models import Token
+from ponika.timeouts import deadline, request_timeout
+from ponika.token_store import MemoryTokenStore, TokenKey
+from tests.mocks import BASE_URL, LOGIN_RESPONSE, make_client
+
+WIREGUARD_CONFIG_RESPONSE = {
+    'success': True,
+    'data': [{'id': 'wg0', 'enabled': '1'}],
+}
+
+FIRMWARE_UPLOAD_RESPONSE = {
+    'success': True,
+    'data': {
+        'valid': '1',
+        'hw_support': '1',
+        'authorized': '1',
+        'passwd_warning': '0',
+        'md5': 'abc',
+        'size': '1',
+        'newer': '1',
+        'sha256': 'def',
+        'allow_backup': '1',
+        'message_code': '0',
+        'fw_version': 'RUT2M_R_00.07.20.0',
+    },
+}
+
+
+def _mock_wireguard_config() -> None:
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(
+        f'{BASE_URL}/wireguard/config', json=WIREGUARD_CONFIG_RESPONSE
+    )
+
+
+def _sent_timeouts() -> list:
+    return [call.request.req_kwargs['timeout'] for call in responses.calls]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_requests_use_client_timeouts():
+    _mock_wireguard_config()
+    client = make_client(connect_timeout=2, read_timeout=5)
+
+    client.wireguard.config.get_config()
+
+    assert _sent_timeouts() == [
+        (2, 5),
+        (2, 5),
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_request_timeout_overrides_client_timeouts(mock_client):
+    _mock_wireguard_config()
+
+    with request_timeout(read=300):
+        with request_timeout(connect=None):
+            mock_client.wireguard.config.get_config()
+
+    assert _sent_timeouts()[-1] == (None, 300)
+
+
+@pytest.mark.unit
+@responses.activate
+def test_deadline_caps_timeouts_of_each_request(mock_client, clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+
+    def slow_upload(request):
+        clock.now += 4
+        return 200, {}, json.dumps(FIRMWARE_UPLOAD_RESPONSE)
+
+    responses.add_callback(
+        responses.POST,
+        f'{BASE_URL}/firmware/actions/upload_device_firmware',
+        callback=slow_upload,
+    )
+    responses.post(
+        f'{BASE_URL}/firmware/actions/verify', json=FIRMWARE_UPLOAD_RESPONSE
+    )
+
+    result = mock_client.firmware.device.upload_and_verify_firmware(
+        __file__, timeout=15
+    )
+
+    assert result.valid == '1'
+    assert _sent_timeouts() == [
+        (10.0, 15),
+        (10.0, 15),
+        (10.0, 11),
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_deadline_fails_fast_once_spent(mock_client, clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+
+    def slow_upload(request):
+        clock.now += 20
+        return 200, {}, json.dumps(FIRMWARE_UPLOAD_RESPONSE)
+
+    responses.add_callback(
+        responses.POST,
+        f'{BASE_URL}/firmware/actions/upload_device_firmware',
+        callback=slow_upload,
+    )
+
+    with pytest.raises(TeltonikaDeadlineExceeded):
+        mock_client.firmware.device.upload_and_verify_firmware(
+            __file__, timeout=15
+        )
+
+    # The verification was never sent.
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.unit
+@responses.activate
+def test_timeout_after_deadline_raises_deadline_exceeded(mock_client, clock):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+
+    def timed_out(request):
+        clock.now += 5
+        raise requests.ReadTimeout('read timed out')
+
+    responses.add_callback(
+        responses.GET, f'{BASE_URL}/wireguard/config', callback=timed_out
+    )
+
+    with deadline(5), pytest.raises(TeltonikaDeadlineExceeded):
+        mock_client.wireguard.config.get_config()
+
+    # Without a deadline the timeout is retried, then raised as is.
+    mock_client._sleep = lambda seconds: None
+    with pytest.raises(requests.ReadTimeout):
+        mock_client.wireguard.config.get_config()
+
+
+@pytest.mark.unit
+@responses.activate
+def test_deadline_while_checking_stored_token_keeps_it(clock):
+    store = MemoryTokenStore()
+    key = TokenKey(host='test-device', port=443, username='admin')
+    store.save(key, Token(token='stored-token', expires_at=int(time()) + 60))
+
+    def timed_out(request):
+        clock.now += 5
+        raise requests.ReadTimeout('read timed out')
+
+    responses.add_callback(
+        responses.GET, f'{BASE_URL}/session/status', callback=timed_out
+    )
+    client = make_client(token_store=store)
+
+    with deadline(5), pytest.raises(TeltonikaDeadlineExceeded):
+        client.wireguard.config.get_config()
+
+    # The token was not dropped and no login was attempted.
+    assert store.load(key).token == 'stored-token'
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_nested_deadline_cannot_extend_budget(mock_client, clock):
+    _mock_wireguard_config()
+
+    with deadline(3), deadline(60):
+        mock_client.wireguard.config.get_config()
+
+    assert _sent_timeouts()[-1] == (3, 3)
+
+
+@pytest.mark.unit
+def test_async_client_passes_timeouts_to_httpx():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions['timeout'])
+        if request.url.path == '/api/login':
+            return httpx.Response(200, json=LOGIN_RESPONSE)
+        return httpx.Response(200, json=WIREGUARD_CONFIG_RESPONSE)
+
+    client = AsyncPonikaClient(
+        host='test-device',
+        username='admin',
+        password='admin',
+        read_timeout=7,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run():
+        with request_timeout(connect=1):
+            return await client.wireguard.config.get_config()
+
+    asyncio.run(run())
+
+    assert seen[-1] == {'connect': 1, 'read': 7, 'write': 7, 'pool': 7}
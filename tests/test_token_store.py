@@ -0,0 +1,145 @@
+"""Unit tests for persistent token storage."""
+
+import json
+import os
+import stat
+import time
+
+import pytest
+import responses
+
+from ponika.models import Token
+from ponika.token_store import FileTokenStore, MemoryTokenStore, TokenKey
+from tests.mocks import BASE_URL, LOGIN_RESPONSE, make_client
+
+KEY = TokenKey(host='test-device', port=443, username='admin')
+
+SESSION_ACTIVE_RESPONSE = {'success': True, 'data': {'active': True}}
+SESSION_INACTIVE_RESPONSE = {
+    'success': False,
+    'errors': [{'code': 401, 'error': 'Unauthorized'}],
+}
+
+
+def _token(expires_in: int = 3600) -> Token:
+    return Token(
+        token='stored-token', expires_at=int(time.time()) + expires_in
+    )
+
+
+def _paths() -> list[str]:
+    return [
+        call.request.url.removeprefix(BASE_URL) for call in responses.calls
+    ]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_new_client_reuses_stored_token():
+    store = MemoryTokenStore()
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/session/status', json=SESSION_ACTIVE_RESPONSE)
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    make_client(token_store=store)._get('/test')
+    make_client(token_store=store)._get('/test')
+
+    assert _paths() == ['/login', '/test', '/session/status', '/test']
+    assert responses.calls[3].request.headers['Authorization'] == (
+        'Bearer test-token-123'
+    )
+
+
+@pytest.mark.unit
+@responses.activate
+def test_stored_token_without_validation():
+    store = MemoryTokenStore()
+    store.save(KEY, _token())
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    make_client(token_store=store, validate_stored_token=False)._get('/test')
+
+    assert _paths() == ['/test']
+    assert responses.calls[0].request.headers['Authorization'] == (
+        'Bearer stored-token'
+    )
+
+
+@pytest.mark.unit
+@responses.activate
+def test_rejected_stored_token_triggers_login():
+    store = MemoryTokenStore()
+    store.save(KEY, _token())
+    responses.get(
+        f'{BASE_URL}/session/status',
+        json=SESSION_INACTIVE_RESPONSE,
+        status=401,
+    )
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    make_client(token_store=store)._get('/test')
+
+    assert _paths() == ['/session/status', '/login', '/test']
+    assert store.load(KEY).token == 'test-token-123'
+
+
+@pytest.mark.unit
+@responses.activate
+def test_stored_token_is_adopted_only_once_checked():
+    store = MemoryTokenStore()
+    store.save(KEY, _token())
+    client = make_client(token_store=store)
+    adopted_during_check = []
+
+    def session_status(request):
+        adopted_during_check.append(client.auth)
+        return 200, {}, json.dumps(SESSION_ACTIVE_RESPONSE)
+
+    responses.add_callback(
+        responses.GET, f'{BASE_URL}/session/status', callback=session_status
+    )
+    responses.get(f'{BASE_URL}/test', json={'success': True, 'data': {}})
+
+    client._get('/test')
+
+    assert adopted_during_check == [None]
+    assert client.auth.token == 'stored-token'
+
+
+@pytest.mark.unit
+def test_memory_store_drops_expired_tokens():
+    store = MemoryTokenStore()
+    store.save(KEY, _token(expires_in=-1))
+
+    assert store.load(KEY) is None
+
+
+@pytest.mark.unit
+def test_file_store_round_trip(tmp_path):
+    store = FileTokenStore(tmp_path)
+    store.save(KEY, _token())
+
+    assert FileTokenStore(tmp_path).load(KEY).token == 'stored-token'
+
+    (path,) = tmp_path.iterdir()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    store.delete(KEY)
+    assert store.load(KEY) is None
+
+
+@pytest.mark.unit
+def test_file_store_ignores_expired_and_corrupt_files(tmp_path):
+    store = FileTokenStore(tmp_path)
+    store.save(KEY, _token(expires_in=-1))
+
+    assert store.load(KEY) is None
+    assert list(tmp_path.iterdir()) == []
+
+    other = TokenKey(host='other', port=443, username='admin')
+    store.save(other, _token())
+    (path,) = tmp_path.iterdir()
+    path.write_text('{not json')
+
+    assert store.load(other) is None
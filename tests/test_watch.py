@@ -0,0 +1,137 @@
+"""Unit tests for watching status calls for changes."""
+
+import asyncio
+
+import pytest
+import requests
+import responses
+
+from ponika import PonikaClient, watch
+from ponika.exceptions import TeltonikaApiException
+from tests.mocks import BASE_URL, LOGIN_RESPONSE
+
+LEASES_URL = f'{BASE_URL}/dhcp/leases/ipv4/status'
+
+
+def _lease(mac: str, ip: str, hostname: str = 'host') -> dict:
+    return {
+        'expires': 3600,
+        'macaddr': mac,
+        'ipaddr': ip,
+        'hostname': hostname,
+        'interface': 'lan',
+    }
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record the waits of watch() instead of sleeping."""
+    waits: list[float] = []
+    monkeypatch.setattr(watch, 'sleep', waits.append)
+    return waits
+
+
+@pytest.mark.unit
+@responses.activate
+def test_watch_yields_keyed_deltas_of_leases(sleeps):
+    responses.post(f'{BASE_URL}/login', json=LOGIN_RESPONSE)
+    polls = [
+        [_lease('aa', '10.0.0.2'), _lease('bb', '10.0.0.3')],
+        [_lease('aa', '10.0.0.2'), _lease('bb', '10.0.0.3')],
+        [_lease('aa', '10.0.0.2', 'renamed'), _lease('cc', '10.0.0.4')],
+    ]
+    for data in polls:
+        responses.get(LEASES_URL, json={'success': True, 'data': data})
+    client = PonikaClient('test-device', 'admin', 'admin')
+
+    deltas = watch.watch(
+        client.dhcp.server_ipv4.get_dynamic_leases, interval=5, jitter=0
+    )
+    initial, update = next(deltas), next(deltas)
+
+    assert set(initial.added) == {'aa', 'bb'}
+    assert not initial.removed and not initial.changed
+    assert set(update.added) == {'cc'}
+    assert set(update.removed) == {'bb'}
+    before, after = update.changed['aa']
+    assert (before.hostname, after.hostname) == ('host', 'renamed')
+    # The unchanged second poll is not yielded.
+    assert sleeps == [5, 5]
+
+
+@pytest.mark.unit
+def test_watch_backs_off_after_failures(sleeps):
+    results = iter(
+        [
+            requests.ConnectionError('down'),
+            TeltonikaApiException('busy'),
+            [{'id': 'lan'}],
+        ]
+    )
+
+    def fetch():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    deltas = watch.watch(
+        fetch, interval=10, jitter=0, backoff=3, max_interval=60
+    )
+
+    assert list(next(deltas).added) == ['lan']
+    assert sleeps == [30, 60]
+
+
+@pytest.mark.unit
+def test_watch_raises_after_max_failures(sleeps):
+    def fetch():
+        raise requests.Timeout('slow')
+
+    with pytest.raises(requests.Timeout):
+        next(watch.watch(fetch, interval=1, max_failures=3))
+    assert len(sleeps) == 2
+
+
+@pytest.mark.unit
+def test_index_uses_explicit_keys_and_rejects_unkeyed_items():
+    items = [{'name': 'a', 'value': 1}, {'name': 'b', 'value': 2}]
+
+    assert set(watch.index(items, key='name')) == {'a', 'b'}
+    assert set(watch.index(items, key=lambda item: item['value'])) == {1, 2}
+    with pytest.raises(ValueError):
+        watch.index(items)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'later', [{'name': 'b'}, {'id': None, 'name': 'b'}, 'b'], ids=repr
+)
+def test_index_rejects_later_items_without_the_key(later):
+    with pytest.raises(ValueError, match='pass key='):
+        watch.index([{'id': 'a', 'name': 'a'}, later])
+
+
+@pytest.mark.unit
+def test_awatch_yields_changes_of_async_calls(monkeypatch):
+    polls = iter([[{'id': 'lan', 'up': True}], [{'id': 'lan', 'up': False}]])
+
+    async def fetch():
+        return next(polls)
+
+    async def no_sleep(seconds: float) -> None:
+        pass
+
+    monkeypatch.setattr(watch.asyncio, 'sleep', no_sleep)
+
+    async def run():
+        deltas = watch.awatch(fetch)
+        return [await anext(deltas), await anext(deltas)]
+
+    initial, update = asyncio.run(run())
+
+    assert list(initial.added) == ['lan']
+    assert update.changed['lan'] == (
+        {'id': 'lan', 'up': True},
+        {'id': 'lan', 'up': False},
+    )
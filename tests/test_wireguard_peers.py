@@ -183,3 +183,24 @@ def test_wireguard_peers_config_api_error_raises(mock_client):
     endpoint = mock_client.wireguard.peers.config('wg0')
     with pytest.raises(TeltonikaApiException):
         endpoint.get_config()
+
+
+@pytest.mark.unit
+def test_peer_payload_serializes_to_wire_format():
+    payload = WireguardPeerUpdateItemPayload(
+        id='peer1',
+        allowed_ips=['10.0.0.2/32'],
+        route_allowed_ips=True,
+        force_tunlink=False,
+    )
+    expected = {
+        'id': 'peer1',
+        'allowed_ips': ['10.0.0.2/32'],
+        'route_allowed_ips': '1',
+        'force_tunlink': '0',
+    }
+
+    assert payload.asdict() == expected
+    assert json.loads(payload.model_dump_json(exclude_none=True)) == expected
+    # Python mode keeps the model's own types.
+    assert payload.model_dump()['route_allowed_ips'] is True